@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Benchmark: status_history.csv vs the binary history log (size and stats scan time).
+
+Usage: python benchmarks/bench_binary_history.py [--rows N]
+"""
+
+import argparse
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import orchestrator  # noqa: E402
+
+
+def _write_history(path: Path, rows: int) -> None:
+    batch = []
+    phases = orchestrator.PHASES
+    for n in range(rows):
+        phase = phases[n % (len(phases) - 1)]
+        owner, reviewer = orchestrator.PHASE_ACTORS[phase]
+        ts = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(1_700_000_000 + n * 30))
+        batch.append([ts, phase, "in_progress", owner, phase, reviewer or owner, "awaiting_review"])
+        if len(batch) == 50000:
+            orchestrator.append_history_rows(path, batch)
+            batch = []
+    orchestrator.append_history_rows(path, batch)
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=500_000)
+    args = parser.parse_args()
+
+    tmp = Path(tempfile.mkdtemp())
+    try:
+        csv_path = tmp / "status_history.csv"
+        bin_path = orchestrator.binary_history_path(csv_path)
+        _write_history(csv_path, args.rows)
+        _, build_s = _timed(lambda: orchestrator.history_csv_to_binary(csv_path, bin_path))
+
+        csv_stats, csv_s = _timed(lambda: orchestrator.compute_history_stats(orchestrator.query_history(csv_path)))
+        bin_stats, bin_s = _timed(
+            lambda: orchestrator.compute_transition_stats(orchestrator.iter_binary_history_events(bin_path))
+        )
+        assert {k: v.to_dict() for k, v in csv_stats.items()} == {k: v.to_dict() for k, v in bin_stats.items()}
+
+        csv_mb, bin_mb = csv_path.stat().st_size / 1e6, bin_path.stat().st_size / 1e6
+        print(f"rows:       {args.rows}")
+        print(f"size:       csv {csv_mb:7.1f} MB   binary {bin_mb:7.1f} MB   ({csv_mb / bin_mb:.1f}x smaller)")
+        print(f"stats scan: csv {csv_s:7.2f} s    binary {bin_s:7.2f} s    ({csv_s / bin_s:.1f}x faster)")
+        print(f"build:      {build_s:.2f} s")
+    finally:
+        shutil.rmtree(tmp)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Benchmark: status_history.csv append cost vs. history size.
+
+Appends are timed against an empty history and against one pre-filled with --rows
+rows (1M by default). The legacy append, which read the whole file to look at the
+header, is timed alongside for comparison. The pre-filled files are fsynced first so
+only the appends are measured.
+
+Usage: python benchmarks/bench_history_append.py [--rows N] [--appends N]
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import orchestrator  # noqa: E402
+
+FROM = {"current_phase": "integration_testing", "phase_status": "awaiting_review", "current_actor": "integration_tester"}
+TO = {"current_phase": "integration_testing", "current_actor": "integration_tester_reviewer", "phase_status": "in_review"}
+
+
+def _legacy_append(history_path: Path) -> None:
+    history_path.read_text(encoding="utf-8").splitlines()[:1]
+    with history_path.open("a", encoding="utf-8") as f:
+        f.write(",".join(orchestrator._history_row(FROM, TO)) + "\n")
+
+
+def _prefill(path: Path, rows: int) -> None:
+    row = ",".join(orchestrator._history_row(FROM, TO)) + "\n"
+    with path.open("w", encoding="utf-8") as f:
+        f.write(",".join(orchestrator.HISTORY_HEADER) + "\n")
+        chunk = row * 10000
+        for _ in range(rows // 10000):
+            f.write(chunk)
+        f.write(row * (rows % 10000))
+        # On disk before timing starts, or the first fsync'ing append pays to write back the prefill.
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def _per_append_us(fn, path: Path, appends: int) -> float:
+    start = time.perf_counter()
+    for _ in range(appends):
+        fn(path)
+    return (time.perf_counter() - start) / appends * 1e6
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--appends", type=int, default=2000)
+    parser.add_argument("--legacy-appends", type=int, default=20)
+    args = parser.parse_args()
+
+    tmp = Path(tempfile.mkdtemp())
+    try:
+        small, large = tmp / "small.csv", tmp / "large.csv"
+        _prefill(small, 0)
+        _prefill(large, args.rows)
+        size_mb = large.stat().st_size / 1e6
+
+        def append(path: Path) -> None:
+            orchestrator.append_history(path, from_status=FROM, to_status=TO)
+
+        def grouped(path: Path) -> None:
+            with orchestrator.HistoryWriter(path, max_rows=64, fsync=True) as writer:
+                for _ in range(args.appends):
+                    writer.append(from_status=FROM, to_status=TO)
+
+        print(f"history sizes: empty vs {args.rows} rows ({size_mb:.0f} MB)")
+        print(f"append_history         : {_per_append_us(append, small, args.appends):9.1f} us  vs "
+              f"{_per_append_us(append, large, args.appends):9.1f} us")
+        print(f"legacy (read_text)     : {_per_append_us(_legacy_append, small, args.legacy_appends):9.1f} us  vs "
+              f"{_per_append_us(_legacy_append, large, args.legacy_appends):9.1f} us")
+        print(f"HistoryWriter + fsync  : {_per_append_us(grouped, small, 1) / args.appends:9.1f} us  vs "
+              f"{_per_append_us(grouped, large, 1) / args.appends:9.1f} us  (per row, 64 rows/flush)")
+    finally:
+        shutil.rmtree(tmp)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Benchmark: question written to status.json -> Telegram message sent.
+
+Runs QuestionPoller.run() against a temporary status.json (suggestions stubbed, the
+send function records the time), lets it go idle, then appends a question through the
+orchestrator's CAS write and measures how long until the question is sent. Compares a
+fixed poll_interval timer, the adaptive schedule (used where inotify is not available)
+and inotify wake-ups, with each mode's poll count and share of polls that found nothing.
+
+Usage: python benchmarks/bench_question_latency.py [--samples N] [--interval S]
+"""
+
+import argparse
+import asyncio
+import itertools
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "steward_ai_zorba_bot"))
+
+import orchestrator  # noqa: E402
+from apps.telegram import question_poller  # noqa: E402
+from services import status_handler  # noqa: E402
+from services.status_store import JsonStatusStore  # noqa: E402
+
+
+async def _latencies(path: Path, mode: str, samples: int, interval: float):
+    orchestrator._atomic_write_json(path, {"client_questions": [], "client_answers": []})
+    status_handler.set_store(JsonStatusStore(path))
+    sent = asyncio.Queue()
+    message_ids = itertools.count(1)
+
+    async def send(_user_id, _text):
+        sent.put_nowait(time.perf_counter())
+        return next(message_ids)
+
+    poller = question_poller.QuestionPoller(send, [1])
+    poller.poll_interval = interval
+    poller.watch_files = mode == "inotify"
+    if mode == "timer":
+        poller.scheduler.min_interval = interval
+    task = asyncio.create_task(poller.run())
+    await asyncio.sleep(0.2)
+    results = []
+    for n in range(samples):
+        await asyncio.sleep(interval * (0.3 + 0.4 * n / max(samples - 1, 1)))  # land at varied timer phases
+
+        def ask(status, n=n):
+            status["client_questions"].append({"id": f"Q-{n}", "question": "?", "delivery_status": "pending"})
+
+        written = time.perf_counter()
+        await asyncio.to_thread(orchestrator.update_status, path, ask)
+        results.append(await asyncio.wait_for(sent.get(), interval * 3) - written)
+    poller.stop()
+    task.cancel()
+    return results, poller.metrics()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--samples", type=int, default=10)
+    parser.add_argument("--interval", type=float, default=10.0, help="poll_interval (timer / safety net)")
+    args = parser.parse_args()
+
+    async def suggestions(text, context):
+        return ["yes", "no", "maybe"]
+
+    question_poller.get_suggestions_async = suggestions
+    tmp = Path(tempfile.mkdtemp())
+    try:
+        print(f"question written -> sent, {args.samples} samples, poll_interval={args.interval}s")
+        for mode in ("timer", "adaptive", "inotify"):
+            latencies, metrics = asyncio.run(_latencies(tmp / f"{mode}.json", mode, args.samples, args.interval))
+            print(
+                f"{mode:8s}: median {statistics.median(latencies) * 1e3:8.1f} ms  "
+                f"max {max(latencies) * 1e3:8.1f} ms  "
+                f"polls {metrics['polls']:4d} ({metrics['wasted_ratio']:4.0%} wasted)"
+            )
+    finally:
+        status_handler.set_store(None)
+        shutil.rmtree(tmp)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
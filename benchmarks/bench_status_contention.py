@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Benchmark: concurrent status.json writers, unversioned vs. compare-and-swap.
+
+--writers processes each increment a counter in status.json --updates times. The
+unversioned writer is the old read / modify / write pattern; the CAS writer goes
+through orchestrator.update_status. Lost updates = expected count - final counter.
+
+Usage: python benchmarks/bench_status_contention.py [--writers N] [--updates N]
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import orchestrator  # noqa: E402
+
+
+def _increment(status):
+    status["counter"] += 1
+
+
+def _unversioned_writer(path: str, updates: int) -> int:
+    status_path = Path(path)
+    tmp_path = status_path.with_name(f"{status_path.name}.{os.getpid()}.tmp")
+    for _ in range(updates):
+        status = orchestrator._load_json(status_path)
+        _increment(status)
+        tmp_path.write_text(json.dumps(status, indent=2) + "\n", encoding="utf-8")
+        tmp_path.replace(status_path)
+    return 0
+
+
+def _cas_writer(path: str, updates: int) -> int:
+    status_path = Path(path)
+    retries = 0
+    for _ in range(updates):
+        attempts = []
+
+        def counted(status):
+            attempts.append(1)
+            _increment(status)
+
+        orchestrator.update_status(status_path, counted, retries=1000)
+        retries += len(attempts) - 1
+    return retries
+
+
+def _run(writer, status_path: Path, writers: int, updates: int):
+    status = {"counter": 0, "padding": ["x" * 64] * 200}  # roughly status.json-sized
+    orchestrator._atomic_write_json(status_path, status)
+    start = time.perf_counter()
+    with multiprocessing.Pool(writers) as pool:
+        retries = sum(pool.starmap(writer, [(str(status_path), updates)] * writers))
+    elapsed = time.perf_counter() - start
+    final = json.loads(status_path.read_text(encoding="utf-8"))["counter"]
+    return elapsed, final, retries
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--writers", type=int, default=8)
+    parser.add_argument("--updates", type=int, default=200)
+    args = parser.parse_args()
+
+    expected = args.writers * args.updates
+    tmp = Path(tempfile.mkdtemp())
+    try:
+        print(f"{args.writers} writers x {args.updates} updates = {expected} expected increments")
+        for name, writer in (("unversioned", _unversioned_writer), ("cas", _cas_writer)):
+            elapsed, final, retries = _run(writer, tmp / f"{name}.json", args.writers, args.updates)
+            print(
+                f"{name:12s}: {final / elapsed:8.0f} committed updates/s  "
+                f"lost={expected - final:5d}  retries={retries}"
+            )
+    finally:
+        shutil.rmtree(tmp)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""Benchmark: small status.json updates, full rewrite vs. patch journal.
+
+Each update flips one question to "delivered" in a document with --questions
+questions (the mark_question_delivered pattern). Reports time and bytes written per
+update, and the cost of a read that has to fold a full journal.
+
+Usage: python benchmarks/bench_status_journal.py [--questions N] [--updates N]
+"""
+
+import argparse
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import orchestrator  # noqa: E402
+
+
+def _document(questions: int):
+    status = {key: {} for key in ("problem", "comms", "client_channel", "changesets", "artifacts", "gates", "timestamps")}
+    status["client_questions"] = [
+        {"id": f"Q-{n}", "question": f"Question {n}?", "context": "x" * 80, "delivery_status": "pending"}
+        for n in range(questions)
+    ]
+    return status
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--questions", type=int, default=2000)
+    parser.add_argument("--updates", type=int, default=500)
+    args = parser.parse_args()
+
+    tmp = Path(tempfile.mkdtemp())
+    try:
+        print(f"{args.updates} single-question updates, document with {args.questions} questions")
+        for name, journal in (("full rewrite", False), ("journal", True)):
+            path = tmp / f"{name.replace(' ', '_')}.json"
+            orchestrator._atomic_write_json(path, _document(args.questions))
+            if journal:
+                orchestrator.enable_status_journal(path)
+            written = 0
+            start = time.perf_counter()
+            for n in range(args.updates):
+                size_before = _written_size(path, journal)
+
+                def deliver(status, n=n):
+                    status["client_questions"][n]["delivery_status"] = "delivered"
+
+                orchestrator.update_status(path, deliver)
+                written += _written_size(path, journal) - (size_before if journal else 0)
+            per_update = (time.perf_counter() - start) / args.updates * 1e6
+            print(f"{name:13s}: {per_update:9.0f} us/update  {written / args.updates:9.0f} bytes written/update")
+            if journal:
+                start = time.perf_counter()
+                orchestrator.read_status_versioned(path)
+                print(f"{'':13s}  read folding {args.updates} entries: {(time.perf_counter() - start) * 1e3:.1f} ms")
+    finally:
+        shutil.rmtree(tmp)
+    return 0
+
+
+def _written_size(path: Path, journal: bool) -> int:
+    """Bytes the last write produced: the whole file, or the journal so far."""
+    return orchestrator.status_journal_path(path).stat().st_size if journal else path.stat().st_size
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
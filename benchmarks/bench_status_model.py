@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Benchmark: memory and load time of a large status document, dicts vs. StatusModel.
+
+Builds a status.json with --questions questions (and one answer for every other
+question) and measures, with tracemalloc, what stays allocated after loading it as
+nested dicts (json.loads), as a StatusModel with the lazy sections untouched, and as a
+StatusModel with client_questions and client_answers materialized as records. Load
+times are taken on a separate run, outside tracemalloc.
+
+Usage: python benchmarks/bench_status_model.py [--questions N]
+"""
+
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "steward_ai_zorba_bot"))
+
+import orchestrator  # noqa: E402
+from services.status_model import StatusModel  # noqa: E402
+
+
+def _document(questions: int):
+    status = json.loads((ROOT / "status.json").read_text(encoding="utf-8"))
+    status["client_questions"] = [
+        {
+            "id": f"Q-{n}",
+            "question": f"Which option should we use for item {n}?",
+            "context": "requirements",
+            "from_agent": "system_analyst",
+            "delivery_status": "answered" if n % 2 else "pending",
+        }
+        for n in range(questions)
+    ]
+    status["client_answers"] = [
+        {"question_id": f"Q-{n}", "answer": "the first one", "source": "telegram", "answered_at": "2026-01-01T00:00:00Z"}
+        for n in range(1, questions, 2)
+    ]
+    return status
+
+
+def _measure(load):
+    start = time.perf_counter()
+    load()
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    tracemalloc.start()
+    value = load()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del value
+    return size, elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--questions", type=int, default=10_000)
+    args = parser.parse_args()
+
+    text = orchestrator.render_status_json(_document(args.questions))
+
+    def materialized():
+        model = StatusModel.loads(text)
+        model.client_questions, model.client_answers  # noqa: B018 - decode both sections
+        return model
+
+    print(f"status.json with {args.questions} questions: {len(text) / 1e6:.1f} MB of text")
+    rows = [
+        ("dicts (json.loads)", lambda: json.loads(text)),
+        ("StatusModel, lazy", lambda: StatusModel.loads(text)),
+        ("StatusModel, records", materialized),
+    ]
+    baseline = None
+    for name, load in rows:
+        size, elapsed = _measure(load)
+        baseline = baseline or size
+        print(f"{name:22s}: {size / 1e6:7.2f} MB  ({size / baseline:5.0%})  load {elapsed * 1e3:7.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""Benchmark: suggestion latency and API calls for repeated questions, with the on-disk cache.
+
+Serves chat completions from a local HTTP server that answers after --api-latency
+seconds (standing in for GPT), asks --questions distinct questions through
+get_suggestions_async, then asks them again the way agents do in a later cycle
+(different case / spacing), and reports the median latency and API calls of each
+round. Finally times a cache lookup in a cache filled to max_entries.
+
+Usage: python benchmarks/bench_suggestion_cache.py [--questions N] [--api-latency S]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "steward_ai_zorba_bot"))
+
+from services import openai_client  # noqa: E402
+from services.suggestion_cache import DEFAULT_MAX_ENTRIES, SuggestionCache  # noqa: E402
+
+
+def _server(latency: float, calls: list) -> ThreadingHTTPServer:
+    body = json.dumps({
+        "id": "cmpl-1", "object": "chat.completion", "created": 0, "model": openai_client.MODEL,
+        "choices": [{"index": 0, "finish_reason": "stop",
+                     "message": {"role": "assistant", "content": "1. Yes\n2. No\n3. You decide"}}],
+    }).encode()
+
+    class Completions(BaseHTTPRequestHandler):
+        def do_POST(self):
+            self.rfile.read(int(self.headers["Content-Length"]))
+            calls.append(1)
+            time.sleep(latency)
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Completions)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+async def _round(questions):
+    latencies = []
+    for question in questions:
+        started = time.perf_counter()
+        await openai_client.get_suggestions_async(question, "requirements")
+        latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--questions", type=int, default=20)
+    parser.add_argument("--api-latency", type=float, default=1.0, help="simulated GPT round trip (s)")
+    args = parser.parse_args()
+
+    calls = []
+    server = _server(args.api_latency, calls)
+    os.environ["AI_API_KEY"] = "bench"
+    os.environ["OPENAI_BASE_URL"] = f"http://127.0.0.1:{server.server_address[1]}/v1"
+    tmp = Path(tempfile.mkdtemp())
+    try:
+        cache = SuggestionCache(tmp / "cache.db")
+        openai_client.set_suggestion_cache(cache)
+        first = [f"Should feature {n} support dark mode?" for n in range(args.questions)]
+        again = [f"  should FEATURE {n} support dark  mode? " for n in range(args.questions)]
+
+        print(f"{args.questions} questions, simulated API latency {args.api_latency * 1e3:.0f} ms")
+        for label, questions in (("first ask", first), ("asked again", again)):
+            before = len(calls)
+            latencies = asyncio.run(_round(questions))
+            print(f"{label:12s}: median {statistics.median(latencies) * 1e3:8.2f} ms  "
+                  f"API calls {len(calls) - before:3d}")
+        stats = cache.stats()
+        print(f"hit rate {stats['hit_rate']:.0%} ({stats['hits']} hits, {stats['misses']} misses)")
+
+        full = SuggestionCache(tmp / "full.db")
+        for n in range(DEFAULT_MAX_ENTRIES):
+            full.put(f"question {n}", "", 3, openai_client.MODEL, ["a", "b", "c"])
+        started = time.perf_counter()
+        for n in range(1000):
+            full.get(f"question {n}", "", 3, openai_client.MODEL)
+        print(f"lookup at {DEFAULT_MAX_ENTRIES} entries: {(time.perf_counter() - started):.3f} ms each")
+    finally:
+        server.shutdown()
+        shutil.rmtree(tmp)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: compiled transition table vs. the reference if/else rules.
+
+Usage: python benchmarks/bench_transitions.py [--number N]
+"""
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import orchestrator  # noqa: E402
+
+
+def _sample_statuses():
+    statuses = []
+    for phase in orchestrator.PHASES:
+        owner, reviewer = orchestrator.PHASE_ACTORS[phase]
+        statuses.append(
+            {"current_phase": phase, "current_actor": owner, "phase_status": "in_progress", "actor_status": "in_progress"}
+        )
+        statuses.append(
+            {"current_phase": phase, "current_actor": owner, "phase_status": "in_progress", "actor_status": "completed"}
+        )
+        if reviewer:
+            statuses.append(
+                {
+                    "current_phase": phase,
+                    "current_actor": reviewer,
+                    "phase_status": "awaiting_review",
+                    "actor_status": "completed",
+                    "review_status": "approved",
+                }
+            )
+    return statuses
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=20000, help="Passes over the sample statuses")
+    args = parser.parse_args()
+
+    statuses = _sample_statuses()
+    calls = args.number * len(statuses)
+
+    def run(fn):
+        def loop():
+            for status in statuses:
+                fn(status)
+
+        return min(timeit.repeat(loop, number=args.number, repeat=3)) / calls * 1e9
+
+    reference_ns = run(orchestrator._transition_rules)
+    table_ns = run(orchestrator.compute_next_transition)
+    print(f"calls per run:   {calls}")
+    print(f"reference rules: {reference_ns:8.1f} ns/call")
+    print(f"compiled table:  {table_ns:8.1f} ns/call")
+    print(f"speedup:         {reference_ns / table_ns:8.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Benchmark: validating many status files.
+
+Compares one `orchestrator.py validate` process per file (timed on a sample and
+extrapolated) with `validate_files` serially, over a process pool, and with a warm
+--changed-since cache where nothing changed.
+
+Usage: python benchmarks/bench_validate.py [--files N] [--sample N]
+"""
+
+import argparse
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import orchestrator  # noqa: E402
+
+
+def _timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--files", type=int, default=2000)
+    parser.add_argument("--sample", type=int, default=30, help="Files timed for the process-per-file baseline")
+    args = parser.parse_args()
+
+    tmp = Path(tempfile.mkdtemp())
+    try:
+        template = (ROOT / "status.json").read_text(encoding="utf-8")
+        paths = []
+        for n in range(args.files):
+            path = tmp / f"project{n:05d}" / "status.json"
+            path.parent.mkdir()
+            path.write_text(template, encoding="utf-8")
+            paths.append(str(path))
+        cache = tmp / "validate-cache.json"
+
+        per_process = _timed(
+            lambda: [
+                subprocess.run(
+                    [sys.executable, str(ROOT / "orchestrator.py"), "--no-daemon", "--status-file", p, "validate"],
+                    capture_output=True,
+                )
+                for p in paths[: args.sample]
+            ]
+        ) / args.sample * args.files
+        serial = _timed(lambda: orchestrator.validate_files(paths, workers=1))
+        pool = _timed(lambda: orchestrator.validate_files(paths, cache_path=cache))
+        warm = _timed(lambda: orchestrator.validate_files(paths, cache_path=cache))
+
+        print(f"{args.files} status files")
+        print(f"process per file (est.) : {per_process:8.2f} s")
+        print(f"validate_files serial   : {serial:8.2f} s  ({per_process / serial:6.0f}x)")
+        print(f"--glob process pool     : {pool:8.2f} s  ({per_process / pool:6.0f}x)")
+        print(f"--changed-since, warm   : {warm:8.2f} s  ({per_process / warm:6.0f}x)")
+    finally:
+        shutil.rmtree(tmp)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -9,6 +9,7 @@ This script provides deterministic helpers to:
 - validate status.json shape
 - reconcile obvious inconsistencies (e.g. gates vs comms/ACKs)
 - compute/perform the next orchestrator transition
+- serve the above from a long-running daemon (`serve`) that keeps status.json in memory
 
 It intentionally uses only the Python standard library.
 """
@@ -16,12 +17,35 @@ It intentionally uses only the Python standard library.
 from __future__ import annotations
 
 import argparse
+import bisect
+import contextlib
+import copy
+import glob
+import hashlib
+import io
 import json
+import math
+import mmap
+import os
+import random
+import signal
+import socket
+import socketserver
+import struct
 import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
 
 
 PHASES: List[str] = [
@@ -117,68 +141,572 @@ def _load_json(path: Path) -> Dict[str, Any]:
     return data
 
 
+def render_status_json(data: Dict[str, Any]) -> str:
+    """The exact text every tool writes for status.json (other backends export the same bytes)."""
+    return json.dumps(data, indent=2) + "\n"
+
+
 def _atomic_write_json(path: Path, data: Dict[str, Any]) -> None:
     tmp_path = path.with_suffix(path.suffix + ".tmp")
     with tmp_path.open("w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
-        f.write("\n")
+        f.write(render_status_json(data))
     tmp_path.replace(path)
 
 
-def validate_status(status: Dict[str, Any]) -> List[ValidationIssue]:
-    issues: List[ValidationIssue] = []
+def _file_signature(path: Path) -> Tuple[int, int, int]:
+    """(inode, mtime_ns, size) - changes whenever the file is replaced or rewritten."""
+    st = path.stat()
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
 
-    for key in STATUS_REQUIRED_KEYS:
-        if key not in status:
-            issues.append(ValidationIssue("error", f"Missing required key: {key}"))
 
-    # Structural checks (only if keys exist)
-    if "cycle" in status and not isinstance(status["cycle"], int):
-        issues.append(ValidationIssue("error", "cycle must be an int"))
+# --- Versioned status.json writes -------------------------------------------------------
+#
+# Every writer (orchestrator, bot, idea handler) bumps the top-level `version` and replaces the
+# file atomically inside a short flock() on `status.json.lock`. A write is a compare-and-swap:
+# it only goes through if the file still has the signature it had when the writer read it, so
+# a concurrent update (versioned or a hand edit) is never silently overwritten.
+#
+# While a `status.json.journal` sidecar exists, writes append an RFC 6902 patch to it instead
+# of rewriting status.json, and reads fold the journal onto the snapshot (see below).
 
-    for key in ["current_phase", "current_actor", "phase_status", "actor_status", "review_status"]:
-        if key in status and not isinstance(status[key], str):
-            issues.append(ValidationIssue("error", f"{key} must be a string"))
+STATUS_VERSION_KEY = "version"
 
-    for key in ["comms", "client_channel", "changesets", "artifacts", "gates", "timestamps"]:
-        if key in status and not isinstance(status[key], dict):
-            issues.append(ValidationIssue("error", f"{key} must be an object"))
+STATUS_CAS_RETRIES = 10
+STATUS_CAS_BASE_DELAY = 0.002
+STATUS_CAS_MAX_DELAY = 0.1
 
-    for key in ["client_questions", "client_answers", "ack_requests"]:
-        if key in status and not isinstance(status[key], list):
-            issues.append(ValidationIssue("error", f"{key} must be an array"))
+# The journal is folded into a new status.json snapshot once it grows past this size.
+STATUS_JOURNAL_COMPACT_BYTES = 256 * 1024
 
-    # Semantic-ish checks (warnings)
-    phase = status.get("current_phase")
-    if isinstance(phase, str) and phase and phase not in PHASES:
-        issues.append(
-            ValidationIssue(
-                "warning",
-                f"current_phase '{phase}' is not a canonical phase. Expected one of: {', '.join(PHASES)}",
-            )
-        )
+# (inode, mtime_ns, size) of status.json plus the journal size (-1 without a journal).
+StatusSignature = Tuple[int, int, int, int]
 
-    comms_state = status.get("comms", {}).get("state") if isinstance(status.get("comms"), dict) else None
-    gates = status.get("gates") if isinstance(status.get("gates"), dict) else {}
-    if comms_state in {"ready", "fallback_only"} and gates.get("COMMS_READY") == "pending":
-        issues.append(
-            ValidationIssue(
-                "warning",
-                "comms.state is ready/fallback_only but gates.COMMS_READY is still pending",
-            )
+
+class StatusConflict(RuntimeError):
+    """status.json changed between read and compare-and-swap write."""
+
+
+@dataclass(frozen=True)
+class StatusVersion:
+    """What a writer saw when it read status.json: the version and the file signature."""
+
+    version: int
+    signature: Optional[StatusSignature]  # None: the file did not exist
+
+
+def status_lock_path(status_path: Path) -> Path:
+    return status_path.with_name(status_path.name + ".lock")
+
+
+def status_journal_path(status_path: Path) -> Path:
+    return status_path.with_name(status_path.name + ".journal")
+
+
+@contextlib.contextmanager
+def status_lock(status_path: Path) -> Iterator[None]:
+    """Exclusive lock serializing check-and-write of status.json (no-op without fcntl)."""
+    if fcntl is None:
+        yield
+        return
+    fd = os.open(status_lock_path(status_path), os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        os.close(fd)  # releases the lock
+
+
+def _status_version_of(status: Dict[str, Any]) -> int:
+    version = status.get(STATUS_VERSION_KEY, 0)
+    return version if isinstance(version, int) and not isinstance(version, bool) else 0
+
+
+def status_signature(status_path: Path) -> Optional[StatusSignature]:
+    """Changes whenever status.json or its journal is written; None if there is no status.json."""
+    try:
+        ino, mtime_ns, size = _file_signature(status_path)
+    except FileNotFoundError:
+        return None
+    try:
+        journal_size = status_journal_path(status_path).stat().st_size
+    except FileNotFoundError:
+        journal_size = -1
+    return (ino, mtime_ns, size, journal_size)
+
+
+def _read_status_once(status_path: Path) -> Tuple[Dict[str, Any], StatusVersion]:
+    with status_path.open("r", encoding="utf-8") as f:
+        # fstat of the descriptor we parse, so the signature always matches the content.
+        st = os.fstat(f.fileno())
+        data = json.load(f)
+    if not isinstance(data, dict):
+        raise ValueError("status.json must be a JSON object")
+
+    journal_size = -1
+    try:
+        with status_journal_path(status_path).open("rb") as jf:
+            journal_size = os.fstat(jf.fileno()).st_size
+            journal = jf.read(journal_size)
+    except FileNotFoundError:
+        pass
+    else:
+        data = _fold_status_journal(data, journal, (st.st_ino, st.st_mtime_ns, st.st_size))
+
+    signature = (st.st_ino, st.st_mtime_ns, st.st_size, journal_size)
+    return data, StatusVersion(_status_version_of(data), signature)
+
+
+def read_status_versioned(status_path: Path) -> Tuple[Dict[str, Any], StatusVersion]:
+    """Load status.json (plus its journal) with the token a later cas_write_status() checks."""
+    try:
+        return _read_status_once(status_path)
+    except _JournalMismatch:
+        # Snapshot and journal were read either side of a compaction; writers are locked out
+        # while we hold the lock, so this read is consistent.
+        with status_lock(status_path):
+            return _read_status_locked(status_path)
+
+
+def _read_status_locked(status_path: Path) -> Tuple[Dict[str, Any], StatusVersion]:
+    """_read_status_once() for a caller holding the lock.
+
+    A journal that does not fit the snapshot here is not a race: status.json was edited
+    by hand. The snapshot wins and the journal is set aside (see _reject_status_journal).
+    """
+    try:
+        return _read_status_once(status_path)
+    except _JournalMismatch as e:
+        _reject_status_journal(status_path, e)
+        return _read_status_once(status_path)
+
+
+def cas_write_status(status_path: Path, status: Dict[str, Any], expected: StatusVersion) -> StatusVersion:
+    """Write `status` only if status.json is unchanged since `expected` was read.
+
+    Sets status["version"] to expected.version + 1 and returns the new token; raises
+    StatusConflict (and writes nothing) if another writer got there first. With a journal,
+    only the patch from the stored document to `status` is appended.
+    """
+    with status_lock(status_path):
+        signature = status_signature(status_path)
+        if signature != expected.signature:
+            raise StatusConflict(f"{status_path} changed since it was read (version {expected.version})")
+        version = expected.version + 1
+        if signature is not None and signature[3] >= 0:
+            base, _ = _read_status_once(status_path)  # unchanged since `expected`, checked above
+            base.pop(STATUS_VERSION_KEY, None)
+            ops = diff_json(base, {k: v for k, v in status.items() if k != STATUS_VERSION_KEY})
+            status[STATUS_VERSION_KEY] = version
+            if _append_status_journal(status_path, version, ops, signature[:3]) > STATUS_JOURNAL_COMPACT_BYTES:
+                _replace_snapshot(status_path, status)
+        else:
+            status[STATUS_VERSION_KEY] = version
+            _atomic_write_json(status_path, status)
+        return StatusVersion(version, status_signature(status_path))
+
+
+def overwrite_status(status_path: Path, status: Dict[str, Any]) -> int:
+    """Last-writer-wins write that still takes the lock and bumps the version; returns it."""
+    with status_lock(status_path):
+        try:
+            current = _read_status_locked(status_path)[1].version
+        except (OSError, ValueError):
+            current = 0
+        version = max(current, _status_version_of(status)) + 1
+        status[STATUS_VERSION_KEY] = version
+        _replace_snapshot(status_path, status)
+        return version
+
+
+def write_status_json(status_path: Path, status: Dict[str, Any]) -> None:
+    """Replace status.json with `status` exactly as given (no version bump), under the lock.
+
+    For exporting a document whose version is already authoritative, e.g. from another store.
+    """
+    with status_lock(status_path):
+        _replace_snapshot(status_path, status)
+
+
+# --- status.json journal ------------------------------------------------------------------
+#
+# status.json.journal holds one JSON object per line: {"v": <version>, "ops": [<RFC 6902 op>]}.
+# The document is the snapshot (status.json) with every entry newer than the snapshot's version
+# applied in order; entries at or below it were already folded in by a compaction. Compaction
+# writes the folded document as the new snapshot, then empties the journal.
+#
+# The first entry written to an empty journal also records "base": the (inode, mtime_ns, size)
+# of the snapshot it extends. If status.json is edited by hand, that no longer matches (or an
+# op no longer applies); the snapshot is then taken as the document and the journal is moved
+# to status.json.journal.rejected.
+
+
+class _JournalMismatch(ValueError):
+    """The journal does not apply to the snapshot (read raced a compaction, or a hand edit)."""
+
+
+class _JournalGap(_JournalMismatch):
+    """The journal skips versions relative to the snapshot (read raced a compaction)."""
+
+
+def _pointer_token(key: Any) -> str:
+    return str(key).replace("~", "~0").replace("/", "~1")
+
+
+def _parse_pointer(pointer: str) -> List[str]:
+    if pointer == "":
+        return []
+    if not pointer.startswith("/"):
+        raise ValueError(f"invalid JSON pointer: {pointer!r}")
+    return [t.replace("~1", "/").replace("~0", "~") for t in pointer[1:].split("/")]
+
+
+def diff_json(before: Any, after: Any, path: str = "") -> List[Dict[str, Any]]:
+    """RFC 6902 operations turning `before` into `after` (add/remove/replace only)."""
+    if before is after:
+        return []
+    if isinstance(before, dict) and isinstance(after, dict):
+        ops: List[Dict[str, Any]] = []
+        for key, value in before.items():
+            if key not in after:
+                ops.append({"op": "remove", "path": f"{path}/{_pointer_token(key)}"})
+            elif value is not after[key] and value != after[key]:
+                ops.extend(diff_json(value, after[key], f"{path}/{_pointer_token(key)}"))
+        for key, value in after.items():
+            if key not in before:
+                ops.append({"op": "add", "path": f"{path}/{_pointer_token(key)}", "value": value})
+        return ops
+    if isinstance(before, list) and isinstance(after, list):
+        ops = []
+        common = min(len(before), len(after))
+        for i in range(common):
+            if before[i] is not after[i] and before[i] != after[i]:
+                ops.extend(diff_json(before[i], after[i], f"{path}/{i}"))
+        ops.extend({"op": "add", "path": f"{path}/-", "value": v} for v in after[common:])
+        ops.extend({"op": "remove", "path": f"{path}/{i}"} for i in range(len(before) - 1, common - 1, -1))
+        return ops
+    if type(before) is type(after) and before == after:
+        return []
+    return [{"op": "replace", "path": path, "value": after}]
+
+
+def _resolve_parent(doc: Any, tokens: List[str]) -> Tuple[Any, str]:
+    target = doc
+    for token in tokens[:-1]:
+        target = target[int(token)] if isinstance(target, list) else target[token]
+    return target, tokens[-1]
+
+
+def _patch_get(doc: Any, tokens: List[str]) -> Any:
+    for token in tokens:
+        doc = doc[int(token)] if isinstance(doc, list) else doc[token]
+    return doc
+
+
+def _patch_add(doc: Any, tokens: List[str], value: Any) -> Any:
+    if not tokens:
+        return value
+    parent, last = _resolve_parent(doc, tokens)
+    if isinstance(parent, list):
+        parent.insert(len(parent) if last == "-" else int(last), value)
+    else:
+        parent[last] = value
+    return doc
+
+
+def _patch_remove(doc: Any, tokens: List[str]) -> Any:
+    parent, last = _resolve_parent(doc, tokens)
+    removed = parent.pop(int(last)) if isinstance(parent, list) else parent.pop(last)
+    return removed
+
+
+def apply_json_patch(doc: Any, ops: Iterable[Dict[str, Any]]) -> Any:
+    """Apply RFC 6902 operations in place (the root may be replaced); returns the document.
+
+    Raises ValueError if an operation does not apply, including a failed "test".
+    """
+    for op in ops:
+        try:
+            name, tokens = op["op"], _parse_pointer(op["path"])
+            if name == "add":
+                doc = _patch_add(doc, tokens, copy.deepcopy(op["value"]))
+            elif name == "remove":
+                _patch_remove(doc, tokens)
+            elif name == "replace":
+                if not tokens:
+                    doc = copy.deepcopy(op["value"])
+                else:
+                    parent, last = _resolve_parent(doc, tokens)
+                    _patch_get(parent, [last])  # must exist
+                    parent[int(last) if isinstance(parent, list) else last] = copy.deepcopy(op["value"])
+            elif name in ("move", "copy"):
+                source = _parse_pointer(op["from"])
+                value = _patch_remove(doc, source) if name == "move" else copy.deepcopy(_patch_get(doc, source))
+                doc = _patch_add(doc, tokens, value)
+            elif name == "test":
+                if _patch_get(doc, tokens) != op["value"]:
+                    raise ValueError(f"test failed at {op['path']}")
+            else:
+                raise ValueError(f"unknown patch op: {name}")
+        except (KeyError, IndexError, TypeError) as e:
+            raise ValueError(f"patch op {op!r} does not apply: {e!r}") from e
+    return doc
+
+
+def _fold_status_journal(status: Dict[str, Any], journal: bytes, snapshot: Tuple[int, int, int]) -> Dict[str, Any]:
+    version = _status_version_of(status)
+    for line in journal.split(b"\n")[:-1]:  # an unterminated last line is a torn append
+        if not line.strip():
+            continue
+        entry = json.loads(line)
+        v = entry["v"]
+        if v <= version:
+            continue  # already folded into the snapshot
+        if v != version + 1:
+            raise _JournalGap(f"journal jumps from version {version} to {v}")
+        if entry.get("base", list(snapshot)) != list(snapshot):
+            raise _JournalMismatch(f"journal entry {v} was written against another status.json")
+        try:
+            status = apply_json_patch(status, entry["ops"])
+        except ValueError as e:
+            raise _JournalMismatch(f"journal entry {v} does not apply: {e}") from e
+        status[STATUS_VERSION_KEY] = version = v
+    return status
+
+
+def _append_status_journal(
+    status_path: Path, version: int, ops: List[Dict[str, Any]], snapshot: Tuple[int, int, int]
+) -> int:
+    """Append one entry (caller holds the lock); returns the journal size afterwards.
+
+    `snapshot` is the (inode, mtime_ns, size) of status.json, recorded if the journal is empty.
+    """
+    entry: Dict[str, Any] = {"v": version, "ops": ops}
+    with status_journal_path(status_path).open("a+b") as f:
+        size = f.seek(0, os.SEEK_END)
+        if size:
+            f.seek(size - 1)
+            if f.read(1) != b"\n":
+                # A writer died mid-append; drop the torn line so ours starts on a fresh one.
+                f.seek(0)
+                size = f.read().rfind(b"\n") + 1
+                f.truncate(size)
+        if not size:
+            entry["base"] = list(snapshot)
+        f.write(json.dumps(entry, separators=(",", ":")).encode("utf-8") + b"\n")
+        return f.tell()
+
+
+def _replace_snapshot(status_path: Path, status: Dict[str, Any]) -> None:
+    """Write the whole document as status.json and empty the journal (caller holds the lock)."""
+    _atomic_write_json(status_path, status)
+    journal_path = status_journal_path(status_path)
+    if journal_path.exists():
+        # Entries left behind by a crash here are skipped: their versions are <= the snapshot's.
+        os.truncate(journal_path, 0)
+
+
+def _reject_status_journal(status_path: Path, reason: Exception) -> None:
+    """Set a journal that no longer fits status.json aside and start an empty one (caller holds the lock)."""
+    journal_path = status_journal_path(status_path)
+    rejected_path = journal_path.with_name(journal_path.name + ".rejected")
+    journal_path.replace(rejected_path)
+    journal_path.touch()
+    print(
+        f"WARN: {reason}; status.json was edited outside the orchestrator. "
+        f"Keeping status.json as is; the journal was moved to {rejected_path}",
+        file=sys.stderr,
+    )
+
+
+def enable_status_journal(status_path: Path) -> None:
+    with status_lock(status_path):
+        status_journal_path(status_path).touch()
+
+
+def compact_status_journal(status_path: Path, *, remove: bool = False) -> Tuple[int, int]:
+    """Fold the journal into status.json; returns (version, journal bytes folded)."""
+    with status_lock(status_path):
+        journal_path = status_journal_path(status_path)
+        status, version = _read_status_locked(status_path)
+        size = journal_path.stat().st_size if journal_path.exists() else 0
+        _replace_snapshot(status_path, status)
+        if remove:
+            journal_path.unlink(missing_ok=True)
+        return version.version, size
+
+
+def _cas_backoff(attempt: int) -> float:
+    delay = min(STATUS_CAS_MAX_DELAY, STATUS_CAS_BASE_DELAY * (2**attempt))
+    return delay * random.uniform(0.5, 1.5)
+
+
+def update_status(
+    status_path: Path,
+    mutate: Callable[[Dict[str, Any]], Optional[bool]],
+    *,
+    retries: int = STATUS_CAS_RETRIES,
+) -> Dict[str, Any]:
+    """Read-modify-write status.json with compare-and-swap, retrying with bounded backoff.
+
+    `mutate` edits the freshly loaded document in place and may run several times; returning
+    False means "nothing to change" and skips the write. Returns the document as written (or
+    as read, when skipped). Raises StatusConflict once `retries` are exhausted.
+    """
+    for attempt in range(retries + 1):
+        status, expected = read_status_versioned(status_path)
+        if mutate(status) is False:
+            return status
+        try:
+            cas_write_status(status_path, status, expected)
+            return status
+        except StatusConflict:
+            if attempt == retries:
+                raise
+            time.sleep(_cas_backoff(attempt))
+    raise AssertionError("unreachable")
+
+
+def _retry_on_conflict(func: Callable[[], Any], retries: int = STATUS_CAS_RETRIES) -> Any:
+    """Re-run a whole load/compute/write command when its CAS write loses a race."""
+    for attempt in range(retries + 1):
+        try:
+            return func()
+        except StatusConflict:
+            if attempt == retries:
+                raise
+            time.sleep(_cas_backoff(attempt))
+    raise AssertionError("unreachable")
+
+
+class _DaemonState:
+    """status.json held in memory by `orchestrator.py serve`.
+
+    The parsed document is reused until the file's signature changes, so edits made by
+    agents (or by a one-shot CLI run) are picked up on the next request with a single stat().
+    """
+
+    def __init__(self, status_path: Path) -> None:
+        self.status_path = status_path
+        self.reloads = 0
+        self._status: Optional[Dict[str, Any]] = None
+        self._version: Optional[StatusVersion] = None
+
+    def load(self, *, mutable: bool = False) -> Dict[str, Any]:
+        signature = status_signature(self.status_path)
+        if self._status is None or self._version is None or signature != self._version.signature:
+            self._status, self._version = read_status_versioned(self.status_path)
+            self.reloads += 1
+        # Commands like step/reconcile mutate the document; never hand them the cached copy.
+        return copy.deepcopy(self._status) if mutable else self._status
+
+    def write(self, status: Dict[str, Any]) -> None:
+        if self._version is None:
+            self.load()
+        assert self._version is not None
+        self._version = cas_write_status(self.status_path, status, self._version)
+        self._status = status
+
+
+def _load_status(args: argparse.Namespace, *, mutable: bool = False) -> Dict[str, Any]:
+    state: Optional[_DaemonState] = getattr(args, "daemon_state", None)
+    if state is not None:
+        return state.load(mutable=mutable)
+    status, args.status_version = read_status_versioned(Path(args.status_file))
+    return status
+
+
+def _write_status(args: argparse.Namespace, status: Dict[str, Any]) -> None:
+    """CAS write of what _load_status() returned; raises StatusConflict if it went stale."""
+    state: Optional[_DaemonState] = getattr(args, "daemon_state", None)
+    if state is not None:
+        state.write(status)
+    else:
+        args.status_version = cas_write_status(Path(args.status_file), status, args.status_version)
+
+
+class StatusValidator:
+    """The validate_status() rules, compiled once.
+
+    Key sets, type rules and every constant issue are built up front, so validating a
+    document is a handful of set/isinstance checks; build one and reuse it across files.
+    """
+
+    STRING_KEYS = ("current_phase", "current_actor", "phase_status", "actor_status", "review_status")
+    OBJECT_KEYS = ("comms", "client_channel", "changesets", "artifacts", "gates", "timestamps")
+    ARRAY_KEYS = ("client_questions", "client_answers", "ack_requests")
+
+    def __init__(self, required_keys: Iterable[str] = STATUS_REQUIRED_KEYS, phases: Iterable[str] = PHASES) -> None:
+        self.required_keys: Tuple[str, ...] = tuple(required_keys)
+        self.phases: Tuple[str, ...] = tuple(phases)
+        self._required = frozenset(self.required_keys)
+        self._missing = tuple(
+            (key, ValidationIssue("error", f"Missing required key: {key}")) for key in self.required_keys
+        )
+        self._cycle_issue = ValidationIssue("error", "cycle must be an int")
+        self._version_issue = ValidationIssue("error", "version must be a non-negative int")
+        self._type_rules: Tuple[Tuple[str, type, ValidationIssue], ...] = (
+            tuple((k, str, ValidationIssue("error", f"{k} must be a string")) for k in self.STRING_KEYS)
+            + tuple((k, dict, ValidationIssue("error", f"{k} must be an object")) for k in self.OBJECT_KEYS)
+            + tuple((k, list, ValidationIssue("error", f"{k} must be an array")) for k in self.ARRAY_KEYS)
         )
+        self._phase_set = frozenset(self.phases)
+        self._phase_hint = f"Expected one of: {', '.join(self.phases)}"
+        self._comms_issue = ValidationIssue(
+            "warning", "comms.state is ready/fallback_only but gates.COMMS_READY is still pending"
+        )
+        # Identifies the rule set; cached validation results are only trusted for the same one.
+        rules = (self.required_keys, self.phases, STATUS_VERSION_KEY, [(k, t.__name__) for k, t, _ in self._type_rules])
+        self.fingerprint = hashlib.sha1(repr(rules).encode("utf-8")).hexdigest()[:16]
+
+    def validate(self, status: Dict[str, Any]) -> List[ValidationIssue]:
+        issues: List[ValidationIssue] = []
 
-    if phase == "done" and status.get("phase_status") == "completed":
-        pending_gates = [k for k, v in (gates or {}).items() if v == "pending"]
-        if pending_gates:
+        if not self._required <= status.keys():
+            issues.extend(issue for key, issue in self._missing if key not in status)
+
+        # Structural checks (only if keys exist)
+        if "cycle" in status and not isinstance(status["cycle"], int):
+            issues.append(self._cycle_issue)
+
+        version = status.get(STATUS_VERSION_KEY)
+        if version is not None and (not isinstance(version, int) or isinstance(version, bool) or version < 0):
+            issues.append(self._version_issue)
+
+        for key, expected, issue in self._type_rules:
+            if key in status and not isinstance(status[key], expected):
+                issues.append(issue)
+
+        # Semantic-ish checks (warnings)
+        phase = status.get("current_phase")
+        if isinstance(phase, str) and phase and phase not in self._phase_set:
             issues.append(
-                ValidationIssue(
-                    "warning",
-                    f"workflow is done but gates are still pending: {', '.join(sorted(pending_gates))}",
-                )
+                ValidationIssue("warning", f"current_phase '{phase}' is not a canonical phase. {self._phase_hint}")
             )
 
-    return issues
+        comms = status.get("comms")
+        comms_state = comms.get("state") if isinstance(comms, dict) else None
+        gates = status.get("gates") if isinstance(status.get("gates"), dict) else {}
+        if comms_state in {"ready", "fallback_only"} and gates.get("COMMS_READY") == "pending":
+            issues.append(self._comms_issue)
+
+        if phase == "done" and status.get("phase_status") == "completed":
+            pending_gates = [k for k, v in (gates or {}).items() if v == "pending"]
+            if pending_gates:
+                issues.append(
+                    ValidationIssue(
+                        "warning",
+                        f"workflow is done but gates are still pending: {', '.join(sorted(pending_gates))}",
+                    )
+                )
+
+        return issues
+
+
+_STATUS_VALIDATOR = StatusValidator()
+
+
+def validate_status(status: Dict[str, Any]) -> List[ValidationIssue]:
+    return _STATUS_VALIDATOR.validate(status)
 
 
 def reconcile_gates(status: Dict[str, Any]) -> bool:
@@ -228,8 +756,13 @@ def _next_phase(phase: str) -> str:
     return PHASES[min(idx + 1, len(PHASES) - 1)]
 
 
-def compute_next_transition(status: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-    """Return a patch-like dict of fields to update for the next orchestrator transition."""
+def _transition_rules(status: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Reference transition rules.
+
+    This is the single source of truth for the state machine. It is compiled into
+    `_TRANSITIONS` at import; at runtime it is only evaluated for states outside the
+    table (see the *_STATUSES sets below).
+    """
     phase = status.get("current_phase")
     if not isinstance(phase, str) or phase not in PHASE_ACTORS:
         # Kickoff/reset to the first phase
@@ -311,20 +844,97 @@ def compute_next_transition(status: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     }
 
 
-def append_history(history_path: Path, *, from_status: Dict[str, Any], to_status: Dict[str, Any]) -> None:
-    history_path.parent.mkdir(parents=True, exist_ok=True)
+# Protocol values (workflow_protocol.md) enumerated into the compiled table. States outside
+# them (unknown actor, typo'd status, kickoff) miss the table and go through the rules.
+ACTOR_STATUSES: FrozenSet[str] = frozenset({"not_started", "in_progress", "completed"})
+REVIEW_STATUSES: FrozenSet[str] = frozenset({"not_started", "in_review", "approved", "changes_requested"})
+PHASE_STATUSES: FrozenSet[str] = frozenset({"", "not_started", "in_progress", "awaiting_review", "completed"})
 
-    if not history_path.exists():
-        history_path.write_text(",".join(HISTORY_HEADER) + "\n", encoding="utf-8")
+# Fields the rules read, in key order. Within a phase the actor name identifies its role
+# (owner/reviewer), so the raw field tuple is the key and no derivation is needed per call.
+TRANSITION_KEY_FIELDS = ("current_phase", "current_actor", "actor_status", "review_status", "phase_status")
+
+TransitionKey = Tuple[Any, ...]
 
-    # Ensure header is correct (best effort)
-    first_line = history_path.read_text(encoding="utf-8").splitlines()[:1]
-    if not first_line or first_line[0].strip() != ",".join(HISTORY_HEADER):
-        # Don’t rewrite history automatically; just append compatible rows.
-        pass
 
-    row = [
-        _utc_now_iso(),
+def _compile_transitions() -> Dict[TransitionKey, Optional[Mapping[str, Any]]]:
+    """Evaluate `_transition_rules` once per in-protocol state and freeze the patches.
+
+    "No transition" is stored as an explicit None so it is distinguishable from a miss.
+    """
+    table: Dict[TransitionKey, Optional[Mapping[str, Any]]] = {}
+    interned: Dict[Tuple[Tuple[str, Any], ...], Mapping[str, Any]] = {}
+
+    for phase, actors in PHASE_ACTORS.items():
+        for actor in filter(None, actors):
+            for actor_status in [None, *sorted(ACTOR_STATUSES)]:
+                for review_status in [None, *sorted(REVIEW_STATUSES)]:
+                    for phase_status in [None, *sorted(PHASE_STATUSES)]:
+                        key = (phase, actor, actor_status, review_status, phase_status)
+                        patch = _transition_rules(dict(zip(TRANSITION_KEY_FIELDS, key)))
+                        if patch is not None:
+                            items = tuple(patch.items())
+                            if items not in interned:
+                                interned[items] = MappingProxyType(patch)
+                            table[key] = interned[items]
+                        else:
+                            table[key] = None
+    return table
+
+
+_TRANSITIONS = _compile_transitions()
+_MISS = object()
+
+
+def compute_next_transition(status: Dict[str, Any]) -> Optional[Mapping[str, Any]]:
+    """Return a read-only patch of fields to update for the next orchestrator transition.
+
+    None means no transition is available (waiting on the current actor/reviewer, or done).
+    """
+    get = status.get
+    try:
+        # Same order as TRANSITION_KEY_FIELDS, spelled out: tuple(map(...)) is ~4x slower here.
+        key = (
+            get("current_phase"),
+            get("current_actor"),
+            get("actor_status"),
+            get("review_status"),
+            get("phase_status"),
+        )
+        patch = _TRANSITIONS.get(key, _MISS)
+    except TypeError:
+        patch = _MISS  # unhashable field values in a malformed status.json
+    if patch is _MISS:
+        rule_patch = _transition_rules(status)
+        return MappingProxyType(rule_patch) if rule_patch is not None else None
+    return patch  # type: ignore[return-value]
+
+
+def advance_status(
+    status: Dict[str, Any], *, max_steps: int = 1, reconcile: bool = False
+) -> List[Tuple[Dict[str, Any], Dict[str, Any]]]:
+    """Apply up to `max_steps` transitions to `status` in place.
+
+    Returns a (from, to) snapshot per applied transition, for history rows.
+    """
+    if max_steps < 1:
+        raise ValueError(f"max_steps must be at least 1, got {max_steps}")
+    transitions: List[Tuple[Dict[str, Any], Dict[str, Any]]] = []
+    while len(transitions) < max_steps:
+        if reconcile:
+            reconcile_gates(status)
+        patch = compute_next_transition(status)
+        if not patch:
+            break
+        from_status = dict(status)
+        status.update(patch)
+        transitions.append((from_status, dict(status)))
+    return transitions
+
+
+def _history_row(from_status: Dict[str, Any], to_status: Dict[str, Any], timestamp: Optional[str] = None) -> List[str]:
+    return [
+        timestamp or _utc_now_iso(),
         str(from_status.get("current_phase", "")),
         str(from_status.get("phase_status", "")),
         str(from_status.get("current_actor", "")),
@@ -332,8 +942,676 @@ def append_history(history_path: Path, *, from_status: Dict[str, Any], to_status
         str(to_status.get("current_actor", "")),
         str(to_status.get("phase_status", "")),
     ]
-    with history_path.open("a", encoding="utf-8") as f:
-        f.write(",".join(row) + "\n")
+
+
+def _history_header_ok(f: Any) -> bool:
+    """Check the header of an open history file by reading only its first line."""
+    f.seek(0)
+    return f.readline().rstrip(b"\r\n") == ",".join(HISTORY_HEADER).encode("utf-8")
+
+
+def append_history_rows(history_path: Path, rows: List[List[str]], *, fsync: bool = False) -> None:
+    """Append rows with a single write, creating the file (with header) if needed.
+
+    Cost is independent of the history size: only the first line is ever read.
+    """
+    if not rows:
+        return
+    history_path.parent.mkdir(parents=True, exist_ok=True)
+
+    payload = "".join(",".join(row) + "\n" for row in rows).encode("utf-8")
+    with history_path.open("a+b") as f:
+        if f.seek(0, os.SEEK_END) == 0:
+            payload = (",".join(HISTORY_HEADER) + "\n").encode("utf-8") + payload
+        elif not _history_header_ok(f):
+            # Don’t rewrite history automatically; just append compatible rows.
+            print(f"WARN: {history_path} has an unexpected header; appending anyway", file=sys.stderr)
+        f.write(payload)  # O_APPEND: always lands at the end regardless of the read position
+        if fsync:
+            f.flush()
+            os.fsync(f.fileno())
+
+    bin_path = binary_history_path(history_path)
+    if bin_path.exists() and not _binary_stale_path(bin_path).exists():
+        try:
+            append_binary_history(bin_path, rows)
+        except (OSError, ValueError) as e:
+            # The CSV row is already written; the mirror is rebuilt from it on its next read.
+            print(f"WARN: failed to mirror history to {bin_path}: {e}", file=sys.stderr)
+            _mark_binary_history_stale(bin_path, history_path)
+
+    if history_index_path(history_path).exists():
+        try:
+            update_history_index(history_path)
+        except (OSError, ValueError) as e:
+            # The index is only an accelerator; the next update catches up from its last checkpoint.
+            print(f"WARN: failed to update {history_index_path(history_path)}: {e}", file=sys.stderr)
+
+
+def append_history(history_path: Path, *, from_status: Dict[str, Any], to_status: Dict[str, Any]) -> None:
+    append_history_rows(history_path, [_history_row(from_status, to_status)])
+
+
+class HistoryWriter:
+    """Group-commit appender for status_history.csv.
+
+    Rows are buffered and flushed with one write (and one fsync) once `max_rows` are
+    pending, once the oldest pending row is `max_delay` seconds old (checked on append),
+    or on flush()/close(). Use as a context manager so nothing is left buffered.
+    """
+
+    def __init__(self, history_path: Path, *, max_rows: int = 64, max_delay: float = 0.05, fsync: bool = True) -> None:
+        self.history_path = history_path
+        self.max_rows = max_rows
+        self.max_delay = max_delay
+        self.fsync = fsync
+        self.flushes = 0
+        self._rows: List[List[str]] = []
+        self._first_pending_at = 0.0
+        self._lock = threading.Lock()
+
+    def append(self, *, from_status: Dict[str, Any], to_status: Dict[str, Any]) -> None:
+        self.append_row(_history_row(from_status, to_status))
+
+    def append_row(self, row: List[str]) -> None:
+        with self._lock:
+            if not self._rows:
+                self._first_pending_at = time.monotonic()
+            self._rows.append(row)
+            due = len(self._rows) >= self.max_rows or time.monotonic() - self._first_pending_at >= self.max_delay
+        if due:
+            self.flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            rows, self._rows = self._rows, []
+            if rows:
+                append_history_rows(self.history_path, rows, fsync=self.fsync)
+                self.flushes += 1
+
+    def close(self) -> None:
+        self.flush()
+
+    def __enter__(self) -> "HistoryWriter":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+# --- History index -------------------------------------------------------------------
+#
+# status_history.csv.idx is a sidecar with one checkpoint every HISTORY_INDEX_EVERY data
+# rows: "row,byte_offset,cycle,epoch". It starts with a fixed-width header recording how
+# far into the CSV it has indexed, so appends only scan the rows they added. Entries are
+# appended before the header is rewritten; anything past the header's `isize` is an
+# uncommitted tail and is truncated on the next update.
+#
+# The CSV has no cycle column: a row that re-enters bootstrap_comms from another canonical
+# phase (orchestrator.py restart) starts a new cycle, counted from 0 at the top of the file.
+
+HISTORY_INDEX_EVERY = 1000
+_INDEX_HEADER_FMT = "HIDX1 every={:08d} rows={:012d} cycle={:08d} end={:016d} isize={:016d}\n"
+_INDEX_HEADER_LEN = len(_INDEX_HEADER_FMT.format(0, 0, 0, 0, 0))
+_HISTORY_HEADER_BYTES = ",".join(HISTORY_HEADER).encode("utf-8")
+_RESTART_FROM_PHASES = frozenset(p.encode("utf-8") for p in PHASES if p != "bootstrap_comms")
+
+
+@dataclass
+class _HistoryIndexState:
+    every: int
+    rows: int = 0  # data rows indexed so far
+    cycle: int = 0  # cycle in effect after the last indexed row
+    end: int = 0  # CSV byte offset indexed up to
+    isize: int = _INDEX_HEADER_LEN  # committed size of the index file
+
+
+@dataclass(frozen=True)
+class HistoryIndexEntry:
+    row: int
+    offset: int
+    cycle: int  # cycle in effect *before* this row
+    epoch: float
+
+
+def history_index_path(history_path: Path) -> Path:
+    return history_path.with_name(history_path.name + ".idx")
+
+
+def _parse_history_timestamp(value: str) -> Optional[float]:
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def _is_restart_row(fields: List[bytes]) -> bool:
+    return fields[4] == b"bootstrap_comms" and fields[1] in _RESTART_FROM_PHASES
+
+
+def _iter_history_lines(mm: Any, start: int, end: int) -> Iterator[Tuple[int, bytes]]:
+    """Yield (offset, line) for complete lines in mm[start:end], skipping the CSV header."""
+    pos = start
+    while pos < end:
+        nl = mm.find(b"\n", pos, end)
+        if nl == -1:
+            break  # partial trailing line: picked up once it is complete
+        line = mm[pos:nl].rstrip(b"\r")
+        if line and line != _HISTORY_HEADER_BYTES:
+            yield pos, line
+        pos = nl + 1
+
+
+@contextlib.contextmanager
+def _mmap_history(history_path: Path) -> Iterator[Any]:
+    with history_path.open("rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+
+def _read_index_state(f: Any) -> Optional[_HistoryIndexState]:
+    f.seek(0)
+    header = f.read(_INDEX_HEADER_LEN).decode("ascii", "replace")
+    parts = dict(p.split("=", 1) for p in header.split()[1:] if "=" in p)
+    if not header.startswith("HIDX1 ") or len(parts) != 5:
+        return None
+    return _HistoryIndexState(
+        every=int(parts["every"]),
+        rows=int(parts["rows"]),
+        cycle=int(parts["cycle"]),
+        end=int(parts["end"]),
+        isize=int(parts["isize"]),
+    )
+
+
+def update_history_index(history_path: Path, *, every: int = HISTORY_INDEX_EVERY) -> None:
+    """Bring the sidecar index up to date, creating it if missing.
+
+    Only CSV rows past the last indexed offset are read, so keeping it current from
+    append_history costs O(rows appended). A missing or unreadable index is rebuilt.
+    """
+    idx_path = history_index_path(history_path)
+    # Not O_APPEND: the header is rewritten in place at offset 0.
+    with os.fdopen(os.open(idx_path, os.O_RDWR | os.O_CREAT, 0o644), "r+b") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        state = _read_index_state(f) if f.seek(0, os.SEEK_END) >= _INDEX_HEADER_LEN else None
+        csv_size = history_path.stat().st_size if history_path.exists() else 0
+        if state is None or state.end > csv_size:
+            state = _HistoryIndexState(every=every)  # missing, corrupt, or the CSV was replaced
+
+        new_entries: List[str] = []
+        if csv_size > state.end:
+            with _mmap_history(history_path) as mm:
+                scan_from = state.end
+                for offset, line in _iter_history_lines(mm, scan_from, csv_size):
+                    fields = line.split(b",")
+                    if len(fields) != len(HISTORY_HEADER):
+                        continue
+                    if state.rows % state.every == 0:
+                        epoch = _parse_history_timestamp(fields[0].decode("utf-8", "replace"))
+                        # No checkpoint on an unreadable timestamp: a made-up epoch would break
+                        # the non-decreasing order bisect relies on; queries start one earlier.
+                        if epoch is not None:
+                            new_entries.append(f"{state.rows},{offset},{state.cycle},{epoch}\n")
+                    if _is_restart_row(fields):
+                        state.cycle += 1
+                    state.rows += 1
+                # Consume up to the last complete line; a torn trailing line is indexed next time.
+                last_newline = mm.rfind(b"\n", scan_from, csv_size)
+                if last_newline != -1:
+                    state.end = last_newline + 1
+
+        f.truncate(state.isize)
+        if new_entries:
+            f.seek(state.isize)
+            f.write("".join(new_entries).encode("ascii"))
+            state.isize += sum(len(e) for e in new_entries)
+        # Commit point: the header now covers the entries written above.
+        f.seek(0)
+        f.write(_INDEX_HEADER_FMT.format(state.every, state.rows, state.cycle, state.end, state.isize).encode("ascii"))
+
+
+def load_history_index(history_path: Path) -> List[HistoryIndexEntry]:
+    idx_path = history_index_path(history_path)
+    with idx_path.open("rb") as f:
+        state = _read_index_state(f)
+        if state is None:
+            return []
+        body = f.read(state.isize - _INDEX_HEADER_LEN).decode("ascii")
+    entries = []
+    for line in body.splitlines():
+        row, offset, cycle, epoch = line.split(",")
+        entries.append(HistoryIndexEntry(int(row), int(offset), int(cycle), float(epoch)))
+    return entries
+
+
+def query_history(
+    history_path: Path,
+    *,
+    phase: Optional[str] = None,
+    actor: Optional[str] = None,
+    since: Optional[float] = None,
+    until: Optional[float] = None,
+    cycle: Optional[int] = None,
+    use_index: bool = True,
+) -> Iterator[List[str]]:
+    """Yield history rows matching all given filters.
+
+    phase/actor match either side of the transition; since/until are epoch seconds
+    (inclusive). Timestamps are assumed non-decreasing, which is how the file is written.
+    With the index, time-range and cycle queries start from the nearest checkpoint and
+    stop as soon as rows move past the range instead of scanning the whole file.
+    """
+    start, start_cycle = 0, 0
+    if use_index and (since is not None or cycle is not None):
+        update_history_index(history_path)
+        entries = load_history_index(history_path)
+        candidates = []
+        if since is not None:
+            # Last checkpoint strictly before `since`: rows sharing its timestamp may precede it.
+            # None: start at the top (the first checkpoint need not be row 0).
+            i = bisect.bisect_left([e.epoch for e in entries], since) - 1
+            if i >= 0:
+                candidates.append(entries[i])
+        if cycle is not None:
+            j = bisect.bisect_left([e.cycle for e in entries], cycle) - 1
+            if j >= 0:
+                candidates.append(entries[j])
+        if candidates and (since is None or cycle is None or len(candidates) == 2):
+            best = max(candidates, key=lambda e: e.offset)
+            start, start_cycle = best.offset, best.cycle
+
+    phase_b = phase.encode("utf-8") if phase else None
+    actor_b = actor.encode("utf-8") if actor else None
+    current_cycle = start_cycle
+    with _mmap_history(history_path) as mm:
+        for _offset, line in _iter_history_lines(mm, start, len(mm)):
+            fields = line.split(b",")
+            if len(fields) != len(HISTORY_HEADER):
+                continue
+            if _is_restart_row(fields):
+                current_cycle += 1
+            if cycle is not None:
+                if current_cycle < cycle:
+                    continue
+                if current_cycle > cycle:
+                    break
+            if since is not None or until is not None:
+                epoch = _parse_history_timestamp(fields[0].decode("utf-8", "replace"))
+                if epoch is None or (since is not None and epoch < since):
+                    continue
+                if until is not None and epoch > until:
+                    break
+            if phase_b is not None and phase_b not in (fields[1], fields[4]):
+                continue
+            if actor_b is not None and actor_b not in (fields[3], fields[5]):
+                continue
+            yield [field.decode("utf-8") for field in fields]
+
+
+# --- History analytics ---------------------------------------------------------------
+#
+# One streaming pass over history rows. The time between two consecutive rows belongs to
+# the state the first one transitioned *to*, so each interval is charged to that phase and
+# to its owner or reviewer. A phase visit lasts from the row entering the phase to the row
+# leaving it; a reviewer -> owner row within one phase is a changes_requested loop.
+
+STATS_QUANTILES = (0.5, 0.9, 0.99)
+
+
+class StreamingHistogram:
+    """Log-bucketed histogram for quantiles in constant memory.
+
+    Buckets grow by 5%, so reported quantiles are within ~2.5% of the exact value;
+    a few hundred buckets cover everything from one second to decades.
+    """
+
+    GROWTH = 1.05
+    _LOG_GROWTH = math.log(GROWTH)
+
+    def __init__(self) -> None:
+        self.buckets: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float) -> None:
+        bucket = -1 if value < 1.0 else int(math.log(value) / self._LOG_GROWTH)
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(q * self.count))
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= rank:
+                estimate = 0.0 if bucket < 0 else self.GROWTH ** (bucket + 0.5)
+                return min(max(estimate, self.min), self.max)
+        return self.max
+
+
+@dataclass
+class PhaseStats:
+    durations: StreamingHistogram
+    owner_seconds: float = 0.0
+    reviewer_seconds: float = 0.0
+    other_seconds: float = 0.0
+    review_loops: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        d = self.durations
+        return {
+            "visits": d.count,
+            "total_seconds": round(d.total, 3),
+            "mean_seconds": round(d.total / d.count, 3) if d.count else 0.0,
+            **{f"p{round(q * 100)}_seconds": round(d.quantile(q), 3) for q in STATS_QUANTILES},
+            "owner_seconds": round(self.owner_seconds, 3),
+            "reviewer_seconds": round(self.reviewer_seconds, 3),
+            "other_seconds": round(self.other_seconds, 3),
+            "review_loops": self.review_loops,
+        }
+
+
+# (epoch seconds, from_phase, from_actor, to_phase, to_actor)
+TransitionEvent = Tuple[float, str, str, str, str]
+
+
+def _events_from_rows(rows: Iterable[List[str]]) -> Iterator[TransitionEvent]:
+    for row in rows:
+        epoch = _parse_history_timestamp(row[0])
+        if epoch is not None:
+            yield epoch, row[1], row[3], row[4], row[5]
+
+
+def compute_history_stats(rows: Iterable[List[str]]) -> Dict[str, PhaseStats]:
+    """Per-phase durations, owner/reviewer time and review loops from CSV history rows."""
+    return compute_transition_stats(_events_from_rows(rows))
+
+
+def compute_transition_stats(events: Iterable[TransitionEvent]) -> Dict[str, PhaseStats]:
+    """Single pass over transition events (from the CSV or the binary log)."""
+    stats: Dict[str, PhaseStats] = {}
+
+    def phase_stats(phase: str) -> PhaseStats:
+        if phase not in stats:
+            stats[phase] = PhaseStats(StreamingHistogram())
+        return stats[phase]
+
+    prev_epoch: Optional[float] = None
+    prev_phase = prev_actor = ""
+    visit_started: Optional[float] = None
+
+    for epoch, from_phase, from_actor, to_phase, to_actor in events:
+        if prev_epoch is not None and epoch >= prev_epoch:
+            owner, reviewer = PHASE_ACTORS.get(prev_phase, (None, None))
+            elapsed = epoch - prev_epoch
+            current = phase_stats(prev_phase)
+            if prev_actor == owner:
+                current.owner_seconds += elapsed
+            elif reviewer and prev_actor == reviewer:
+                current.reviewer_seconds += elapsed
+            else:
+                current.other_seconds += elapsed
+
+        if from_phase == to_phase and from_phase in PHASE_ACTORS:
+            owner, reviewer = PHASE_ACTORS[from_phase]
+            if reviewer and from_actor == reviewer and to_actor == owner:
+                phase_stats(from_phase).review_loops += 1
+
+        if to_phase != prev_phase:
+            if visit_started is not None and prev_phase and epoch >= visit_started:
+                phase_stats(prev_phase).durations.add(epoch - visit_started)
+            visit_started = epoch
+
+        prev_epoch, prev_phase, prev_actor = epoch, to_phase, to_actor
+
+    # The last visit is still open and is deliberately not counted.
+    return stats
+
+
+def _ordered_phases(stats: Dict[str, PhaseStats]) -> List[str]:
+    return [p for p in PHASES if p in stats] + sorted(p for p in stats if p not in PHASES)
+
+
+def _format_seconds(seconds: float) -> str:
+    seconds = int(round(seconds))
+    if seconds < 60:
+        return f"{seconds}s"
+    if seconds < 3600:
+        return f"{seconds // 60}m{seconds % 60:02d}s"
+    if seconds < 86400:
+        return f"{seconds // 3600}h{seconds % 3600 // 60:02d}m"
+    return f"{seconds // 86400}d{seconds % 86400 // 3600:02d}h"
+
+
+def _format_stats_table(stats: Dict[str, PhaseStats]) -> str:
+    headers = ["phase", "visits", "p50", "p90", "p99", "owner", "reviewer", "loops"]
+    table = [headers]
+    for phase in _ordered_phases(stats):
+        st = stats[phase]
+        table.append(
+            [
+                phase,
+                str(st.durations.count),
+                *(_format_seconds(st.durations.quantile(q)) for q in STATS_QUANTILES),
+                _format_seconds(st.owner_seconds),
+                _format_seconds(st.reviewer_seconds),
+                str(st.review_loops),
+            ]
+        )
+    widths = [max(len(r[i]) for r in table) for i in range(len(headers))]
+    return "\n".join(
+        "  ".join(cell.ljust(w) if i == 0 else cell.rjust(w) for i, (cell, w) in enumerate(zip(r, widths)))
+        for r in table
+    )
+
+
+# --- Binary history log --------------------------------------------------------------
+#
+# status_history.bin is an optional, append-only mirror of status_history.csv. After a
+# 16-byte file header every record is 16 bytes: int64 epoch microseconds, int16 UTC offset
+# in minutes (or a marker for "Z"/naive), then one uint8 code per string column. Codes
+# index status_history.bin.vocab (one JSON string per line), which is seeded from
+# PHASES/PHASE_ACTORS when the log is created and only ever appended to, so existing codes
+# never change meaning. Like the .idx sidecar, appends are mirrored only while the file
+# exists; create it with `orchestrator.py binlog build`. If mirroring an append fails,
+# status_history.bin.stale records the CSV it mirrors, appends stop, and the next read
+# rebuilds the log from that CSV.
+
+_BIN_MAGIC = b"OHBIN1\x00\x00"
+_BIN_HEADER = struct.Struct("<8sII")  # magic, record size, reserved
+_BIN_RECORD = struct.Struct("<qh6B")
+_BIN_TZ_Z = 0x7FFF
+_BIN_TZ_NAIVE = 0x7FFE
+_BIN_MAX_VOCAB = 256
+_BIN_CHUNK_RECORDS = 65536
+_UNIX_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def binary_history_path(history_path: Path) -> Path:
+    return history_path.with_suffix(".bin")
+
+
+def _binary_vocab_path(bin_path: Path) -> Path:
+    return bin_path.with_name(bin_path.name + ".vocab")
+
+
+def _binary_stale_path(bin_path: Path) -> Path:
+    return bin_path.with_name(bin_path.name + ".stale")
+
+
+def _mark_binary_history_stale(bin_path: Path, history_path: Path) -> None:
+    try:
+        _binary_stale_path(bin_path).write_text(str(history_path.resolve()) + "\n", encoding="utf-8")
+    except OSError as e:
+        print(f"WARN: failed to mark {bin_path} stale: {e}", file=sys.stderr)
+
+
+def _rebuild_stale_binary_history(bin_path: Path) -> None:
+    """Rebuild the log from its CSV if an append failed to reach it."""
+    stale_path = _binary_stale_path(bin_path)
+    try:
+        history_path = Path(stale_path.read_text(encoding="utf-8").strip())
+    except FileNotFoundError:
+        return
+    print(f"WARN: {bin_path} missed an append; rebuilding it from {history_path}", file=sys.stderr)
+    history_csv_to_binary(history_path, bin_path)
+
+
+def _canonical_vocab() -> List[str]:
+    actors = sorted({a for pair in PHASE_ACTORS.values() for a in pair if a})
+    statuses = sorted(PHASE_STATUSES - {""})
+    return ["", *PHASES, *[a for a in actors if a not in PHASES], *statuses]
+
+
+def read_binary_vocab(bin_path: Path) -> List[str]:
+    with _binary_vocab_path(bin_path).open("r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def _encode_timestamp(value: str) -> Optional[Tuple[int, int]]:
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        return (parsed.replace(tzinfo=timezone.utc) - _UNIX_EPOCH) // timedelta(microseconds=1), _BIN_TZ_NAIVE
+    offset = parsed.utcoffset() or timedelta(0)
+    tz = _BIN_TZ_Z if value.endswith("Z") else offset // timedelta(minutes=1)
+    return (parsed - _UNIX_EPOCH) // timedelta(microseconds=1), tz
+
+
+def _decode_timestamp(epoch_us: int, tz: int) -> str:
+    moment = _UNIX_EPOCH + timedelta(microseconds=epoch_us)
+    if tz == _BIN_TZ_NAIVE:
+        return moment.replace(tzinfo=None).isoformat()
+    if tz == _BIN_TZ_Z:
+        return moment.isoformat().replace("+00:00", "Z")
+    return moment.astimezone(timezone(timedelta(minutes=tz))).isoformat()
+
+
+def create_binary_history(bin_path: Path) -> None:
+    """Create an empty binary log (truncating any existing one) with the canonical vocabulary."""
+    vocab_path = _binary_vocab_path(bin_path)
+    vocab_path.write_text("".join(json.dumps(v) + "\n" for v in _canonical_vocab()), encoding="utf-8")
+    with bin_path.open("wb") as f:
+        f.write(_BIN_HEADER.pack(_BIN_MAGIC, _BIN_RECORD.size, 0))
+
+
+def append_binary_history(bin_path: Path, rows: List[List[str]]) -> int:
+    """Append CSV-shaped rows to the binary log; returns the number of rows skipped.
+
+    Rows whose timestamp cannot be parsed have no binary representation and are skipped.
+    New strings are added to the vocabulary before any record referencing them is written.
+    """
+    with bin_path.open("ab") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        vocab = read_binary_vocab(bin_path)
+        codes = {value: code for code, value in enumerate(vocab)}
+        new_strings: List[str] = []
+        records: List[bytes] = []
+        skipped = 0
+
+        for row in rows:
+            encoded = _encode_timestamp(row[0]) if len(row) == len(HISTORY_HEADER) else None
+            if encoded is None:
+                skipped += 1
+                continue
+            row_codes = []
+            for value in row[1:]:
+                code = codes.get(value)
+                if code is None:
+                    code = len(vocab)
+                    if code >= _BIN_MAX_VOCAB:
+                        raise ValueError(f"{bin_path} vocabulary is full ({_BIN_MAX_VOCAB} strings)")
+                    vocab.append(value)
+                    codes[value] = code
+                    new_strings.append(value)
+                row_codes.append(code)
+            records.append(_BIN_RECORD.pack(*encoded, *row_codes))
+
+        if new_strings:
+            with _binary_vocab_path(bin_path).open("a", encoding="utf-8") as vf:
+                vf.write("".join(json.dumps(v) + "\n" for v in new_strings))
+        f.write(b"".join(records))
+    return skipped
+
+
+def iter_binary_history_records(bin_path: Path) -> Iterator[Tuple[int, ...]]:
+    """Yield raw (epoch_us, tz, 6 codes) tuples straight from an mmap of the log.
+
+    Only small ints are produced per record; map codes through read_binary_vocab()
+    (shared strings) when names are needed.
+    """
+    with bin_path.open("rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < _BIN_HEADER.size:
+            raise ValueError(f"{bin_path} is not a binary history log")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            magic, record_size, _reserved = _BIN_HEADER.unpack_from(mm, 0)
+            if magic != _BIN_MAGIC or record_size != _BIN_RECORD.size:
+                raise ValueError(f"{bin_path} is not a binary history log")
+            end = _BIN_HEADER.size + (size - _BIN_HEADER.size) // record_size * record_size
+            chunk = _BIN_CHUNK_RECORDS * record_size
+            for start in range(_BIN_HEADER.size, end, chunk):
+                yield from _BIN_RECORD.iter_unpack(mm[start : min(start + chunk, end)])
+
+
+def iter_binary_history_events(
+    bin_path: Path, *, since: Optional[float] = None, until: Optional[float] = None
+) -> Iterator[TransitionEvent]:
+    _rebuild_stale_binary_history(bin_path)
+    vocab = read_binary_vocab(bin_path)
+    since_us = None if since is None else since * 1e6
+    until_us = None if until is None else until * 1e6
+    for epoch_us, _tz, from_phase, _fps, from_actor, to_phase, to_actor, _tps in iter_binary_history_records(bin_path):
+        if since_us is not None and epoch_us < since_us:
+            continue
+        if until_us is not None and epoch_us > until_us:
+            break
+        yield epoch_us / 1e6, vocab[from_phase], vocab[from_actor], vocab[to_phase], vocab[to_actor]
+
+
+def history_csv_to_binary(history_path: Path, bin_path: Path) -> Tuple[int, int]:
+    """(Re)build the binary log from the CSV; returns (rows written, rows skipped)."""
+    create_binary_history(bin_path)
+    written = skipped = 0
+    batch: List[List[str]] = []
+    for row in query_history(history_path, use_index=False):
+        batch.append(row)
+        if len(batch) >= _BIN_CHUNK_RECORDS:
+            n = append_binary_history(bin_path, batch)
+            written, skipped, batch = written + len(batch) - n, skipped + n, []
+    n = append_binary_history(bin_path, batch)
+    _binary_stale_path(bin_path).unlink(missing_ok=True)
+    return written + len(batch) - n, skipped + n
+
+
+def history_binary_to_csv(bin_path: Path, out: Any) -> int:
+    """Write the binary log as status_history.csv text to a file object; returns rows written."""
+    _rebuild_stale_binary_history(bin_path)
+    vocab = read_binary_vocab(bin_path)
+    out.write(",".join(HISTORY_HEADER) + "\n")
+    count = 0
+    for epoch_us, tz, *codes in iter_binary_history_records(bin_path):
+        out.write(",".join([_decode_timestamp(epoch_us, tz), *(vocab[c] for c in codes)]) + "\n")
+        count += 1
+    return count
 
 
 def _format_issues(issues: List[ValidationIssue]) -> str:
@@ -345,9 +1623,17 @@ def _format_issues(issues: List[ValidationIssue]) -> str:
 
 
 def _cmd_validate(args: argparse.Namespace) -> int:
+    if args.glob:
+        return _cmd_validate_glob(args)
+    if args.changed_since:
+        print("ERROR: --changed-since requires --glob", file=sys.stderr)
+        return 1
+    if args.all:
+        return _cmd_batch(args, _batch_validate)
+
     status_path = Path(args.status_file)
     try:
-        status = _load_json(status_path)
+        status = _load_status(args)
     except Exception as e:
         print(f"ERROR: Failed to load {status_path}: {e}", file=sys.stderr)
         return 1
@@ -365,9 +1651,12 @@ def _cmd_validate(args: argparse.Namespace) -> int:
 
 
 def _cmd_reconcile(args: argparse.Namespace) -> int:
+    if args.all:
+        return _cmd_batch(args, _batch_reconcile)
+
     status_path = Path(args.status_file)
     try:
-        status = _load_json(status_path)
+        status = _load_status(args, mutable=True)
     except Exception as e:
         print(f"ERROR: Failed to load {status_path}: {e}", file=sys.stderr)
         return 1
@@ -378,7 +1667,7 @@ def _cmd_reconcile(args: argparse.Namespace) -> int:
         return 0
 
     if args.apply:
-        _atomic_write_json(status_path, status)
+        _write_status(args, status)
         print("Reconciled gates and wrote status.json.")
     else:
         print("Reconciliation changes available (run with --apply to write).")
@@ -388,7 +1677,7 @@ def _cmd_reconcile(args: argparse.Namespace) -> int:
 def _cmd_next(args: argparse.Namespace) -> int:
     status_path = Path(args.status_file)
     try:
-        status = _load_json(status_path)
+        status = _load_status(args)
     except Exception as e:
         print(f"ERROR: Failed to load {status_path}: {e}", file=sys.stderr)
         return 1
@@ -408,11 +1697,14 @@ def _cmd_next(args: argparse.Namespace) -> int:
 
 
 def _cmd_step(args: argparse.Namespace) -> int:
+    if args.all:
+        return _cmd_batch(args, _batch_step)
+
     status_path = Path(args.status_file)
     history_path = Path(args.history_file)
 
     try:
-        status = _load_json(status_path)
+        status = _load_status(args, mutable=True)
     except Exception as e:
         print(f"ERROR: Failed to load {status_path}: {e}", file=sys.stderr)
         return 1
@@ -421,34 +1713,162 @@ def _cmd_step(args: argparse.Namespace) -> int:
         print("Workflow is already done. Use `orchestrator.py restart --apply` to start over.")
         return 0
 
-    if args.reconcile:
-        reconcile_gates(status)
-
-    patch = compute_next_transition(status)
-    if not patch:
+    max_steps = args.max_steps if args.until_blocked else 1
+    transitions = advance_status(status, max_steps=max_steps, reconcile=args.reconcile)
+    if not transitions:
         print("No orchestrator transition available (waiting on current actor/reviewer).")
         return 0
 
-    from_status = dict(status)
-    status.update(patch)
-    to_status = status
-
     if args.apply:
-        _atomic_write_json(status_path, status)
-        append_history(history_path, from_status=from_status, to_status=to_status)
-        print(
-            f"Transitioned {from_status.get('current_phase')}:{from_status.get('current_actor')} -> "
-            f"{to_status.get('current_phase')}:{to_status.get('current_actor')}"
-        )
+        # One write and one history append, however many transitions were applied.
+        _write_status(args, status)
+        timestamp = _utc_now_iso()
+        append_history_rows(history_path, [_history_row(f, t, timestamp) for f, t in transitions])
+        for from_status, to_status in transitions:
+            print(
+                f"Transitioned {from_status.get('current_phase')}:{from_status.get('current_actor')} -> "
+                f"{to_status.get('current_phase')}:{to_status.get('current_actor')}"
+            )
     else:
-        print(
-            "Dry-run transition:\n"
-            f"  from {from_status.get('current_phase')}:{from_status.get('current_actor')} "
-            f"({from_status.get('phase_status')})\n"
-            f"  to   {to_status.get('current_phase')}:{to_status.get('current_actor')} "
-            f"({to_status.get('phase_status')})\n"
-            "Run with --apply to write status.json and append history."
+        print("Dry-run transition:" if len(transitions) == 1 else f"Dry-run transitions ({len(transitions)}):")
+        for from_status, to_status in transitions:
+            print(
+                f"  from {from_status.get('current_phase')}:{from_status.get('current_actor')} "
+                f"({from_status.get('phase_status')})\n"
+                f"  to   {to_status.get('current_phase')}:{to_status.get('current_actor')} "
+                f"({to_status.get('phase_status')})"
+            )
+        print("Run with --apply to write status.json and append history.")
+
+    if args.until_blocked and len(transitions) == max_steps and compute_next_transition(status):
+        print(f"Stopped after --max-steps={max_steps}; more transitions are available.")
+    return 0
+
+
+def _positive_int_arg(value: str) -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def _parse_time_arg(value: Optional[str]) -> Optional[float]:
+    if value is None:
+        return None
+    epoch = _parse_history_timestamp(value)
+    if epoch is None:
+        raise ValueError(f"invalid ISO timestamp: {value}")
+    return epoch
+
+
+def _cmd_history(args: argparse.Namespace) -> int:
+    history_path = Path(args.history_file)
+    if not history_path.exists():
+        print(f"ERROR: {history_path} does not exist", file=sys.stderr)
+        return 1
+
+    try:
+        if args.reindex:
+            history_index_path(history_path).unlink(missing_ok=True)
+            update_history_index(history_path)
+        rows = query_history(
+            history_path,
+            phase=args.phase,
+            actor=args.actor,
+            since=_parse_time_arg(args.since),
+            until=_parse_time_arg(args.until),
+            cycle=args.cycle,
+            use_index=not args.no_index,
         )
+        print(",".join(HISTORY_HEADER))
+        for n, row in enumerate(rows):
+            if args.limit is not None and n >= args.limit:
+                break
+            print(",".join(row))
+    except (OSError, ValueError) as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def _cmd_stats(args: argparse.Namespace) -> int:
+    history_path = Path(args.history_file)
+    if not args.binary_file and not history_path.exists():
+        print(f"ERROR: {history_path} does not exist", file=sys.stderr)
+        return 1
+
+    try:
+        if args.binary_file:
+            if args.cycle is not None:
+                raise ValueError("--cycle is not supported with --binary-file")
+            events = iter_binary_history_events(
+                Path(args.binary_file), since=_parse_time_arg(args.since), until=_parse_time_arg(args.until)
+            )
+            stats = compute_transition_stats(events)
+        else:
+            rows = query_history(
+                history_path,
+                since=_parse_time_arg(args.since),
+                until=_parse_time_arg(args.until),
+                cycle=args.cycle,
+            )
+            stats = compute_history_stats(rows)
+    except (OSError, ValueError) as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 1
+
+    if args.format == "json":
+        print(json.dumps({phase: stats[phase].to_dict() for phase in _ordered_phases(stats)}, indent=2))
+    else:
+        print(_format_stats_table(stats))
+    return 0
+
+
+def _cmd_binlog(args: argparse.Namespace) -> int:
+    history_path = Path(args.history_file)
+    bin_path = Path(args.binary_file) if args.binary_file else binary_history_path(history_path)
+    try:
+        if args.action == "build":
+            written, skipped = history_csv_to_binary(history_path, bin_path)
+            csv_size, bin_size = history_path.stat().st_size, bin_path.stat().st_size
+            print(f"Wrote {written} records to {bin_path} ({bin_size} bytes vs {csv_size} CSV bytes).")
+            if skipped:
+                print(f"WARN: skipped {skipped} rows with unparsable timestamps", file=sys.stderr)
+            print("Further history appends are mirrored while the file exists.")
+        elif args.output:
+            with open(args.output, "w", encoding="utf-8") as out:
+                count = history_binary_to_csv(bin_path, out)
+            print(f"Wrote {count} rows to {args.output}.")
+        else:
+            history_binary_to_csv(bin_path, sys.stdout)
+    except (OSError, ValueError) as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def _cmd_journal(args: argparse.Namespace) -> int:
+    status_path = Path(args.status_file)
+    journal_path = status_journal_path(status_path)
+    try:
+        if args.action == "enable":
+            enable_status_journal(status_path)
+            print(f"Journaling enabled: writes append patches to {journal_path}.")
+            print("status.json is only current after `journal compact`; orchestrator and bot read through the journal.")
+        else:
+            if not journal_path.exists():
+                print(f"No journal at {journal_path}.")
+                return 0
+            version, folded = compact_status_journal(status_path, remove=args.action == "disable")
+            print(f"Folded {folded} journal bytes into {status_path} (version {version}).")
+            if args.action == "disable":
+                print("Journaling disabled.")
+    except (OSError, ValueError) as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 1
     return 0
 
 
@@ -457,7 +1877,7 @@ def _cmd_restart(args: argparse.Namespace) -> int:
     history_path = Path(args.history_file)
 
     try:
-        status = _load_json(status_path)
+        status = _load_status(args, mutable=True)
     except Exception as e:
         print(f"ERROR: Failed to load {status_path}: {e}", file=sys.stderr)
         return 1
@@ -496,7 +1916,7 @@ def _cmd_restart(args: argparse.Namespace) -> int:
         status["timestamps"]["phase_ended_at"] = ""
 
     if args.apply:
-        _atomic_write_json(status_path, status)
+        _write_status(args, status)
         append_history(history_path, from_status=from_status, to_status=status)
         print("Workflow restarted at bootstrap_comms.")
     else:
@@ -504,18 +1924,421 @@ def _cmd_restart(args: argparse.Namespace) -> int:
     return 0
 
 
+@dataclass(frozen=True)
+class BatchResult:
+    path: Path
+    outcome: str  # "advanced" | "blocked" | "done" | "changed" | "unchanged" | "valid" | "invalid"
+    detail: str = ""
+
+
+# Report order; outcomes listed here but absent from a run are omitted.
+_BATCH_OUTCOMES = ["advanced", "changed", "valid", "blocked", "unchanged", "done", "invalid"]
+
+
+def _find_status_files(root: Path, name: str) -> List[Path]:
+    return sorted(p for p in root.rglob(name) if p.is_file())
+
+
+def _batch_load(path: Path) -> Tuple[Optional[Dict[str, Any]], StatusVersion, Optional[BatchResult]]:
+    """Load and validate one workflow; returns (status, version, None) or (None, _, invalid result)."""
+    try:
+        status, version = read_status_versioned(path)
+    except Exception as e:
+        return None, StatusVersion(0, None), BatchResult(path, "invalid", f"failed to load: {e}")
+    errors = [i for i in validate_status(status) if i.level == "error"]
+    if errors:
+        more = f" (+{len(errors) - 1} more)" if len(errors) > 1 else ""
+        return None, version, BatchResult(path, "invalid", errors[0].message + more)
+    return status, version, None
+
+
+def _batch_validate(path: Path, args: argparse.Namespace) -> BatchResult:
+    return _validate_file(str(path), args.strict)[0]
+
+
+def _batch_reconcile(path: Path, args: argparse.Namespace) -> BatchResult:
+    status, version, invalid = _batch_load(path)
+    if status is None:
+        return invalid  # type: ignore[return-value]
+    if not reconcile_gates(status):
+        return BatchResult(path, "unchanged")
+    if args.apply:
+        cas_write_status(path, status, version)
+    return BatchResult(path, "changed", "written" if args.apply else "dry-run")
+
+
+def _batch_step(path: Path, args: argparse.Namespace) -> BatchResult:
+    status, version, invalid = _batch_load(path)
+    if status is None:
+        return invalid  # type: ignore[return-value]
+    if status.get("current_phase") == "done" and status.get("phase_status") == "completed":
+        return BatchResult(path, "done")
+
+    transitions = advance_status(
+        status, max_steps=args.max_steps if args.until_blocked else 1, reconcile=args.reconcile
+    )
+    if not transitions:
+        return BatchResult(path, "blocked", f"waiting on {status.get('current_phase')}:{status.get('current_actor')}")
+
+    if args.apply:
+        cas_write_status(path, status, version)
+        # Each workflow keeps its history next to its status file.
+        timestamp = _utc_now_iso()
+        append_history_rows(
+            path.parent / Path(args.history_file).name, [_history_row(f, t, timestamp) for f, t in transitions]
+        )
+    first = transitions[0][0]
+    steps = f" ({len(transitions)} steps)" if len(transitions) > 1 else ""
+    return BatchResult(
+        path,
+        "advanced",
+        f"{first.get('current_phase')}:{first.get('current_actor')} -> "
+        f"{status.get('current_phase')}:{status.get('current_actor')}{steps}",
+    )
+
+
+def run_batch(
+    paths: List[Path], worker: Any, args: argparse.Namespace, workers: Optional[int] = None
+) -> List[BatchResult]:
+    """Run `worker(path, args)` over all workflows concurrently; never raises per file."""
+
+    def run_one(path: Path) -> BatchResult:
+        try:
+            return _retry_on_conflict(lambda: worker(path, args))
+        except Exception as e:
+            return BatchResult(path, "invalid", f"{type(e).__name__}: {e}")
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(run_one, paths))
+
+
+def _format_batch_report(results: List[BatchResult], root: Path, list_outcomes: Optional[Iterable[str]] = None) -> str:
+    by_outcome: Dict[str, List[BatchResult]] = {}
+    for result in results:
+        by_outcome.setdefault(result.outcome, []).append(result)
+
+    lines = []
+    for outcome in _BATCH_OUTCOMES:
+        group = by_outcome.get(outcome, [])
+        if not group or (list_outcomes is not None and outcome not in list_outcomes):
+            continue  # still counted in the summary line
+        lines.append(f"{outcome} ({len(group)}):")
+        for result in group:
+            rel = os.path.relpath(result.path, root)
+            lines.append(f"  {rel}: {result.detail}" if result.detail else f"  {rel}")
+
+    counts = ", ".join(f"{len(by_outcome[o])} {o}" for o in _BATCH_OUTCOMES if o in by_outcome)
+    lines.append(f"Summary: {len(results)} workflow(s) - {counts or 'nothing found'}")
+    return "\n".join(lines)
+
+
+def _cmd_batch(args: argparse.Namespace, worker: Any) -> int:
+    root = Path(args.all)
+    if not root.is_dir():
+        print(f"ERROR: {root} is not a directory", file=sys.stderr)
+        return 1
+
+    paths = _find_status_files(root, Path(args.status_file).name)
+    results = run_batch(paths, worker, args, workers=args.workers)
+    print(_format_batch_report(results, root))
+    if getattr(args, "apply", True) is False and any(r.outcome in ("advanced", "changed") for r in results):
+        print("Dry-run: run with --apply to write the changes.")
+    return 1 if any(r.outcome == "invalid" for r in results) else 0
+
+
+# Below this many files `validate --glob` runs in-process; a pool costs more than it saves.
+_VALIDATE_POOL_MIN_FILES = 32
+
+
+def _validation_key(signature: Optional[StatusSignature]) -> Optional[List[int]]:
+    """(mtime_ns, size, journal size) - what --changed-since compares."""
+    return None if signature is None else [signature[1], signature[2], signature[3]]
+
+
+def _validate_file(path: str, strict: bool) -> Tuple[BatchResult, Optional[List[int]], int]:
+    """Validate one file; returns (result, validation key of what was read, warning count)."""
+    try:
+        # The signature comes from the descriptors parsed, so a cached key describes exactly this content.
+        status, version = read_status_versioned(Path(path))
+        key = _validation_key(version.signature)
+    except Exception as e:
+        return BatchResult(Path(path), "invalid", f"failed to load: {e}"), None, 0
+
+    issues = _STATUS_VALIDATOR.validate(status)
+    errors = [i for i in issues if i.level == "error"]
+    warnings = [i for i in issues if i.level == "warning"]
+    if errors:
+        more = f" (+{len(errors) - 1} more)" if len(errors) > 1 else ""
+        return BatchResult(Path(path), "invalid", errors[0].message + more), key, len(warnings)
+    if warnings and strict:
+        return (
+            BatchResult(Path(path), "invalid", f"{len(warnings)} warning(s): {warnings[0].message}"),
+            key,
+            len(warnings),
+        )
+    return BatchResult(Path(path), "valid", f"{len(warnings)} warning(s)" if warnings else ""), key, len(warnings)
+
+
+def _load_validation_cache(cache_path: Path) -> Dict[str, List[int]]:
+    """{path: [mtime_ns, size, journal size, warnings]} of files that last validated cleanly."""
+    try:
+        data = _load_json(cache_path)
+    except (OSError, ValueError):
+        return {}
+    if data.get("validator") != _STATUS_VALIDATOR.fingerprint or not isinstance(data.get("files"), dict):
+        return {}
+    return data["files"]
+
+
+def validate_files(
+    paths: List[str],
+    *,
+    strict: bool = False,
+    workers: Optional[int] = None,
+    cache_path: Optional[Path] = None,
+) -> List[BatchResult]:
+    """Validate many status files, over a process pool when there are enough of them.
+
+    With `cache_path`, files whose (mtime_ns, size, journal size) match their last clean validation are
+    reported as "unchanged" without being read, and the cache is updated afterwards.
+    """
+    cache = _load_validation_cache(cache_path) if cache_path is not None else {}
+    results: Dict[str, BatchResult] = {}
+    todo: List[str] = []
+    for path in paths:
+        entry = cache.get(path)
+        if entry is not None and not (strict and entry[-1]):
+            try:
+                if _validation_key(status_signature(Path(path))) == entry[:-1]:
+                    results[path] = BatchResult(Path(path), "unchanged", "cached")
+                    continue
+            except OSError:
+                pass
+        todo.append(path)
+
+    if workers != 1 and len(todo) >= _VALIDATE_POOL_MIN_FILES:
+        n_workers = workers or os.cpu_count() or 1
+        chunksize = max(1, len(todo) // (n_workers * 4))
+        with ProcessPoolExecutor(max_workers=n_workers) as pool:
+            outcomes = list(pool.map(_validate_file, todo, [strict] * len(todo), chunksize=chunksize))
+    else:
+        outcomes = [_validate_file(path, strict) for path in todo]
+
+    for path, (result, key, warnings) in zip(todo, outcomes):
+        results[path] = result
+        if result.outcome == "valid" and key is not None:
+            cache[path] = [*key, warnings]
+        else:
+            cache.pop(path, None)
+
+    if cache_path is not None:
+        _atomic_write_json(cache_path, {"validator": _STATUS_VALIDATOR.fingerprint, "files": cache})
+    return [results[path] for path in paths]
+
+
+def _cmd_validate_glob(args: argparse.Namespace) -> int:
+    paths = sorted(os.path.abspath(p) for p in glob.glob(args.glob, recursive=True) if os.path.isfile(p))
+    cache_path = Path(args.changed_since) if args.changed_since else None
+    try:
+        results = validate_files(paths, strict=args.strict, workers=args.workers, cache_path=cache_path)
+    except OSError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 1
+    # Thousands of files: only list the ones that need attention.
+    print(_format_batch_report(results, Path.cwd(), list_outcomes={"invalid"}))
+    return 1 if any(r.outcome == "invalid" for r in results) else 0
+
+
+# Commands the daemon answers; anything else always runs in-process.
+_DAEMON_HANDLERS = {
+    "validate": _cmd_validate,
+    "next": _cmd_next,
+    "step": _cmd_step,
+    "reconcile": _cmd_reconcile,
+}
+
+# CLI-only options that are never forwarded to the daemon.
+_CLIENT_ONLY_ARGS = {"func", "cmd", "socket", "no_daemon"}
+
+
+def _default_socket_path(status_path: Path) -> Path:
+    return status_path.parent / f".{status_path.name}.sock"
+
+
+class _DaemonRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        try:
+            request = json.loads(self.rfile.readline())
+            response = self.server.dispatch(request)  # type: ignore[attr-defined]
+        except Exception as e:
+            response = {"error": str(e)}
+        self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+
+
+class OrchestratorDaemon(socketserver.UnixStreamServer):
+    """UNIX-socket server answering validate/next/step/reconcile from in-memory state.
+
+    Requests are newline-delimited JSON: {"cmd": ..., "args": {...}}. They are handled one
+    at a time, which also serializes all writes to status.json made through the daemon.
+    """
+
+    def __init__(self, socket_path: Path, status_path: Path) -> None:
+        self.state = _DaemonState(status_path)
+        super().__init__(str(socket_path), _DaemonRequestHandler)
+
+    def dispatch(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        cmd = request.get("cmd")
+        if cmd == "ping":
+            return {"rc": 0, "stdout": "", "stderr": ""}
+        handler = _DAEMON_HANDLERS.get(str(cmd))
+        if handler is None:
+            return {"error": f"unsupported command: {cmd}"}
+
+        args = argparse.Namespace(**request.get("args", {}))
+        if Path(args.status_file) != self.state.status_path:
+            return {"error": f"daemon serves {self.state.status_path}, not {args.status_file}"}
+        args.daemon_state = self.state
+
+        out, err = io.StringIO(), io.StringIO()
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+            try:
+                rc = int(_retry_on_conflict(lambda: handler(args)))
+            except Exception as e:
+                # Report rather than return "error": the client must not retry a half-applied step.
+                print(f"ERROR: {cmd} failed in daemon: {e}", file=sys.stderr)
+                rc = 1
+        return {"rc": rc, "stdout": out.getvalue(), "stderr": err.getvalue()}
+
+
+def _daemon_request(socket_path: Path, request: Dict[str, Any], timeout: float = 30.0) -> Optional[Dict[str, Any]]:
+    """Send one request to a running daemon.
+
+    Returns None when no daemon is reachable (or it declined the request) so the caller can
+    fall back to running locally. Failures after the request was sent are raised instead,
+    because the daemon may already have applied it.
+    """
+    if not hasattr(socket, "AF_UNIX") or not socket_path.exists():
+        return None
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        try:
+            sock.connect(str(socket_path))
+        except OSError:
+            return None  # stale socket file
+        sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+        with sock.makefile("rb") as f:
+            line = f.readline()
+    finally:
+        sock.close()
+
+    if not line:
+        raise ConnectionError(f"orchestrator daemon at {socket_path} closed the connection")
+    response: Dict[str, Any] = json.loads(line)
+    if "error" in response:
+        return None
+    return response
+
+
+def _run_via_daemon(args: argparse.Namespace) -> Optional[int]:
+    """Forward a CLI invocation to the daemon if one is serving this status file."""
+    if args.no_daemon or args.cmd not in _DAEMON_HANDLERS or getattr(args, "all", None) or getattr(args, "glob", None):
+        return None
+
+    status_path = Path(args.status_file).resolve()
+    socket_path = Path(args.socket) if args.socket else _default_socket_path(status_path)
+
+    payload = {k: v for k, v in vars(args).items() if k not in _CLIENT_ONLY_ARGS}
+    payload["status_file"] = str(status_path)
+    if "history_file" in payload:
+        payload["history_file"] = str(Path(payload["history_file"]).resolve())
+
+    response = _daemon_request(socket_path, {"cmd": args.cmd, "args": payload})
+    if response is None:
+        return None
+    sys.stdout.write(response.get("stdout", ""))
+    sys.stderr.write(response.get("stderr", ""))
+    return int(response.get("rc", 1))
+
+
+def _raise_system_exit(signum: int, frame: Any) -> None:
+    raise SystemExit(0)
+
+
+def _cmd_serve(args: argparse.Namespace) -> int:
+    if not hasattr(socket, "AF_UNIX"):
+        print("ERROR: serve requires UNIX domain socket support", file=sys.stderr)
+        return 1
+
+    status_path = Path(args.status_file).resolve()
+    socket_path = Path(args.socket) if args.socket else _default_socket_path(status_path)
+
+    if _daemon_request(socket_path, {"cmd": "ping"}) is not None:
+        print(f"ERROR: an orchestrator daemon is already listening on {socket_path}", file=sys.stderr)
+        return 1
+    socket_path.unlink(missing_ok=True)  # left behind by a daemon that did not shut down cleanly
+
+    try:
+        server = OrchestratorDaemon(socket_path, status_path)
+    except OSError as e:
+        print(f"ERROR: Failed to bind {socket_path}: {e}", file=sys.stderr)
+        return 1
+
+    try:
+        server.state.load()
+    except Exception as e:
+        print(f"WARN: Failed to load {status_path}: {e} (will retry on each request)", file=sys.stderr)
+
+    signal.signal(signal.SIGTERM, _raise_system_exit)
+    print(f"Orchestrator daemon serving {status_path} on {socket_path}", flush=True)
+    try:
+        server.serve_forever()
+    except (KeyboardInterrupt, SystemExit):
+        pass
+    finally:
+        server.server_close()
+        socket_path.unlink(missing_ok=True)
+    return 0
+
+
+def _add_batch_arguments(p: argparse.ArgumentParser) -> None:
+    p.add_argument(
+        "--all",
+        metavar="DIR",
+        default=None,
+        help="Process every status file (same name as --status-file) under DIR and print a report",
+    )
+    p.add_argument("--workers", type=int, default=None, help="Worker threads for --all (processes for --glob)")
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(prog="orchestrator.py")
     parser.add_argument("--status-file", default="status.json")
+    parser.add_argument("--socket", default=None, help="Daemon socket (default: .<status-file>.sock)")
+    parser.add_argument("--no-daemon", action="store_true", help="Never forward commands to a running daemon")
 
     sub = parser.add_subparsers(dest="cmd", required=True)
 
     p_validate = sub.add_parser("validate", help="Validate status.json structure")
     p_validate.add_argument("--strict", action="store_true", help="Treat warnings as errors")
+    _add_batch_arguments(p_validate)
+    p_validate.add_argument(
+        "--glob", metavar="PATTERN", help="Validate every file matching PATTERN (** allowed) over a process pool"
+    )
+    p_validate.add_argument(
+        "--changed-since",
+        metavar="CACHE",
+        help=(
+            "With --glob: skip files whose (mtime_ns, size, journal size) is unchanged since they last"
+            " validated; a journal append alone re-validates. CACHE records them"
+        ),
+    )
     p_validate.set_defaults(func=_cmd_validate)
 
     p_reconcile = sub.add_parser("reconcile", help="Reconcile obvious inconsistencies (best effort)")
     p_reconcile.add_argument("--apply", action="store_true", help="Write changes to status.json")
+    _add_batch_arguments(p_reconcile)
     p_reconcile.set_defaults(func=_cmd_reconcile)
 
     p_next = sub.add_parser("next", help="Print current phase/actor mapping")
@@ -525,6 +2348,13 @@ def build_parser() -> argparse.ArgumentParser:
     p_step.add_argument("--history-file", default="status_history.csv")
     p_step.add_argument("--apply", action="store_true", help="Write status.json + append history")
     p_step.add_argument("--reconcile", action="store_true", help="Reconcile gates before stepping")
+    p_step.add_argument(
+        "--until-blocked",
+        action="store_true",
+        help="Keep applying transitions in memory until none is available, then write once",
+    )
+    p_step.add_argument("--max-steps", type=_positive_int_arg, default=50, help="Cap for --until-blocked (>= 1)")
+    _add_batch_arguments(p_step)
     p_step.set_defaults(func=_cmd_step)
 
     p_restart = sub.add_parser("restart", help="Restart workflow at bootstrap_comms")
@@ -534,13 +2364,60 @@ def build_parser() -> argparse.ArgumentParser:
     p_restart.add_argument("--clear-acks", action="store_true", help="Clear ack_requests")
     p_restart.set_defaults(func=_cmd_restart)
 
+    p_history = sub.add_parser("history", help="Query status_history.csv (indexed)")
+    p_history.add_argument("--history-file", default="status_history.csv")
+    p_history.add_argument("--phase", help="Rows transitioning from or to this phase")
+    p_history.add_argument("--actor", help="Rows transitioning from or to this actor")
+    p_history.add_argument("--since", help="ISO timestamp (inclusive)")
+    p_history.add_argument("--until", help="ISO timestamp (inclusive)")
+    p_history.add_argument("--cycle", type=int, help="Workflow cycle (restarts recorded in the history)")
+    p_history.add_argument("--limit", type=int, default=None)
+    p_history.add_argument("--no-index", action="store_true", help="Scan the whole file instead of using the index")
+    p_history.add_argument("--reindex", action="store_true", help="Rebuild the sidecar index first")
+    p_history.set_defaults(func=_cmd_history)
+
+    p_stats = sub.add_parser("stats", help="Phase durations, owner/reviewer time and review loops")
+    p_stats.add_argument("--history-file", default="status_history.csv")
+    p_stats.add_argument("--since", help="ISO timestamp (inclusive)")
+    p_stats.add_argument("--until", help="ISO timestamp (inclusive)")
+    p_stats.add_argument("--cycle", type=int, help="Workflow cycle (restarts recorded in the history)")
+    p_stats.add_argument("--format", choices=["table", "json"], default="table")
+    p_stats.add_argument("--binary-file", help="Read the binary history log instead of the CSV")
+    p_stats.set_defaults(func=_cmd_stats)
+
+    p_binlog = sub.add_parser("binlog", help="Convert between status_history.csv and the binary log")
+    p_binlog.add_argument("action", choices=["build", "export"], help="build: CSV -> binary, export: binary -> CSV")
+    p_binlog.add_argument("--history-file", default="status_history.csv")
+    p_binlog.add_argument("--binary-file", help="Binary log path (default: <history-file>.bin)")
+    p_binlog.add_argument("--output", help="export: write CSV here instead of stdout")
+    p_binlog.set_defaults(func=_cmd_binlog)
+
+    p_journal = sub.add_parser("journal", help="Append-only patch journal for status.json writes")
+    p_journal.add_argument(
+        "action",
+        choices=["enable", "compact", "disable"],
+        help="enable: start journaling, compact: fold the journal into status.json, disable: compact and stop",
+    )
+    p_journal.set_defaults(func=_cmd_journal)
+
+    p_serve = sub.add_parser("serve", help="Run a daemon that keeps status.json in memory")
+    p_serve.set_defaults(func=_cmd_serve)
+
     return parser
 
 
 def main(argv: Optional[List[str]] = None) -> int:
     parser = build_parser()
     args = parser.parse_args(argv)
-    return int(args.func(args))
+
+    rc = _run_via_daemon(args)
+    if rc is not None:
+        return rc
+    try:
+        return int(_retry_on_conflict(lambda: args.func(args)))
+    except StatusConflict as e:
+        print(f"ERROR: {e}; gave up after {STATUS_CAS_RETRIES} retries", file=sys.stderr)
+        return 1
 
 
 if __name__ == "__main__":
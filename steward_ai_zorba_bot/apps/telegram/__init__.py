@@ -1,7 +1,7 @@
 """Telegram chat channel implementation"""
 from .bot_config import Config
 from .message_processor import reverse_message
-from .telegram_handler import send_msg, reply, get_user_id, get_text
+from .telegram_handler import send_msg, reply, get_user_id, get_text, get_reply_to_id
 from .conversation_tracker import Tracker
 from .console_logger import Log
 from .app import run
@@ -13,6 +13,7 @@ __all__ = [
     'reply',
     'get_user_id',
     'get_text',
+    'get_reply_to_id',
     'Tracker',
     'Log',
     'run',  # ← Entry point for app selector
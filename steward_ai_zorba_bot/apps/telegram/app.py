@@ -6,14 +6,17 @@ Provides the run() coroutine for the main app selector
 
 import asyncio
 import logging
+from typing import Optional
 from telegram import Update
 from telegram.ext import Application, ContextTypes, MessageHandler, CommandHandler, filters
 
 from .bot_config import Config
-from .telegram_handler import send_msg, reply, get_user_id, get_text
+from .telegram_handler import send_msg, reply, get_user_id, get_text, get_reply_to_id
 from .console_logger import Log
 from .question_poller import QuestionPoller
 from .idea_chat import IdeaChat
+from services.status_handler import cache_stats
+from services.openai_client import suggestion_cache_stats
 
 logger = logging.getLogger(__name__)
 
@@ -72,21 +75,27 @@ class TelegramBot:
                 await self.idea_chat.process_message(user_id, text)
                 return
         
-        # Check if this is an answer to a pending question
-        if self.question_poller and self.question_poller.current_question_id:
-            answered_id = self.question_poller.process_answer(text)
+        # Check if this is an answer to an open question
+        open_questions = self.question_poller.open_questions() if self.question_poller else []
+        if open_questions:
+            answered_id = self.question_poller.process_answer(text, user_id, get_reply_to_id(update))
             if answered_id:
                 Log.ok(f"Answer received for {answered_id}: {text}")
-                await reply(update, f"✅ Got it! Your answer has been recorded. The team will continue working.")
+                await reply(update, f"✅ Got it! Your answer to #{answered_id} has been recorded. The team will continue working.")
                 return
+            tags = ", ".join(f"#{question_id}" for question_id in open_questions)
+            await reply(update, f"❓ Not sure which question that answers - waiting on {tags}. "
+                                f"Reply to the question's message, or start your answer with its #id.")
+            return
         
         # Default: acknowledge message
         await reply(update, f"📨 Received: {text}\n\n_No pending questions right now. Send /idea to start brainstorming._")
     
-    async def send_to_user(self, user_id: int, text: str) -> None:
-        """Send message to a specific user (used by question poller)"""
+    async def send_to_user(self, user_id: int, text: str) -> Optional[int]:
+        """Send message to a specific user (used by question poller); returns the message id"""
         if self.app and self.app.bot:
-            await send_msg(self.app.bot, user_id, text)
+            return await send_msg(self.app.bot, user_id, text)
+        return None
     
     async def run(self):
         """Run the Telegram bot"""
@@ -142,6 +151,17 @@ class TelegramBot:
             try:
                 if self.question_poller:
                     self.question_poller.stop()
+                stats = cache_stats()
+                Log.exchange(
+                    f"status.json cache: {stats['hits']} hits, {stats['misses']} misses "
+                    f"({stats['hit_rate']:.0%} hit rate)"
+                )
+                suggestion_stats = suggestion_cache_stats()
+                if suggestion_stats:
+                    Log.exchange(
+                        f"suggestion cache: {suggestion_stats['hits']} hits, {suggestion_stats['misses']} misses "
+                        f"({suggestion_stats['hit_rate']:.0%} hit rate, {suggestion_stats['entries']} cached)"
+                    )
                 if self.app:
                     await self.app.updater.stop()
                     await self.app.stop()
@@ -20,9 +20,9 @@ from services.idea_handler import (
     execute_idea
 )
 from services.openai_client import (
-    chat_about_idea,
-    generate_idea_headline,
-    generate_context_from_chat
+    chat_about_idea_async,
+    generate_idea_headline_async,
+    generate_context_from_chat_async
 )
 
 logger = logging.getLogger(__name__)
@@ -133,7 +133,7 @@ class IdeaChat:
         
         # Get full history and send to GPT
         history = get_chat_history(idea_id)
-        gpt_response = chat_about_idea(history, text)
+        gpt_response = await chat_about_idea_async(history, text)
         
         # Record GPT response
         add_message(idea_id, 'gpt', gpt_response)
@@ -165,11 +165,11 @@ class IdeaChat:
             return
         
         # Generate headline
-        headline, description = generate_idea_headline(history)
+        headline, description = await generate_idea_headline_async(history)
         new_id = update_headline(idea_id, headline)
         
         # Generate context file
-        context_content = generate_context_from_chat(history)
+        context_content = await generate_context_from_chat_async(history)
         context_path = generate_context_file(new_id, context_content)
         
         # End session
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""Adaptive poll interval: fast right after activity, backing off while idle"""
+
+import random
+from typing import Any, Callable, Dict
+
+
+class AdaptivePollScheduler:
+    """Exponential backoff between polls, reset by activity
+
+    After an active poll (something changed) the interval drops to min_interval; every
+    idle poll multiplies it by `backoff`, up to max_interval. Each delay is jittered by
+    +/- `jitter` (a fraction) so several pollers on one file do not poll in lockstep.
+    """
+
+    def __init__(self, min_interval: float = 0.25, max_interval: float = 10.0, backoff: float = 2.0,
+                 jitter: float = 0.2, rand: Callable[[], float] = random.random):
+        """Initialize scheduler
+
+        Raises:
+            ValueError: If the intervals, backoff or jitter are out of range
+        """
+        if not 0 < min_interval <= max_interval:
+            raise ValueError(f"need 0 < min_interval <= max_interval, got {min_interval}, {max_interval}")
+        if backoff < 1 or not 0 <= jitter < 1:
+            raise ValueError(f"need backoff >= 1 and 0 <= jitter < 1, got {backoff}, {jitter}")
+
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.jitter = jitter
+        self._rand = rand
+        self.interval = min_interval
+        self.polls = 0
+        self.wasted_polls = 0
+
+    def record(self, active: bool) -> float:
+        """Record a poll's outcome; returns the delay before the next one"""
+        self.polls += 1
+        if active:
+            self.interval = self.min_interval
+        else:
+            self.wasted_polls += 1
+            self.interval = min(self.max_interval, self.interval * self.backoff)
+        return self.next_delay()
+
+    def reset(self) -> None:
+        """Activity seen outside a poll: poll fast again"""
+        self.interval = self.min_interval
+
+    def next_delay(self) -> float:
+        """Current interval with jitter, never above max_interval"""
+        spread = self.interval * self.jitter * (2 * self._rand() - 1)
+        return min(self.max_interval, max(0.0, self.interval + spread))
+
+    def metrics(self) -> Dict[str, Any]:
+        """interval, polls, wasted_polls, wasted_ratio"""
+        return {
+            'interval': self.interval,
+            'polls': self.polls,
+            'wasted_polls': self.wasted_polls,
+            'wasted_ratio': self.wasted_polls / self.polls if self.polls else 0.0,
+        }
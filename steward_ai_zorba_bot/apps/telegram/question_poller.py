@@ -3,40 +3,160 @@
 
 import asyncio
 import logging
-from typing import Optional, Callable, Awaitable
+import re
+import time
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Callable, Awaitable, Tuple
 
 import sys
 from pathlib import Path
 # Add parent to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+from services.status_diff import Change, StatusWatcher
 from services.status_handler import (
-    get_pending_questions,
-    get_delivered_questions,
+    get_question,
     mark_question_delivered,
+    status_snapshot,
+    watch_status_files,
     write_answer
 )
-from services.openai_client import get_suggestions
+from services.openai_client import get_suggestions_async
+
+from .poll_scheduler import AdaptivePollScheduler
+from .suggestion_prefetch import SuggestionPrefetcher, question_prompt
 
 logger = logging.getLogger(__name__)
 
+# "#Q-7 blue" answers Q-7 without replying to its message
+_QUESTION_TAG = re.compile(r'#([\w.-]+)[:,]?\s*')
+
+
+def _scan_key(question: dict) -> Tuple[str, Tuple[str, str]]:
+    return repr(question.get('id')), question_prompt(question)
+
+@dataclass
+class SendResult:
+    """Outcome of sending one question message to one recipient"""
+    user_id: int
+    message_id: Optional[int] = None  # None: not sent
+    attempts: int = 0
+    latency: float = 0.0  # seconds from the first attempt to success or giving up
+    error: str = ''
+
+    @property
+    def ok(self) -> bool:
+        return self.message_id is not None
+
 
 class QuestionPoller:
-    """Polls status.json for pending questions and delivers them with GPT suggestions"""
+    """Polls status.json for pending questions and delivers them with GPT suggestions
+
+    Every pending question is delivered as soon as it is seen, so several can be
+    waiting for an answer at once. Answers are routed by the Telegram message they
+    reply to, then by a `#Q-id` prefix, then - if only one question is open - to that
+    question (see process_answer).
+    """
     
-    def __init__(self, send_func: Callable[[int, str], Awaitable[None]], user_ids: list):
+    def __init__(self, send_func: Callable[[int, str], Awaitable[Optional[int]]], user_ids: list):
         """
         Initialize poller.
         
         Args:
-            send_func: Async function to send messages (user_id, text) -> None
+            send_func: Async function to send messages (user_id, text) -> sent message id;
+                None (or an exception) means the message was not sent
             user_ids: List of client user IDs to send questions to
         """
         self.send_func = send_func
         self.user_ids = user_ids
         self.running = False
-        self.poll_interval = 10  # seconds (per client decision D-01)
-        self.current_question_id: Optional[str] = None
+        # Without inotify: fast after activity, backing off to poll_interval while idle
+        self.scheduler = AdaptivePollScheduler(max_interval=10)  # per client decision D-01
+        self.watch_files = True  # wake as soon as status.json is written
+        self.wake_ups = 'adaptive'
+        # Fan-out: questions go to all users concurrently, each send retried with
+        # exponential backoff; a question is delivered once delivery_quorum users have it
+        self.max_concurrent_sends = 8
+        self.send_retries = 2
+        self.retry_delay = 0.5
+        self.delivery_quorum = 1
+        self.last_delivery: List[SendResult] = []
+        self._recipient_stats: Dict[int, Dict[str, float]] = {}
+        # Users each not-yet-delivered question already reached (not re-sent on retry)
+        self._reached: Dict[Any, set] = {}
+        # Suggestions are generated in the background from the moment a question is seen
+        self.prefetcher = SuggestionPrefetcher(self._suggest, workers=2, max_queue=16)
+        self._changed = False
+        self._activity: Optional[asyncio.Event] = None
+        # Question ids in arrival order, kept up to date from status changes:
+        # pending ones to deliver, open (delivered) ones awaiting an answer
+        self._pending: Dict[str, None] = {}
+        self._open: Dict[str, None] = {}
+        # (user_id, message_id) of each delivered question message -> question id
+        self._messages: Dict[Tuple[int, int], str] = {}
+        # Questions without a unique id cannot be followed by id: when one changes,
+        # client_questions is scanned for them (_rescan); (id, text) of those delivered
+        self._rescan = False
+        self._scanned: set = set()
+        self._watcher = StatusWatcher(status_snapshot)
+        self._watcher.subscribe('client_questions[*].delivery_status', self._on_delivery_status)
+
+    @property
+    def poll_interval(self) -> float:
+        """Longest time between polls (seconds)"""
+        return self.scheduler.max_interval
+
+    @poll_interval.setter
+    def poll_interval(self, seconds: float) -> None:
+        self.scheduler.max_interval = seconds
+        self.scheduler.min_interval = min(self.scheduler.min_interval, seconds)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Poll metrics: wake_ups (inotify / adaptive), interval, polls, wasted_polls, wasted_ratio,
+        per-recipient send stats under 'recipients' and suggestion prefetch stats under 'prefetch'"""
+        return {
+            'wake_ups': self.wake_ups,
+            **self.scheduler.metrics(),
+            'recipients': self.recipient_stats(),
+            'prefetch': self.prefetcher.stats(),
+        }
+
+    def recipient_stats(self) -> Dict[int, Dict[str, float]]:
+        """user_id -> sent, failed, retries, last_latency, avg_latency (seconds)"""
+        stats = {}
+        for user_id, s in self._recipient_stats.items():
+            stats[user_id] = {
+                'sent': s['sent'],
+                'failed': s['failed'],
+                'retries': s['retries'],
+                'last_latency': s['last_latency'],
+                'avg_latency': s['total_latency'] / s['sent'] if s['sent'] else 0.0,
+            }
+        return stats
+
+    def open_questions(self) -> List[str]:
+        """Ids of delivered questions still waiting for an answer, oldest first"""
+        return list(self._open)
+
+    def _on_delivery_status(self, change: Change) -> None:
+        question_id = change.item_id
+        if question_id is None:  # no id, or one shared with another question
+            self._rescan = True
+            return
+        if change.new == 'pending':
+            self._pending[question_id] = None
+            return
+        self._pending.pop(question_id, None)
+        self._reached.pop(question_id, None)
+        self.prefetcher.discard(question_id)
+        if change.new == 'delivered':
+            self._open[question_id] = None
+            return
+        self._open.pop(question_id, None)
+        if change.new is None:  # question removed (archived): forget its messages
+            for key in [key for key, message_question in self._messages.items() if message_question == question_id]:
+                del self._messages[key]
     
     def format_question_message(self, question: dict, suggestions: list) -> str:
         """Format question with suggestions for Telegram"""
@@ -44,7 +164,9 @@ class QuestionPoller:
         q_text = question.get('question', question.get('text', ''))
         context = question.get('context', '')
         
-        msg = f"📋 *Question from {agent}:*\n\n{q_text}\n"
+        question_id = question.get('id', '')
+        
+        msg = f"📋 *Question #{question_id} from {agent}:*\n\n{q_text}\n"
         
         if context:
             msg += f"\n_Context: {context}_\n"
@@ -53,7 +175,7 @@ class QuestionPoller:
         for i, suggestion in enumerate(suggestions, 1):
             msg += f"{i}. {suggestion}\n"
         
-        msg += "\n_Reply with 1, 2, 3, or type your own answer._"
+        msg += f"\n_Reply to this message with 1, 2, 3, or type your own answer (or start with #{question_id})._"
         
         return msg
     
@@ -64,14 +186,13 @@ class QuestionPoller:
         Returns True if delivered successfully.
         """
         question_id = question.get('id', '')
-        q_text = question.get('question', question.get('text', ''))
-        context = question.get('context', '')
+        q_text, _context = question_prompt(question)
         
         logger.info(f"Delivering question {question_id}: {q_text[:50]}...")
         
-        # Get GPT suggestions
+        # Get GPT suggestions (usually prefetched by now)
         try:
-            suggestions = get_suggestions(q_text, context)
+            suggestions = await self.prefetcher.get(question)
         except Exception as e:
             logger.error(f"Failed to get suggestions: {e}")
             suggestions = [
@@ -85,72 +206,215 @@ class QuestionPoller:
         
         # Store suggestions for answer matching
         question['_suggestions'] = suggestions
-        self.current_question_id = question_id
         
-        # Send to all client users
-        for user_id in self.user_ids:
-            try:
-                await self.send_func(user_id, msg)
-                logger.info(f"Sent question to user {user_id}")
-            except Exception as e:
-                logger.error(f"Failed to send to {user_id}: {e}")
-                return False
+        # Send to all client users, remembering each message for reply routing
+        reach_key = question_id or question_prompt(question)
+        reached = self._reached.setdefault(reach_key, set())
+        self.last_delivery = await self.fan_out([u for u in self.user_ids if u not in reached], msg)
+        for result in self.last_delivery:
+            if result.ok:
+                reached.add(result.user_id)
+                if question_id:
+                    self._messages[(result.user_id, result.message_id)] = question_id
+        
+        quorum = min(self.delivery_quorum, len(self.user_ids))
+        if len(reached) < quorum:
+            logger.warning(f"Question {question_id} reached {len(reached)} of {quorum} required users; will retry")
+            return False
         
         # Mark as delivered
         mark_question_delivered(question_id)
+        del self._reached[reach_key]
+        if question_id:
+            self._open[question_id] = None
         return True
     
-    def process_answer(self, text: str) -> Optional[str]:
-        """
-        Process client answer text.
+    async def _suggest(self, q_text: str, context: str) -> List[str]:
+        return await get_suggestions_async(q_text, context)
+    
+    async def fan_out(self, user_ids: List[int], msg: str) -> List[SendResult]:
+        """Send `msg` to every user, at most max_concurrent_sends at a time; one result per user"""
+        semaphore = asyncio.Semaphore(max(1, self.max_concurrent_sends))
+        
+        async def send(user_id: int) -> SendResult:
+            async with semaphore:
+                return await self._send_with_retries(user_id, msg)
         
-        Returns the answer to store, or None if no question pending.
+        return list(await asyncio.gather(*(send(user_id) for user_id in user_ids)))
+    
+    async def _send_with_retries(self, user_id: int, msg: str) -> SendResult:
+        result = SendResult(user_id)
+        started = time.perf_counter()
+        for attempt in range(self.send_retries + 1):
+            if attempt:
+                await asyncio.sleep(self.retry_delay * 2 ** (attempt - 1))
+            result.attempts += 1
+            try:
+                result.message_id = await self.send_func(user_id, msg)
+                if result.ok:
+                    break
+                result.error = 'not sent'
+            except Exception as e:
+                result.error = str(e) or type(e).__name__
+        result.latency = time.perf_counter() - started
+        
+        stats = self._recipient_stats.setdefault(
+            user_id, {'sent': 0, 'failed': 0, 'retries': 0, 'last_latency': 0.0, 'total_latency': 0.0})
+        stats['retries'] += result.attempts - 1
+        if result.ok:
+            result.error = ''
+            stats['sent'] += 1
+            stats['last_latency'] = result.latency
+            stats['total_latency'] += result.latency
+            logger.info(f"Sent question to user {user_id} ({result.latency * 1000:.0f} ms, {result.attempts} attempts)")
+        else:
+            stats['failed'] += 1
+            logger.error(f"Failed to send to {user_id} after {result.attempts} attempts: {result.error}")
+        return result
+    
+    def route_answer(self, text: str, user_id: Optional[int] = None,
+                     reply_to_id: Optional[int] = None) -> Tuple[Optional[str], str]:
         """
-        if not self.current_question_id:
-            return None
+        Work out which open question a message answers.
+        
+        Tries, in order: the question message it replies to, a `#Q-id` prefix, and the
+        only open question if there is exactly one. A reply or prefix naming a question
+        that is no longer open matches nothing rather than falling through to a guess.
         
-        # Check if it's a number selection
+        Returns (question id or None, answer text without any `#Q-id` prefix).
+        """
         text = text.strip()
+        if reply_to_id is not None and (user_id, reply_to_id) in self._messages:
+            question_id = self._messages[(user_id, reply_to_id)]
+            return (question_id if question_id in self._open else None), text
         
-        # Store the answer
-        write_answer(self.current_question_id, text, source="telegram")
+        tag = _QUESTION_TAG.match(text)
+        if tag:
+            question_id = tag.group(1)
+            return (question_id if question_id in self._open else None), text[tag.end():].strip()
+        
+        if len(self._open) == 1:
+            return next(iter(self._open)), text
+        return None, text
+    
+    def process_answer(self, text: str, user_id: Optional[int] = None,
+                       reply_to_id: Optional[int] = None) -> Optional[str]:
+        """
+        Process client answer text (see route_answer for how it is matched to a question).
+        
+        Returns the id of the question answered, or None if it matched none.
+        """
+        answered_id, text = self.route_answer(text, user_id, reply_to_id)
+        if answered_id is None or not text:
+            return None
         
-        answered_id = self.current_question_id
-        self.current_question_id = None
+        # Store the answer
+        write_answer(answered_id, text, source="telegram")
+        self._open.pop(answered_id, None)
+
+        # The next question usually follows shortly
+        self.scheduler.reset()
+        if self._activity is not None:
+            self._activity.set()
         
         return answered_id
     
     async def poll_once(self) -> bool:
         """
-        Check for pending questions and deliver one if found.
+        Check for pending questions and deliver all of them.
         
         Returns True if a question was delivered.
         """
-        # Don't deliver new questions if one is pending answer
-        if self.current_question_id:
-            return False
+        # Only looks at what changed since the last poll
+        self._changed = bool(self._watcher.poll())
+
+        # Start suggestions for every pending question, then deliver them in order
+        questions = []
+        for question_id in list(self._pending):
+            self._pending.pop(question_id, None)
+            question = get_question(question_id)
+            if question is not None and question.get('delivery_status') == 'pending':
+                self.prefetcher.submit(question)
+                questions.append(question)
+        unmatched = self._scan_unmatched() if self._rescan else []
+        self._rescan = False
+        for question in unmatched:
+            self.prefetcher.submit(question)
         
-        pending = get_pending_questions()
-        if pending:
-            question = pending[0]  # Deliver one at a time
-            return await self.deliver_question(question)
+        delivered = False
+        for question in questions:
+            if await self.deliver_question(question):
+                delivered = True
+            else:
+                self._pending[question['id']] = None  # retry on the next poll
+        for question in unmatched:
+            if await self.deliver_question(question):
+                delivered = True
+                self._scanned.add(_scan_key(question))
+            else:
+                self._rescan = True
         
-        return False
+        return delivered
+    
+    def _scan_unmatched(self) -> List[dict]:
+        """Pending questions the id-based tracking misses (no id, or a shared one), not yet delivered"""
+        questions = status_snapshot().get('client_questions', [])
+        ids = Counter(q.get('id') for q in questions if isinstance(q, dict))
+        unmatched = []
+        for question in questions:
+            if not isinstance(question, dict) or question.get('delivery_status') != 'pending':
+                continue
+            question_id = question.get('id')
+            if question_id is not None and not isinstance(question_id, (dict, list)) and ids[question_id] == 1:
+                continue  # followed by id
+            if _scan_key(question) not in self._scanned:
+                unmatched.append(dict(question))  # the snapshot is shared: deliver a copy
+        return unmatched
     
     async def run(self):
-        """Run the polling loop"""
+        """Run the polling loop: poll whenever the status files change (inotify), and at
+        least every poll_interval seconds in case a change notification is missed.
+        Without inotify, poll on the adaptive schedule instead."""
         self.running = True
-        logger.info("Question poller started")
+        self._activity = asyncio.Event()
+        file_watcher = watch_status_files() if self.watch_files else None
+        if file_watcher is not None and file_watcher.backend != 'inotify':
+            # A stat-polling watcher is just a fixed-rate poll; the adaptive schedule is cheaper when idle
+            file_watcher.close()
+            file_watcher = None
+        self.wake_ups = 'inotify' if file_watcher is not None else 'adaptive'
+        logger.info(f"Question poller started ({self.wake_ups} wake-ups)")
         
-        while self.running:
-            try:
-                await self.poll_once()
-            except Exception as e:
-                logger.error(f"Poll error: {e}")
-            
-            await asyncio.sleep(self.poll_interval)
+        try:
+            while self.running:
+                try:
+                    await self.poll_once()
+                except Exception as e:
+                    logger.error(f"Poll error: {e}")
+                
+                delay = self.scheduler.record(self._changed)
+                if file_watcher is not None:
+                    await file_watcher.wait_async(self.poll_interval)
+                else:
+                    await self._sleep(delay)
+        finally:
+            if file_watcher is not None:
+                file_watcher.close()
+
+    async def _sleep(self, delay: float) -> None:
+        """Sleep `delay` seconds, or until process_answer() signals activity"""
+        try:
+            await asyncio.wait_for(self._activity.wait(), delay)
+        except asyncio.TimeoutError:
+            pass
+        self._activity.clear()
     
     def stop(self):
         """Stop the polling loop"""
         self.running = False
-        logger.info("Question poller stopped")
+        self.prefetcher.close()
+        m = self.metrics()
+        logger.info(
+            f"Question poller stopped ({m['polls']} polls, {m['wasted_ratio']:.0%} found nothing, "
+            f"interval {m['interval']:.2f}s, {m['prefetch']['hits'] + m['prefetch']['joined']} suggestions prefetched)"
+        )
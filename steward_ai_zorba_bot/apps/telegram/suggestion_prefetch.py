@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""Background suggestion prefetch: GPT suggestions are generated while a question waits to be sent"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+Prompt = Tuple[str, str]  # (question text, context)
+
+
+def question_prompt(question: dict) -> Prompt:
+    """The (text, context) a question's suggestions are generated from"""
+    return question.get('question', question.get('text', '')), question.get('context', '')
+
+
+class SuggestionPrefetcher:
+    """A few worker tasks generating suggestions for pending questions ahead of delivery
+
+    submit() queues a question as soon as it is seen pending; get() returns its
+    suggestions - at once if ready, after the in-flight call if one is running, or by
+    calling `suggest` directly if the question was never queued. The queue holds at most
+    `max_queue` questions and only `workers` calls run at a time, so a burst of
+    questions cannot flood the API; questions that do not fit are fetched on delivery.
+    Results stay cached per question id until discard() (the question left 'pending').
+    """
+
+    def __init__(self, suggest: Callable[[str, str], Awaitable[List[str]]], workers: int = 2,
+                 max_queue: int = 16):
+        """Initialize prefetcher
+
+        Args:
+            suggest: Async function (question text, context) -> suggestions
+            workers: Number of suggestion calls running at once
+            max_queue: Questions waiting for a worker before submit() drops new ones
+
+        Raises:
+            ValueError: If workers or max_queue is below 1
+        """
+        if workers < 1 or max_queue < 1:
+            raise ValueError(f"need workers >= 1 and max_queue >= 1, got {workers}, {max_queue}")
+        self.suggest = suggest
+        self.workers = workers
+        self.max_queue = max_queue
+        self.hits = 0      # ready when delivery asked
+        self.joined = 0    # still running when delivery asked
+        self.misses = 0    # never prefetched
+        self.dropped = 0   # queue full
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._entries: Dict[str, Tuple[Prompt, asyncio.Future]] = {}
+
+    def _start(self) -> None:
+        """Start the workers on the running loop (again, if the loop changed)"""
+        loop = asyncio.get_running_loop()
+        if loop is self._loop:
+            return
+        self._loop = loop
+        self._queue = asyncio.Queue(self.max_queue)
+        self._entries = {}
+        self._tasks = [loop.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def _worker(self) -> None:
+        while True:
+            prompt, future = await self._queue.get()
+            if future.done():  # discarded while queued
+                continue
+            try:
+                result = await self.suggest(*prompt)
+            except Exception as e:
+                logger.warning(f"Suggestion prefetch failed: {e}")
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                if not future.done():
+                    future.set_result(result)
+
+    def submit(self, question: dict) -> bool:
+        """Queue suggestions for a pending question; False if already queued or the queue is full"""
+        self._start()
+        question_id = question.get('id', '')
+        prompt = question_prompt(question)
+        entry = self._entries.get(question_id)
+        if entry is not None and entry[0] == prompt:
+            return False
+        if self._queue.full():
+            self.dropped += 1
+            logger.info(f"Suggestion prefetch queue full; {question_id} will be fetched on delivery")
+            return False
+        future = self._loop.create_future()
+        self._entries[question_id] = (prompt, future)
+        self._queue.put_nowait((prompt, future))
+        return True
+
+    async def get(self, question: dict) -> List[str]:
+        """Suggestions for `question`: prefetched, in flight, or fetched now
+
+        Raises:
+            Exception: Whatever `suggest` raised
+        """
+        self._start()
+        prompt = question_prompt(question)
+        entry = self._entries.get(question.get('id', ''))
+        if entry is None or entry[0] != prompt:
+            self.misses += 1
+            return await self.suggest(*prompt)
+        future = entry[1]
+        if future.done():
+            self.hits += 1
+        else:
+            self.joined += 1
+        try:
+            return list(await asyncio.shield(future))
+        except asyncio.CancelledError:
+            if not future.cancelled():
+                raise  # we were cancelled, not the prefetch
+            return await self.suggest(*prompt)  # discarded meanwhile
+
+    def discard(self, question_id: str) -> None:
+        """Forget a question's suggestions (it is no longer pending)"""
+        entry = self._entries.pop(question_id, None)
+        if entry is None:
+            return
+        future = entry[1]
+        if not future.done():
+            future.cancel()
+        elif not future.cancelled():
+            future.exception()  # retrieved: no "exception was never retrieved" warning
+
+    def close(self) -> None:
+        """Stop the workers"""
+        for task in self._tasks:
+            task.cancel()
+        for question_id in list(self._entries):
+            self.discard(question_id)
+        self._tasks = []
+        self._loop = None
+
+    def stats(self) -> Dict[str, Any]:
+        """hits, joined, misses, dropped, queued"""
+        return {
+            'hits': self.hits,
+            'joined': self.joined,
+            'misses': self.misses,
+            'dropped': self.dropped,
+            'queued': self._queue.qsize() if self._queue is not None else 0,
+        }
@@ -2,12 +2,13 @@
 """Telegram bot communication helpers"""
 
 import logging
+from typing import Optional
 from telegram import Update, Bot
 
 logger = logging.getLogger(__name__)
 
 
-async def send_msg(bot: Bot, chat_id: int, text: str) -> bool:
+async def send_msg(bot: Bot, chat_id: int, text: str) -> Optional[int]:
     """Send message to chat
     
     Args:
@@ -16,22 +17,22 @@ async def send_msg(bot: Bot, chat_id: int, text: str) -> bool:
         text: Message text
         
     Returns:
-        True if sent, False on error
+        The sent message's id (replies to it carry the same id), None on error
     """
     if not isinstance(chat_id, int) or chat_id <= 0:
         logger.error(f"Invalid chat_id: {chat_id} (must be positive integer)")
-        return False
+        return None
     
     if not isinstance(text, str) or not text.strip():
         logger.error(f"Invalid text: empty or not string")
-        return False
+        return None
     
     try:
-        await bot.send_message(chat_id=chat_id, text=text)
-        return True
+        message = await bot.send_message(chat_id=chat_id, text=text)
+        return message.message_id
     except Exception as e:
         logger.error(f"Send failed to {chat_id}: {e}")
-        return False
+        return None
 
 
 async def reply(update: Update, text: str) -> bool:
@@ -68,3 +69,10 @@ def get_user_id(update: Update) -> int:
 def get_text(update: Update) -> str:
     """Extract message text from update"""
     return update.message.text.strip() if update.message and update.message.text else ""
+
+
+def get_reply_to_id(update: Update) -> Optional[int]:
+    """Extract the id of the message this one replies to (None if not a reply)"""
+    if update.message and update.message.reply_to_message:
+        return update.message.reply_to_message.message_id
+    return None
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""Wake-ups when status files change, instead of sleeping a fixed interval.
+
+FileWatcher watches a few files in one directory. On Linux it uses inotify (through
+ctypes, no extra packages) on the directory, which also sees status.json being
+replaced by the atomic rename every writer uses; elsewhere, or if inotify is not
+available, it falls back to checking the files' (inode, mtime, size) every
+`fallback_interval` seconds.
+
+    watcher = FileWatcher([status_path, journal_path])
+    changed = await watcher.wait_async(timeout=10)  # False: timed out
+"""
+
+import asyncio
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import struct
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# <sys/inotify.h>
+_IN_MODIFY = 0x002
+_IN_CLOSE_WRITE = 0x008
+_IN_MOVED_TO = 0x080
+_IN_CREATE = 0x100
+_IN_DELETE = 0x200
+_IN_NONBLOCK = os.O_NONBLOCK
+_IN_CLOEXEC = getattr(os, 'O_CLOEXEC', 0o2000000)
+_WATCH_MASK = _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+_EVENT_HEADER = struct.Struct('iIII')  # wd, mask, cookie, len
+
+FALLBACK_INTERVAL = 0.05
+
+
+def _load_libc() -> Optional[ctypes.CDLL]:
+    name = ctypes.util.find_library('c')
+    try:
+        libc = ctypes.CDLL(name or 'libc.so.6', use_errno=True)
+        libc.inotify_init1, libc.inotify_add_watch  # noqa: B018 - both must exist
+    except (OSError, AttributeError):
+        return None
+    return libc
+
+
+def _signature(path: Path) -> Optional[Tuple[int, int, int]]:
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+class FileWatcher:
+    """Change notifications for `paths` (all in the same directory)."""
+
+    def __init__(self, paths: Sequence[Path], *, fallback_interval: float = FALLBACK_INTERVAL,
+                 use_inotify: bool = True) -> None:
+        self.paths = [Path(p) for p in paths]
+        if not self.paths or len({p.parent for p in self.paths}) != 1:
+            raise ValueError('FileWatcher needs one or more files in a single directory')
+        self.fallback_interval = fallback_interval
+        self._names = {os.fsencode(p.name) for p in self.paths}
+        self._fd: Optional[int] = None
+        self._signatures: Dict[Path, Optional[Tuple[int, int, int]]] = {}
+        if use_inotify:
+            self._fd = self._open_inotify(self.paths[0].parent)
+        if self._fd is None:
+            self._signatures = {p: _signature(p) for p in self.paths}
+
+    @property
+    def backend(self) -> str:
+        return 'inotify' if self._fd is not None else 'stat'
+
+    @staticmethod
+    def _open_inotify(directory: Path) -> Optional[int]:
+        libc = _load_libc()
+        if libc is None:
+            return None
+        fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if fd < 0:
+            logger.warning(f"inotify unavailable ({os.strerror(ctypes.get_errno())}); polling file stats")
+            return None
+        if libc.inotify_add_watch(fd, os.fsencode(str(directory)), _WATCH_MASK) < 0:
+            logger.warning(f"cannot watch {directory} ({os.strerror(ctypes.get_errno())}); polling file stats")
+            os.close(fd)
+            return None
+        return fd
+
+    def close(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self) -> 'FileWatcher':
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def changed(self) -> bool:
+        """True if a watched file changed since the last call (never blocks)."""
+        if self._fd is None:
+            signatures = {p: _signature(p) for p in self.paths}
+            changed = signatures != self._signatures
+            self._signatures = signatures
+            return changed
+        changed = False
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                return changed
+            offset = 0
+            while offset < len(data):
+                _wd, _mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b'\0')
+                offset += length
+                changed = changed or name in self._names
+
+    def wait(self, timeout: float) -> bool:
+        """Block until a watched file changes (True) or `timeout` seconds pass (False)."""
+        deadline = time.monotonic() + timeout
+        while True:
+            if self.changed():
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            if self._fd is not None:
+                select.select([self._fd], [], [], remaining)
+            else:
+                time.sleep(min(self.fallback_interval, remaining))
+
+    async def wait_async(self, timeout: float) -> bool:
+        """wait() without blocking the event loop."""
+        if self._fd is None:
+            deadline = time.monotonic() + timeout
+            while not self.changed():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                await asyncio.sleep(min(self.fallback_interval, remaining))
+            return True
+
+        if self.changed():
+            return True
+        loop = asyncio.get_running_loop()
+        woken = asyncio.Event()
+        loop.add_reader(self._fd, woken.set)
+        try:
+            deadline = loop.time() + timeout
+            while True:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return False
+                try:
+                    await asyncio.wait_for(woken.wait(), remaining)
+                except asyncio.TimeoutError:
+                    return False
+                woken.clear()
+                if self.changed():  # other files in the directory wake us too
+                    return True
+        finally:
+            loop.remove_reader(self._fd)
+
+
+def watch_files(paths: List[Path], **kwargs: object) -> Optional[FileWatcher]:
+    """A FileWatcher for `paths`, or None if there is nothing to watch."""
+    if not paths:
+        return None
+    try:
+        return FileWatcher(paths, **kwargs)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Not watching {paths}: {e}")
+        return None
@@ -3,11 +3,12 @@
 
 import os
 import re
-import json
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, List, Dict, Tuple
 
+from services.status_handler import update_status
+
 # Paths
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 IDEAS_FILE = PROJECT_ROOT / "ideas.md"
@@ -233,10 +234,11 @@ def execute_idea(idea_id: str) -> Tuple[bool, str]:
     
     # Update status.json
     if STATUS_FILE.exists():
-        status = json.loads(STATUS_FILE.read_text())
-        status['problem']['text'] = headline
-        status['problem']['source'] = f"plugin/context_{idea_id}.md"
-        STATUS_FILE.write_text(json.dumps(status, indent=2))
+        def set_problem(status: Dict) -> None:
+            status['problem']['text'] = headline
+            status['problem']['source'] = f"plugin/context_{idea_id}.md"
+
+        update_status(set_problem)
     
     # Mark idea as EXECUTED
     content = _read_ideas_file()
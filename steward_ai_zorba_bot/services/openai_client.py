@@ -1,10 +1,29 @@
 #!/usr/bin/env python3
-"""OpenAI GPT client for generating suggested answers"""
+"""OpenAI GPT client for generating suggested answers
 
+Every call has a blocking version (`get_suggestions`) and an async one
+(`get_suggestions_async`, built on AsyncOpenAI) for use inside the bot's event
+loop, where a blocking call would stall every other chat until GPT answers.
+
+Suggestions are cached on disk (services.suggestion_cache) and looked up before the
+API is called; set SUGGESTION_CACHE to another database path, or to `off`. The async
+calls use it from a worker thread.
+"""
+
+import asyncio
+import json
+import logging
 import os
+import sqlite3
+from datetime import datetime
 from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
+
+from services.suggestion_cache import DEFAULT_PATH as SUGGESTION_CACHE_PATH, SuggestionCache
+
+logger = logging.getLogger(__name__)
 
 
 # Load .env from bot directory
@@ -12,27 +31,44 @@ env_file = Path(__file__).parent.parent / ".env"
 load_dotenv(env_file)
 
 
-def get_client():
-    """Get OpenAI client with API key from .env"""
+MODEL = "gpt-4o"
+
+FALLBACK_SUGGESTIONS = [
+    "Yes, that sounds good",
+    "No, let's try something else", 
+    "I'm not sure, you decide what's best"
+]
+
+# One async client (and its connection pool) per event loop
+_async_client: Optional[Tuple[str, asyncio.AbstractEventLoop, AsyncOpenAI]] = None
+
+_suggestion_cache: Optional[SuggestionCache] = None
+_suggestion_cache_loaded = False
+
+
+def _api_key() -> str:
     api_key = os.getenv('AI_API_KEY', '').strip()
     if not api_key:
         raise ValueError("AI_API_KEY not found in .env")
-    return OpenAI(api_key=api_key)
+    return api_key
 
 
-def chat_about_idea(history: list, new_message: str) -> str:
-    """
-    Continue a brainstorming conversation about an idea.
-    
-    Args:
-        history: List of {'role': 'user'|'gpt', 'content': str}
-        new_message: The new user message
-    
-    Returns:
-        GPT response string
-    """
-    client = get_client()
-    
+def get_client():
+    """Get OpenAI client with API key from .env"""
+    return OpenAI(api_key=_api_key())
+
+
+def get_async_client() -> AsyncOpenAI:
+    """Get the AsyncOpenAI client for the running event loop (API key from .env)"""
+    global _async_client
+    api_key = _api_key()
+    loop = asyncio.get_running_loop()
+    if _async_client is None or _async_client[:2] != (api_key, loop):
+        _async_client = (api_key, loop, AsyncOpenAI(api_key=api_key))
+    return _async_client[2]
+
+
+def _idea_messages(history: list, new_message: str) -> list:
     # Build messages from history
     messages = [
         {"role": "system", "content": """You are helping a client brainstorm a software idea.
@@ -47,11 +83,26 @@ Be encouraging and help them refine their idea."""}
     
     # Add new message
     messages.append({"role": "user", "content": new_message})
+    return messages
+
+
+def chat_about_idea(history: list, new_message: str) -> str:
+    """
+    Continue a brainstorming conversation about an idea.
+    
+    Args:
+        history: List of {'role': 'user'|'gpt', 'content': str}
+        new_message: The new user message
+    
+    Returns:
+        GPT response string
+    """
+    client = get_client()
     
     try:
         response = client.chat.completions.create(
-            model="gpt-4o",
-            messages=messages,
+            model=MODEL,
+            messages=_idea_messages(history, new_message),
             max_tokens=200,
             temperature=0.7
         )
@@ -60,15 +111,23 @@ Be encouraging and help them refine their idea."""}
         return f"Sorry, I couldn't process that: {str(e)}"
 
 
-def generate_idea_headline(history: list) -> tuple:
-    """
-    Generate a headline and description from idea conversation.
-    
-    Returns:
-        (headline, description) tuple
-    """
-    client = get_client()
+async def chat_about_idea_async(history: list, new_message: str) -> str:
+    """chat_about_idea() without blocking the event loop"""
+    client = get_async_client()
     
+    try:
+        response = await client.chat.completions.create(
+            model=MODEL,
+            messages=_idea_messages(history, new_message),
+            max_tokens=200,
+            temperature=0.7
+        )
+        return response.choices[0].message.content.strip()
+    except Exception as e:
+        return f"Sorry, I couldn't process that: {str(e)}"
+
+
+def _headline_prompt(history: list) -> str:
     # Build conversation summary
     conv_text = "\n".join([f"{m['role'].upper()}: {m['content']}" for m in history])
     
@@ -80,31 +139,52 @@ Conversation:
 {conv_text}
 
 Respond ONLY with JSON: {{"headline": "...", "description": "..."}}"""
+    return prompt
+
+
+def _parse_headline(text: str) -> tuple:
+    result = json.loads(text.strip())
+    return result.get('headline', 'Untitled Idea'), result.get('description', '')
 
+
+def generate_idea_headline(history: list) -> tuple:
+    """
+    Generate a headline and description from idea conversation.
+    
+    Returns:
+        (headline, description) tuple
+    """
+    client = get_client()
+    
     try:
         response = client.chat.completions.create(
-            model="gpt-4o",
-            messages=[{"role": "user", "content": prompt}],
+            model=MODEL,
+            messages=[{"role": "user", "content": _headline_prompt(history)}],
             max_tokens=100,
             temperature=0.5
         )
-        
-        import json
-        result = json.loads(response.choices[0].message.content.strip())
-        return result.get('headline', 'Untitled Idea'), result.get('description', '')
+        return _parse_headline(response.choices[0].message.content)
     except Exception:
         return 'Untitled Idea', ''
 
 
-def generate_context_from_chat(history: list) -> str:
-    """
-    Generate a context.md document from idea conversation.
-    
-    Returns:
-        Markdown content for context file
-    """
-    client = get_client()
+async def generate_idea_headline_async(history: list) -> tuple:
+    """generate_idea_headline() without blocking the event loop"""
+    client = get_async_client()
     
+    try:
+        response = await client.chat.completions.create(
+            model=MODEL,
+            messages=[{"role": "user", "content": _headline_prompt(history)}],
+            max_tokens=100,
+            temperature=0.5
+        )
+        return _parse_headline(response.choices[0].message.content)
+    except Exception:
+        return 'Untitled Idea', ''
+
+
+def _context_prompt(history: list) -> str:
     # Build conversation summary
     conv_text = "\n".join([f"{m['role'].upper()}: {m['content']}" for m in history])
     
@@ -119,7 +199,7 @@ Output in this markdown format:
 plugin: idea_name
 version: 1
 owner: client
-last_updated: {__import__('datetime').datetime.now().strftime('%Y-%m-%d')}
+last_updated: {datetime.now().strftime('%Y-%m-%d')}
 ---
 
 # What I want (client perspective)
@@ -133,11 +213,22 @@ last_updated: {__import__('datetime').datetime.now().strftime('%Y-%m-%d')}
 
 ## What "done" means to me:
 [Success criteria]"""
+    return prompt
 
+
+def generate_context_from_chat(history: list) -> str:
+    """
+    Generate a context.md document from idea conversation.
+    
+    Returns:
+        Markdown content for context file
+    """
+    client = get_client()
+    
     try:
         response = client.chat.completions.create(
-            model="gpt-4o",
-            messages=[{"role": "user", "content": prompt}],
+            model=MODEL,
+            messages=[{"role": "user", "content": _context_prompt(history)}],
             max_tokens=500,
             temperature=0.5
         )
@@ -146,20 +237,71 @@ last_updated: {__import__('datetime').datetime.now().strftime('%Y-%m-%d')}
         return f"# Error generating context\n\n{str(e)}"
 
 
-def get_suggestions(question: str, context: str = "", num_suggestions: int = 3) -> list:
-    """
-    Generate suggested answers for a client question using GPT.
-    
-    Args:
-        question: The question to generate suggestions for
-        context: Additional context about the question
-        num_suggestions: Number of suggestions to generate (default 3)
-    
-    Returns:
-        List of suggested answer strings
-    """
-    client = get_client()
+async def generate_context_from_chat_async(history: list) -> str:
+    """generate_context_from_chat() without blocking the event loop"""
+    client = get_async_client()
     
+    try:
+        response = await client.chat.completions.create(
+            model=MODEL,
+            messages=[{"role": "user", "content": _context_prompt(history)}],
+            max_tokens=500,
+            temperature=0.5
+        )
+        return response.choices[0].message.content.strip()
+    except Exception as e:
+        return f"# Error generating context\n\n{str(e)}"
+
+
+def get_suggestion_cache() -> Optional[SuggestionCache]:
+    """The persistent suggestion cache, opened on first use; None if disabled or unavailable"""
+    global _suggestion_cache, _suggestion_cache_loaded
+    if not _suggestion_cache_loaded:
+        _suggestion_cache_loaded = True
+        setting = os.getenv('SUGGESTION_CACHE', '').strip()
+        if setting.lower() != 'off':
+            try:
+                _suggestion_cache = SuggestionCache(Path(setting) if setting else SUGGESTION_CACHE_PATH)
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"Suggestion cache unavailable: {e}")
+    return _suggestion_cache
+
+
+def set_suggestion_cache(cache: Optional[SuggestionCache]) -> None:
+    """Use `cache` for suggestions (None: no caching)"""
+    global _suggestion_cache, _suggestion_cache_loaded
+    _suggestion_cache = cache
+    _suggestion_cache_loaded = True
+
+
+def suggestion_cache_stats() -> Optional[Dict[str, Any]]:
+    """Hit/miss stats of the suggestion cache, None if there is no cache"""
+    cache = get_suggestion_cache()
+    return cache.stats() if cache is not None else None
+
+
+def _cached_suggestions(question: str, context: str, num_suggestions: int) -> Optional[List[str]]:
+    cache = get_suggestion_cache()
+    if cache is None:
+        return None
+    try:
+        return cache.get(question, context, num_suggestions, MODEL)
+    except sqlite3.Error as e:
+        logger.warning(f"Suggestion cache lookup failed: {e}")
+        return None
+
+
+def _cache_suggestions(question: str, context: str, num_suggestions: int, suggestions: List[str]) -> None:
+    cache = get_suggestion_cache()
+    if cache is None or not suggestions:
+        return
+    try:
+        cache.put(question, context, num_suggestions, MODEL, suggestions)
+    except sqlite3.Error as e:
+        logger.warning(f"Suggestion cache write failed: {e}")
+
+
+def _suggestions_prompt(question: str, context: str, num_suggestions: int) -> str:
     prompt = f"""You are helping a non-technical client answer a question from their development team.
 Generate {num_suggestions} simple, clear answer options for the following question.
 Keep answers short (1-2 sentences max).
@@ -174,34 +316,81 @@ Respond with ONLY the numbered options, one per line, like:
 1. [first option]
 2. [second option]
 3. [third option]"""
+    return prompt
+
+
+def _parse_suggestions(text: str, num_suggestions: int) -> List[str]:
+    # Parse response into list
+    text = text.strip()
+    suggestions = []
+    for line in text.split('\n'):
+        line = line.strip()
+        if line and line[0].isdigit():
+            # Remove number prefix like "1. " or "1) "
+            if '. ' in line:
+                line = line.split('. ', 1)[1]
+            elif ') ' in line:
+                line = line.split(') ', 1)[1]
+            suggestions.append(line)
+    
+    return suggestions[:num_suggestions]
 
+
+def get_suggestions(question: str, context: str = "", num_suggestions: int = 3) -> list:
+    """
+    Generate suggested answers for a client question using GPT.
+    
+    Args:
+        question: The question to generate suggestions for
+        context: Additional context about the question
+        num_suggestions: Number of suggestions to generate (default 3)
+    
+    Returns:
+        List of suggested answer strings
+    """
+    cached = _cached_suggestions(question, context, num_suggestions)
+    if cached is not None:
+        return cached
+    
+    client = get_client()
+    
     try:
         response = client.chat.completions.create(
-            model="gpt-4o",  # Using gpt-4o as GPT-5.2 equivalent
-            messages=[{"role": "user", "content": prompt}],
+            model=MODEL,  # Using gpt-4o as GPT-5.2 equivalent
+            messages=[{"role": "user", "content": _suggestions_prompt(question, context, num_suggestions)}],
             max_tokens=300,
             temperature=0.7
         )
-        
-        # Parse response into list
-        text = response.choices[0].message.content.strip()
-        suggestions = []
-        for line in text.split('\n'):
-            line = line.strip()
-            if line and line[0].isdigit():
-                # Remove number prefix like "1. " or "1) "
-                if '. ' in line:
-                    line = line.split('. ', 1)[1]
-                elif ') ' in line:
-                    line = line.split(') ', 1)[1]
-                suggestions.append(line)
-        
-        return suggestions[:num_suggestions]
+        suggestions = _parse_suggestions(response.choices[0].message.content, num_suggestions)
     
-    except Exception as e:
-        # Fallback suggestions if API fails
-        return [
-            "Yes, that sounds good",
-            "No, let's try something else", 
-            "I'm not sure, you decide what's best"
-        ]
+    except Exception:
+        # Fallback suggestions if API fails (not cached)
+        return list(FALLBACK_SUGGESTIONS)
+    
+    _cache_suggestions(question, context, num_suggestions, suggestions)
+    return suggestions
+
+
+async def get_suggestions_async(question: str, context: str = "", num_suggestions: int = 3) -> list:
+    """get_suggestions() without blocking the event loop"""
+    cached = await asyncio.to_thread(_cached_suggestions, question, context, num_suggestions)
+    if cached is not None:
+        return cached
+    
+    client = get_async_client()
+    
+    try:
+        response = await client.chat.completions.create(
+            model=MODEL,
+            messages=[{"role": "user", "content": _suggestions_prompt(question, context, num_suggestions)}],
+            max_tokens=300,
+            temperature=0.7
+        )
+        suggestions = _parse_suggestions(response.choices[0].message.content, num_suggestions)
+    
+    except Exception:
+        # Fallback suggestions if API fails (not cached)
+        return list(FALLBACK_SUGGESTIONS)
+    
+    await asyncio.to_thread(_cache_suggestions, question, context, num_suggestions, suggestions)
+    return suggestions
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""Archive of answered client questions, kept out of the hot status document.
+
+archive_answered() moves every answered question, with the answers recorded for it,
+into append-only segments and then drops them from the store, so status.json keeps
+only live items. Layout of the archive directory (status.json.archive/ by default):
+
+    segment-000001.jsonl[.gz]  one {"question": {...}, "answers": [...]} per line
+    index.jsonl                {"id", "segment", "offset"} per archived question
+
+Each archive run appends one batch to the current segment (a new one once it reaches
+SEGMENT_MAX_BYTES); in gzip segments a batch is one gzip member. The index records
+where the batch starts, so a lookup decodes a single batch. Records are written (and
+fsynced) before the index, and the index before the store is pruned, so a crash at any
+point leaves every question live, archived, or both - never lost - and a torn batch is
+never referenced. A question archived twice resolves to its latest record.
+
+    python -m services.status_archive run [--compress] [--status-file PATH]
+    python -m services.status_archive get Q-12
+"""
+
+import argparse
+import gzip
+import json
+import os
+import sys
+import zlib
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from services.status_store import PROJECT_ROOT, StatusStore, clone_json, open_store
+
+import orchestrator  # on sys.path via services.status_store
+
+SEGMENT_MAX_BYTES = 4 * 1024 * 1024
+_SEGMENT_PREFIX = 'segment-'
+
+
+def status_archive_dir(status_path: Path) -> Path:
+    return status_path.with_name(status_path.name + '.archive')
+
+
+class StatusArchive:
+    """Append-only question archive in `directory`, with an id -> segment index."""
+
+    def __init__(self, directory: Path, *, compress: bool = False,
+                 segment_max_bytes: int = SEGMENT_MAX_BYTES) -> None:
+        self.directory = Path(directory)
+        self.compress = compress
+        self.segment_max_bytes = segment_max_bytes
+        self.index_path = self.directory / 'index.jsonl'
+        self._index: Dict[Any, tuple] = {}
+        self._index_size = 0
+        # Last batch decoded: ((segment, offset), {question id: record})
+        self._batch_cache: Optional[tuple] = None
+
+    # --- Index -----------------------------------------------------------------------
+
+    def index(self) -> Dict[Any, tuple]:
+        """Question id -> (segment name, batch offset); picks up other processes' appends."""
+        try:
+            size = self.index_path.stat().st_size
+        except FileNotFoundError:
+            return self._index
+        if size < self._index_size:
+            self._index, self._index_size = {}, 0
+        if size > self._index_size:
+            with open(self.index_path, 'rb') as f:
+                f.seek(self._index_size)
+                for line in f.read(size - self._index_size).splitlines(keepends=True):
+                    if not line.endswith(b'\n'):
+                        break  # torn append; re-read once it is complete
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        self._index_size += len(line)
+                        continue
+                    self._index[entry['id']] = (entry['segment'], entry['offset'])
+                    self._index_size += len(line)
+        return self._index
+
+    def __contains__(self, question_id: Any) -> bool:
+        return question_id in self.index()
+
+    # --- Segments --------------------------------------------------------------------
+
+    def _segments(self) -> List[Path]:
+        if not self.directory.is_dir():
+            return []
+        return sorted(p for p in self.directory.iterdir() if p.name.startswith(_SEGMENT_PREFIX))
+
+    def _segment_for_append(self) -> Path:
+        suffix = '.jsonl.gz' if self.compress else '.jsonl'
+        segments = self._segments()
+        if segments:
+            last = segments[-1]
+            if last.name.endswith(suffix) and last.stat().st_size < self.segment_max_bytes:
+                return last
+            number = int(last.name[len(_SEGMENT_PREFIX):].split('.')[0]) + 1
+        else:
+            number = 1
+        return self.directory / f'{_SEGMENT_PREFIX}{number:06d}{suffix}'
+
+    def _read_batch(self, segment: str, offset: int) -> Dict[Any, Dict[str, Any]]:
+        if self._batch_cache is not None and self._batch_cache[0] == (segment, offset):
+            return self._batch_cache[1]
+        with open(self.directory / segment, 'rb') as f:
+            f.seek(offset)
+            if segment.endswith('.gz'):
+                # One member: the decompressor stops at its end.
+                decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+                chunks = []
+                while not decompressor.eof:
+                    chunk = f.read(64 * 1024)
+                    if not chunk:
+                        raise ValueError(f"{segment}: truncated batch at offset {offset}")
+                    chunks.append(decompressor.decompress(chunk))
+                lines = b''.join(chunks).splitlines()
+            else:
+                lines = []
+                for line in f:
+                    if not line.strip():
+                        break  # the blank line that ends each batch
+                    lines.append(line)
+        records: Dict[Any, Dict[str, Any]] = {}
+        for line in lines:
+            record = json.loads(line)
+            records[record['question'].get('id')] = record
+        self._batch_cache = ((segment, offset), records)
+        return records
+
+    def append(self, records: List[Dict[str, Any]]) -> None:
+        """Archive {"question", "answers"} records (questions must have an id) as one batch."""
+        if not records:
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        data = b''.join(json.dumps(r, ensure_ascii=False).encode('utf-8') + b'\n' for r in records)
+        with orchestrator.status_lock(self.index_path):  # index.jsonl.lock: one appender at a time
+            segment = self._segment_for_append()
+            with open(segment, 'ab') as f:
+                if self.compress:
+                    data = gzip.compress(data)
+                else:
+                    # A batch ends with a blank line; a leading newline seals a torn previous one.
+                    data += b'\n'
+                    if f.tell() and not _ends_with_newline(segment):
+                        f.write(b'\n')
+                offset = f.tell()
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            entries = b''.join(
+                json.dumps({'id': r['question']['id'], 'segment': segment.name, 'offset': offset}).encode('utf-8')
+                + b'\n'
+                for r in records
+            )
+            with open(self.index_path, 'ab') as f:
+                f.write(entries)
+                f.flush()
+                os.fsync(f.fileno())
+
+    # --- Lookups ---------------------------------------------------------------------
+
+    def record(self, question_id: Any) -> Optional[Dict[str, Any]]:
+        """The archived {"question", "answers"} record for an id, or None."""
+        location = self.index().get(question_id)
+        if location is None:
+            return None
+        record = self._read_batch(*location).get(question_id)
+        return None if record is None else clone_json(record)
+
+    def question(self, question_id: Any) -> Optional[Dict[str, Any]]:
+        record = self.record(question_id)
+        return None if record is None else record['question']
+
+    def answers(self, question_id: Any) -> List[Dict[str, Any]]:
+        record = self.record(question_id)
+        return [] if record is None else record['answers']
+
+
+def _ends_with_newline(path: Path) -> bool:
+    with open(path, 'rb') as f:
+        f.seek(-1, os.SEEK_END)
+        return f.read(1) == b'\n'
+
+
+def _answer_key(answer: Any) -> str:
+    return json.dumps(answer, sort_keys=True)
+
+
+def archive_answered(store: StatusStore, archive: StatusArchive) -> int:
+    """Move answered questions and their answers from `store` into `archive`.
+
+    Returns how many questions were archived. A question re-opened between the archive
+    write and the prune stays live (and shadows its archived copy).
+    """
+    snapshot = store.read()
+    questions = [
+        q for q in snapshot.get('client_questions', [])
+        if isinstance(q, dict) and q.get('delivery_status') == 'answered' and q.get('id') is not None
+    ]
+    if not questions:
+        return 0
+    ids = {q['id'] for q in questions}
+    answers: Dict[Any, List[Dict[str, Any]]] = {}
+    for a in snapshot.get('client_answers', []):
+        if isinstance(a, dict) and a.get('question_id') in ids:
+            answers.setdefault(a['question_id'], []).append(a)
+    archive.append([{'question': q, 'answers': answers.get(q['id'], [])} for q in questions])
+
+    def prune(status: Dict[str, Any]) -> bool:
+        live = status.get('client_questions')
+        if not isinstance(live, list):
+            return False
+        kept = [
+            q for q in live
+            if not (isinstance(q, dict) and q.get('id') in ids and q.get('delivery_status') == 'answered')
+        ]
+        # Drop exactly the archived answers; anything recorded since stays live.
+        pending = Counter(_answer_key(a) for group in answers.values() for a in group)
+        kept_answers = []
+        for a in status.get('client_answers', []):
+            key = _answer_key(a)
+            if pending[key]:
+                pending[key] -= 1
+            else:
+                kept_answers.append(a)
+        if len(kept) == len(live) and len(kept_answers) == len(status.get('client_answers', [])):
+            return False
+        status['client_questions'] = kept
+        if 'client_answers' in status:
+            status['client_answers'] = kept_answers
+        return True
+
+    store.update(prune)
+    return len(questions)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    default_status = PROJECT_ROOT / 'status.json'
+    parser = argparse.ArgumentParser(prog='python -m services.status_archive')
+    parser.add_argument('--status-file', default=str(default_status))
+    parser.add_argument('--store', default=os.getenv('STATUS_STORE', 'json'), help='json | sqlite[:path]')
+    parser.add_argument('--archive-dir', default=None, help='default: <status-file>.archive')
+    sub = parser.add_subparsers(dest='action', required=True)
+    p_run = sub.add_parser('run', help='Archive answered questions')
+    p_run.add_argument('--compress', action='store_true', help='Write gzip segments')
+    p_get = sub.add_parser('get', help='Print an archived question and its answers')
+    p_get.add_argument('question_id')
+    args = parser.parse_args(argv)
+
+    status_file = Path(args.status_file)
+    archive = StatusArchive(
+        Path(args.archive_dir) if args.archive_dir else status_archive_dir(status_file),
+        compress=getattr(args, 'compress', False),
+    )
+    try:
+        if args.action == 'run':
+            count = archive_answered(open_store(args.store, status_file), archive)
+            print(f"Archived {count} answered question(s) to {archive.directory}")
+        else:
+            record = archive.record(args.question_id)
+            if record is None:
+                print(f"ERROR: {args.question_id} is not archived", file=sys.stderr)
+                return 1
+            print(json.dumps(record, indent=2, ensure_ascii=False))
+    except (OSError, ValueError) as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""Structural diff of status documents and subscriptions to the paths that changed.
+
+diff_status(before, after) lists what changed as Change records. Objects are compared
+key by key. In lists, items carrying an `id` unique within the list (client_questions,
+ack_requests) are matched by id, so a question shows up as one add, one remove or the
+fields that changed - not as every index after an insertion. Items without an id, or
+sharing one, are compared by position among themselves and get index paths. Equal
+subtrees are skipped with one C-level comparison, so the cost follows the size of the
+change.
+
+Paths print as `client_questions[Q-1].delivery_status`, `gates.COMMS_READY`,
+`current_phase`. Subscription patterns use the same form with `*` for any key and
+`[*]` for any list item:
+
+    watcher = StatusWatcher(status_snapshot)
+    watcher.subscribe('client_questions[*].delivery_status', on_delivery)
+    watcher.subscribe('gates.*', on_gate)
+    watcher.poll()  # diffs against the previous poll, calls back for matching changes
+
+A change above a subscribed path (a question added or removed as a whole) is
+delivered as the changes it implies at the subscribed depth; a change below one is
+delivered as is.
+"""
+
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+ADDED = 'added'
+REMOVED = 'removed'
+CHANGED = 'changed'
+
+_MISSING = object()
+
+
+@dataclass(frozen=True)
+class ItemId:
+    """Path segment for a list item matched by its `id`."""
+
+    value: Any
+
+
+PathSegment = Any  # str (object key), int (list index) or ItemId
+StatusPath = Tuple[PathSegment, ...]
+
+
+@dataclass(frozen=True)
+class Change:
+    path: StatusPath
+    kind: str  # ADDED, REMOVED or CHANGED
+    old: Any = None  # None when added
+    new: Any = None  # None when removed
+
+    @property
+    def key(self) -> str:
+        """The path as text, e.g. client_questions[Q-1].delivery_status."""
+        return format_path(self.path)
+
+    @property
+    def item_id(self) -> Any:
+        """Id of the first id-matched list item on the path (e.g. the question id), or None."""
+        return next((segment.value for segment in self.path if isinstance(segment, ItemId)), None)
+
+
+def format_path(path: StatusPath) -> str:
+    text = ''
+    for segment in path:
+        if isinstance(segment, ItemId):
+            text += f'[{segment.value}]'
+        elif isinstance(segment, int):
+            text += f'[{segment}]'
+        else:
+            text += f'.{segment}' if text else str(segment)
+    return text
+
+
+# --- Diff ----------------------------------------------------------------------------
+
+
+def _item_id(item: Any) -> Any:
+    if not isinstance(item, dict):
+        return None
+    item_id = item.get('id')
+    return None if isinstance(item_id, (dict, list)) else item_id
+
+
+def _segments(items: List[Any]) -> List[PathSegment]:
+    """Path segment of each item: ItemId if its id is unique in the list, else its index."""
+    ids = [_item_id(item) for item in items]
+    counts = Counter(item_id for item_id in ids if item_id is not None)
+    return [
+        ItemId(item_id) if item_id is not None and counts[item_id] == 1 else index
+        for index, item_id in enumerate(ids)
+    ]
+
+
+def _same(old: Any, new: Any) -> bool:
+    return old is new or (type(old) is type(new) and old == new)
+
+
+def _diff(old: Any, new: Any, path: StatusPath, out: List[Change]) -> None:
+    if _same(old, new):
+        return
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key, value in old.items():
+            if key not in new:
+                out.append(Change(path + (key,), REMOVED, old=value))
+            else:
+                _diff(value, new[key], path + (key,), out)
+        for key, value in new.items():
+            if key not in old:
+                out.append(Change(path + (key,), ADDED, new=value))
+        return
+    if isinstance(old, list) and isinstance(new, list):
+        old_keyed: Dict[ItemId, Any] = {}
+        new_keyed: Dict[ItemId, Any] = {}
+        old_rest: List[Tuple[int, Any]] = []
+        new_rest: List[Tuple[int, Any]] = []
+        for items, keyed, rest in ((old, old_keyed, old_rest), (new, new_keyed, new_rest)):
+            for segment, item in zip(_segments(items), items):
+                if isinstance(segment, ItemId):
+                    keyed[segment] = item
+                else:
+                    rest.append((segment, item))
+        for segment, item in old_keyed.items():
+            if segment not in new_keyed:
+                out.append(Change(path + (segment,), REMOVED, old=item))
+            else:
+                _diff(item, new_keyed[segment], path + (segment,), out)
+        for segment, item in new_keyed.items():
+            if segment not in old_keyed:
+                out.append(Change(path + (segment,), ADDED, new=item))
+        # The rest pair up by position; paths carry the index in the list they come from
+        for (_old_index, old_item), (new_index, new_item) in zip(old_rest, new_rest):
+            _diff(old_item, new_item, path + (new_index,), out)
+        for index, item in old_rest[len(new_rest):]:
+            out.append(Change(path + (index,), REMOVED, old=item))
+        for index, item in new_rest[len(old_rest):]:
+            out.append(Change(path + (index,), ADDED, new=item))
+        return
+    out.append(Change(path, CHANGED, old=old, new=new))
+
+
+def diff_status(before: Optional[Dict[str, Any]], after: Optional[Dict[str, Any]]) -> List[Change]:
+    """Structural changes turning `before` into `after` (None: an empty document)."""
+    out: List[Change] = []
+    _diff(before if before is not None else {}, after if after is not None else {}, (), out)
+    return out
+
+
+# --- Patterns ------------------------------------------------------------------------
+
+_PATTERN_TOKEN = re.compile(r'\[([^\]]*)\]|\.?([^.\[]+)')
+_ANY_KEY = object()
+_ANY_ITEM = object()
+
+
+def parse_pattern(pattern: str) -> Tuple[Any, ...]:
+    """`a.*[*].b` -> ('a', _ANY_KEY, _ANY_ITEM, 'b'); `[3]` is an index, `[Q-1]` an id."""
+    segments: List[Any] = []
+    position = 0
+    while position < len(pattern):
+        match = _PATTERN_TOKEN.match(pattern, position)
+        if match is None or match.end() == position:
+            raise ValueError(f"bad status path pattern: {pattern!r}")
+        item, key = match.groups()
+        if item is not None:
+            segments.append(_ANY_ITEM if item == '*' else int(item) if item.isdigit() else ItemId(item))
+        else:
+            segments.append(_ANY_KEY if key == '*' else key)
+        position = match.end()
+    if not segments:
+        raise ValueError("empty status path pattern")
+    return tuple(segments)
+
+
+def _segment_matches(pattern: Any, segment: PathSegment) -> bool:
+    if pattern is _ANY_KEY:
+        return isinstance(segment, str)
+    if pattern is _ANY_ITEM:
+        return isinstance(segment, (int, ItemId))
+    if isinstance(pattern, ItemId) and isinstance(segment, ItemId):
+        return str(segment.value) == pattern.value
+    return pattern == segment
+
+
+def _children(value: Any, pattern: Any) -> Iterator[Tuple[PathSegment, Any]]:
+    """(segment, child) pairs of `value` matching one pattern segment."""
+    if isinstance(value, dict):
+        for key, child in value.items():
+            if _segment_matches(pattern, key):
+                yield key, child
+    elif isinstance(value, list):
+        for segment, child in zip(_segments(value), value):
+            if _segment_matches(pattern, segment):
+                yield segment, child
+
+
+def _project(path: StatusPath, old: Any, new: Any, rest: Tuple[Any, ...]) -> Iterator[Change]:
+    """Changes at the depth of `rest` implied by `old` -> `new` at `path`."""
+    if not rest:
+        if old is _MISSING:
+            yield Change(path, ADDED, new=new)
+        elif new is _MISSING:
+            yield Change(path, REMOVED, old=old)
+        elif not _same(old, new):
+            yield Change(path, CHANGED, old=old, new=new)
+        return
+    old_children = dict(_children(old, rest[0])) if old is not _MISSING else {}
+    new_children = dict(_children(new, rest[0])) if new is not _MISSING else {}
+    for segment, child in old_children.items():
+        yield from _project(path + (segment,), child, new_children.get(segment, _MISSING), rest[1:])
+    for segment, child in new_children.items():
+        if segment not in old_children:
+            yield from _project(path + (segment,), _MISSING, child, rest[1:])
+
+
+def match_change(pattern: Tuple[Any, ...], change: Change) -> List[Change]:
+    """The part of `change` a subscriber to `pattern` should see (empty if none)."""
+    depth = min(len(pattern), len(change.path))
+    if not all(_segment_matches(pattern[n], change.path[n]) for n in range(depth)):
+        return []
+    if len(change.path) >= len(pattern):
+        return [change]
+    old = change.old if change.kind != ADDED else _MISSING
+    new = change.new if change.kind != REMOVED else _MISSING
+    return list(_project(change.path, old, new, pattern[len(change.path):]))
+
+
+# --- Subscriptions -------------------------------------------------------------------
+
+
+class StatusWatcher:
+    """Diffs successive snapshots of the status document and dispatches the changes.
+
+    `snapshot` returns the current document; it is only read, never modified, and may
+    be shared (an unchanged, identical object costs nothing to diff). The first poll
+    reports the whole document as added. Callbacks get Changes whose values belong to
+    the snapshots - copy before modifying them.
+    """
+
+    def __init__(self, snapshot: Callable[[], Dict[str, Any]]) -> None:
+        self.snapshot = snapshot
+        self._last: Optional[Dict[str, Any]] = None
+        self._subscriptions: List[Tuple[Tuple[Any, ...], Callable[[Change], None]]] = []
+
+    def subscribe(self, pattern: str, callback: Callable[[Change], None]) -> Callable[[], None]:
+        """Call `callback(change)` for changes matching `pattern`; returns an unsubscribe function."""
+        entry = (parse_pattern(pattern), callback)
+        self._subscriptions.append(entry)
+
+        def unsubscribe() -> None:
+            if entry in self._subscriptions:
+                self._subscriptions.remove(entry)
+
+        return unsubscribe
+
+    def publish(self, changes: List[Change]) -> int:
+        """Dispatch `changes` to matching subscribers; returns the number of callbacks made."""
+        calls = 0
+        for change in changes:
+            for pattern, callback in list(self._subscriptions):
+                for matched in match_change(pattern, change):
+                    callback(matched)
+                    calls += 1
+        return calls
+
+    def poll(self) -> List[Change]:
+        """Read a snapshot, dispatch what changed since the last poll and return it."""
+        document = self.snapshot()
+        if document is self._last:
+            return []
+        changes = diff_status(self._last, document)
+        self._last = document
+        self.publish(changes)
+        return changes
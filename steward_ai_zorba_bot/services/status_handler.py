@@ -1,100 +1,278 @@
 #!/usr/bin/env python3
-"""Status.json handler for reading/writing workflow state"""
+"""Status.json handler for reading/writing workflow state
 
-import json
+The state lives in a StatusStore (services/status_store.py): status.json by default,
+or SQLite with STATUS_STORE=sqlite[:path]. Mutations go through status_tx(), which
+commits everything a block changed as one atomic write:
+
+    with status_tx() as status:
+        status['current_phase'] = 'implementation'
+        write_answer('Q-1', 'yes')  # joins the open transaction
+
+Outside a transaction, mark_question_delivered() and write_answer() go straight to the
+store's own operations (a single row update on SQLite).
+"""
+
+import contextlib
+import contextvars
+import os
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import List, Dict, Any, Optional
+from typing import Callable, Iterator, List, Dict, Any, Optional
+
+from services.file_watcher import FileWatcher, watch_files
+from services.status_archive import StatusArchive, archive_answered, status_archive_dir
+from services.status_index import StatusIndex, find_answers, find_question, find_questions
+from services.status_model import StatusModel
+from services.status_store import (
+    PARSE_CACHE_STATS,
+    GroupCommitter,
+    StatusStore,
+    apply_answer,
+    apply_delivered,
+    clone_json,
+    open_store,
+    transaction_patch,
+)
 
 
 # Path to status.json (relative to bot directory)
 STATUS_FILE = Path(__file__).parent.parent.parent / "status.json"
 
+_store: Optional[StatusStore] = None
+_archive: Optional[StatusArchive] = None
+_committer: Optional[GroupCommitter] = None
+
+
+class _Transaction:
+    """An open status_tx(): its document and, from its second lookup on, its StatusIndex.
+
+    Building the index costs several scans, so a transaction doing a single lookup just
+    scans; one doing more builds the index once and shares it.
+    """
+
+    def __init__(self, doc: Dict[str, Any]) -> None:
+        self.doc = doc
+        self._index: Optional[StatusIndex] = None
+        self._lookups = 0
+
+    def index(self) -> Optional[StatusIndex]:
+        """The StatusIndex for this lookup, or None to scan the document instead"""
+        if self._index is None:
+            self._lookups += 1
+            if self._lookups > 1:
+                self._index = StatusIndex(self.doc)
+        return self._index
+
+
+# Transaction open in this thread / task, if any
+_current_tx: contextvars.ContextVar[Optional[_Transaction]] = contextvars.ContextVar('status_tx', default=None)
+
+
+def get_store() -> StatusStore:
+    """The configured store, created on first use"""
+    global _store
+    if _store is None:
+        _store = open_store(os.getenv('STATUS_STORE', 'json'), STATUS_FILE)
+    return _store
+
+
+def set_store(store: Optional[StatusStore]) -> None:
+    """Use a specific store (None: rebuild from STATUS_STORE on next use)"""
+    global _store, _committer
+    _store = store
+    _committer = None
+
+
+def get_archive() -> StatusArchive:
+    """Archive of answered questions (STATUS_ARCHIVE_DIR, default status.json.archive/)"""
+    global _archive
+    if _archive is None:
+        directory = os.getenv('STATUS_ARCHIVE_DIR')
+        _archive = StatusArchive(Path(directory) if directory else status_archive_dir(STATUS_FILE))
+    return _archive
+
+
+def set_archive(archive: Optional[StatusArchive]) -> None:
+    """Use a specific archive (None: rebuild from STATUS_ARCHIVE_DIR on next use)"""
+    global _archive
+    _archive = archive
+
+
+def archive_answered_questions(compress: bool = False) -> int:
+    """Move answered questions and their answers out of the status document"""
+    archive = get_archive()
+    archive.compress = compress
+    return archive_answered(get_store(), archive)
+
+
+def _group_committer() -> GroupCommitter:
+    global _committer
+    store = get_store()
+    if _committer is None or _committer.store is not store:
+        _committer = GroupCommitter(store)
+    return _committer
+
+
+@contextlib.contextmanager
+def status_tx(*, group_commit: bool = False) -> Iterator[Dict[str, Any]]:
+    """Transaction over the status document: yields one in-memory copy to mutate.
+
+    On a clean exit the changes are committed with a single atomic write (none if
+    nothing changed), replayed onto the latest document if another writer got in
+    first; StatusConflict if they no longer apply. An exception discards them.
+    Nested transactions and the helpers below join the enclosing one.
+
+    With group_commit=True, transactions committing from other threads within a few
+    milliseconds share one write.
+    """
+    tx = _current_tx.get()
+    if tx is not None:
+        yield tx.doc
+        return
+    doc = get_store().read()
+    before = clone_json(doc)
+    token = _current_tx.set(_Transaction(doc))
+    try:
+        yield doc
+    finally:
+        _current_tx.reset(token)
+    ops = transaction_patch(before, doc)
+    if not ops:
+        return
+    if group_commit:
+        _group_committer().commit(ops)
+    else:
+        get_store().apply_patches([ops])
+
 
 def read_status() -> Dict[str, Any]:
-    """Read and parse status.json"""
-    with open(STATUS_FILE, 'r') as f:
-        return json.load(f)
+    """Read the whole status document (the caller's own copy; safe to modify)"""
+    tx = _current_tx.get()
+    return clone_json(tx.doc) if tx is not None else get_store().read()
+
+
+def status_snapshot() -> Dict[str, Any]:
+    """The status document for read-only use (shared; never modify it). The same object
+    is returned while the document is unchanged, which makes StatusWatcher polls free."""
+    tx = _current_tx.get()
+    return tx.doc if tx is not None else get_store().snapshot()
+
+
+def watch_status_files(**kwargs: Any) -> Optional[FileWatcher]:
+    """A FileWatcher that fires when the store's files change (None if it has none)"""
+    return watch_files(get_store().watch_paths(), **kwargs)
+
+
+def read_status_model() -> StatusModel:
+    """The status document as a compact typed StatusModel (sections decoded on first use)"""
+    tx = _current_tx.get()
+    return StatusModel.from_dict(clone_json(tx.doc)) if tx is not None else get_store().read_model()
+
+
+def cache_stats() -> Dict[str, Any]:
+    """status.json parse-cache counters: hits, misses, invalidations, hit_rate"""
+    return PARSE_CACHE_STATS.to_dict()
 
 
 def write_status(status: Dict[str, Any]) -> None:
-    """Write status.json with proper formatting"""
-    with open(STATUS_FILE, 'w') as f:
-        json.dump(status, f, indent=2)
-        f.write('\n')
+    """Replace the status document with `status` (only the keys that differ are written)"""
+    with status_tx() as current:
+        current.clear()
+        current.update(clone_json(status))
+
+
+def update_status(mutate: Callable[[Dict[str, Any]], Optional[bool]]) -> Dict[str, Any]:
+    """Apply mutate(status) in a transaction and return the document it produced.
+
+    Nothing is written if mutate leaves the document unchanged.
+    """
+    with status_tx() as status:
+        mutate(status)
+    return clone_json(status)
+
+
+def _get_questions(delivery_status: str) -> List[Dict[str, Any]]:
+    tx = _current_tx.get()
+    if tx is None:
+        return get_store().get_questions(delivery_status)
+    index = tx.index()
+    questions = index.questions(delivery_status) if index is not None else find_questions(tx.doc, delivery_status)
+    return [clone_json(q) for q in questions]
 
 
 def get_pending_questions() -> List[Dict[str, Any]]:
     """Get all questions with delivery_status='pending'"""
-    status = read_status()
-    questions = status.get('client_questions', [])
-    return [q for q in questions if q.get('delivery_status') == 'pending']
+    return _get_questions('pending')
 
 
 def get_delivered_questions() -> List[Dict[str, Any]]:
     """Get all questions with delivery_status='delivered' (awaiting answer)"""
-    status = read_status()
-    questions = status.get('client_questions', [])
-    return [q for q in questions if q.get('delivery_status') == 'delivered']
+    return _get_questions('delivered')
+
+
+def get_question(question_id: str) -> Optional[Dict[str, Any]]:
+    """Question by id, live or archived; None if there is none"""
+    tx = _current_tx.get()
+    if tx is not None:
+        index = tx.index()
+        question = clone_json(index.question(question_id) if index is not None else find_question(tx.doc, question_id))
+    else:
+        question = get_store().get_question(question_id)
+    return question if question is not None else get_archive().question(question_id)
+
+
+def get_answers(question_id: str) -> List[Dict[str, Any]]:
+    """Answers to a question, archived ones first"""
+    tx = _current_tx.get()
+    if tx is not None:
+        index = tx.index()
+        live = clone_json(index.answers(question_id) if index is not None else find_answers(tx.doc, question_id))
+    else:
+        live = get_store().get_answers(question_id)
+    return get_archive().answers(question_id) + live
 
 
 def mark_question_delivered(question_id: str) -> None:
     """Mark a question as delivered to client"""
-    status = read_status()
-    for q in status.get('client_questions', []):
-        if q.get('id') == question_id:
-            q['delivery_status'] = 'delivered'
-            q['delivered_at'] = datetime.now(timezone.utc).isoformat()
-            break
-    write_status(status)
+    delivered_at = datetime.now(timezone.utc).isoformat()
+    tx = _current_tx.get()
+    if tx is None:
+        get_store().mark_question_delivered(question_id, delivered_at)
+    else:
+        apply_delivered(tx.doc, question_id, delivered_at, tx.index())
 
 
 def write_answer(question_id: str, answer: str, source: str = "telegram") -> None:
     """Write client answer to status.json"""
-    status = read_status()
-    
-    # Find the question and mark as answered
-    for q in status.get('client_questions', []):
-        if q.get('id') == question_id:
-            q['delivery_status'] = 'answered'
-            break
-    
-    # Add answer
     answer_obj = {
         "question_id": question_id,
         "answer": answer,
         "source": source,
         "answered_at": datetime.now(timezone.utc).isoformat()
     }
-    
-    if 'client_answers' not in status:
-        status['client_answers'] = []
-    status['client_answers'].append(answer_obj)
-    
-    # Check if all questions are answered
-    pending = [q for q in status.get('client_questions', []) 
-               if q.get('delivery_status') in ('pending', 'delivered')]
-    
-    if not pending:
-        # All questions answered, clear the flag
-        status['client_action_required'] = False
-    
-    write_status(status)
+    tx = _current_tx.get()
+    if tx is None:
+        get_store().record_answer(question_id, answer_obj)
+    else:
+        apply_answer(tx.doc, question_id, answer_obj, tx.index())
+
+
+def _get(key: str, default: Any) -> Any:
+    tx = _current_tx.get()
+    return get_store().get(key, default) if tx is None else clone_json(tx.doc.get(key, default))
 
 
 def is_client_action_required() -> bool:
     """Check if client action is required"""
-    status = read_status()
-    return status.get('client_action_required', False)
+    return _get('client_action_required', False)
 
 
 def get_current_phase() -> str:
     """Get current workflow phase"""
-    status = read_status()
-    return status.get('current_phase', '')
+    return _get('current_phase', '')
 
 
 def get_current_actor() -> str:
     """Get current actor"""
-    status = read_status()
-    return status.get('current_actor', '')
+    return _get('current_actor', '')
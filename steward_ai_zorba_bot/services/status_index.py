@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""Id-keyed indexes over a status document's client_questions and client_answers.
+
+A StatusIndex is built in one pass over a document and then answers "question Q-7",
+"the delivered questions" and "how many questions are still open" without scanning.
+Mutations made through it (set_delivery_status, add_question, add_answer) keep it in
+step with the document. Edits made to the document directly are picked up when they
+change the list objects or their length, or when a looked-up position no longer holds
+the expected id; anything subtler (e.g. rewriting another question's delivery_status by
+hand) needs rebuild().
+
+Building one costs a pass over both lists, so a single lookup is cheaper done with the
+scan functions at the bottom of this module, which give the same answers.
+"""
+
+from typing import Any, Dict, List, Optional
+
+OPEN_STATUSES = ('pending', 'delivered')
+
+
+class StatusIndex:
+    """Indexes over one status document (kept by reference, never copied)."""
+
+    def __init__(self, status: Dict[str, Any]) -> None:
+        self.status = status
+        self.rebuild()
+
+    def rebuild(self) -> None:
+        questions = self.status.get('client_questions')
+        answers = self.status.get('client_answers')
+        self._questions = questions if isinstance(questions, list) else []
+        self._answers = answers if isinstance(answers, list) else []
+        self._question_count = len(self._questions)
+        self._answer_count = len(self._answers)
+        # id -> position of its first question (a linear scan's answer for duplicate ids)
+        self._positions: Dict[Any, int] = {}
+        # delivery_status -> positions of its questions, as an insertion-ordered set
+        self._by_status: Dict[Any, Dict[int, None]] = {}
+        # delivery_status -> number of questions
+        self._counts: Dict[Any, int] = {}
+        for position, question in enumerate(self._questions):
+            self._add_question_at(position, question)
+        self._answer_positions: Dict[Any, List[int]] = {}
+        for position, answer in enumerate(self._answers):
+            self._add_answer_at(position, answer)
+
+    def _add_question_at(self, position: int, question: Any) -> None:
+        if not isinstance(question, dict):
+            return
+        state = question.get('delivery_status')
+        self._counts[state] = self._counts.get(state, 0) + 1
+        self._by_status.setdefault(state, {})[position] = None
+        question_id = question.get('id')
+        if question_id is not None and question_id not in self._positions:
+            self._positions[question_id] = position
+
+    def _add_answer_at(self, position: int, answer: Any) -> None:
+        if isinstance(answer, dict):
+            self._answer_positions.setdefault(answer.get('question_id'), []).append(position)
+
+    def _refresh(self) -> None:
+        """Rebuild if the document's lists were replaced, grown or shrunk behind our back."""
+        questions = self.status.get('client_questions')
+        answers = self.status.get('client_answers')
+        if (
+            (questions is not self._questions and not (questions is None and not self._questions))
+            or (answers is not self._answers and not (answers is None and not self._answers))
+            or len(self._questions) != self._question_count
+            or len(self._answers) != self._answer_count
+        ):
+            self.rebuild()
+
+    # --- Lookups ---------------------------------------------------------------------
+
+    def question(self, question_id: Any) -> Optional[Dict[str, Any]]:
+        """The (first) question with this id, or None."""
+        self._refresh()
+        position = self._positions.get(question_id)
+        if position is None:
+            return None
+        question = self._questions[position]
+        if not isinstance(question, dict) or question.get('id') != question_id:
+            self.rebuild()
+            position = self._positions.get(question_id)
+            return None if position is None else self._questions[position]
+        return question
+
+    def questions(self, delivery_status: Any) -> List[Dict[str, Any]]:
+        """Questions with this delivery_status, in document order."""
+        self._refresh()
+        return [self._questions[position] for position in sorted(self._by_status.get(delivery_status, ()))]
+
+    def ids(self, delivery_status: Any) -> List[Any]:
+        """Ids of questions with this delivery_status, in document order."""
+        return [question.get('id') for question in self.questions(delivery_status)]
+
+    def count(self, delivery_status: Any) -> int:
+        self._refresh()
+        return self._counts.get(delivery_status, 0)
+
+    @property
+    def open_count(self) -> int:
+        """Questions still pending or delivered (client_action_required stays set while > 0)."""
+        return sum(self.count(state) for state in OPEN_STATUSES)
+
+    def answers(self, question_id: Any) -> List[Dict[str, Any]]:
+        """Answers recorded for a question, oldest first."""
+        self._refresh()
+        return [self._answers[position] for position in self._answer_positions.get(question_id, [])]
+
+    # --- Mutations -------------------------------------------------------------------
+
+    def set_delivery_status(self, question_id: Any, delivery_status: Any) -> Optional[Dict[str, Any]]:
+        """Set a question's delivery_status; returns the question, or None if there is none."""
+        question = self.question(question_id)
+        if question is None:
+            return None
+        old = question.get('delivery_status')
+        position = self._positions[question_id]
+        if position not in self._by_status.get(old, {}):
+            # Edited by hand since the last rebuild; counters are suspect too.
+            self.rebuild()
+        self._by_status[old].pop(position)
+        self._counts[old] -= 1
+        question['delivery_status'] = delivery_status
+        self._by_status.setdefault(delivery_status, {})[position] = None
+        self._counts[delivery_status] = self._counts.get(delivery_status, 0) + 1
+        return question
+
+    def add_question(self, question: Dict[str, Any]) -> None:
+        """Append a question to client_questions."""
+        self._refresh()
+        if 'client_questions' not in self.status:
+            self.status['client_questions'] = self._questions = []
+        self._questions.append(question)
+        self._add_question_at(self._question_count, question)
+        self._question_count += 1
+
+    def add_answer(self, answer: Dict[str, Any]) -> None:
+        """Append an answer to client_answers."""
+        self._refresh()
+        if 'client_answers' not in self.status:
+            self.status['client_answers'] = self._answers = []
+        self._answers.append(answer)
+        self._add_answer_at(self._answer_count, answer)
+        self._answer_count += 1
+
+
+# --- One-off lookups ---------------------------------------------------------------------
+
+def _items(status: Dict[str, Any], key: str) -> List[Any]:
+    items = status.get(key)
+    return items if isinstance(items, list) else []
+
+
+def find_question(status: Dict[str, Any], question_id: Any) -> Optional[Dict[str, Any]]:
+    """The (first) question with this id, or None; StatusIndex.question() without the index."""
+    if question_id is None:
+        return None
+    for question in _items(status, 'client_questions'):
+        if isinstance(question, dict) and question.get('id') == question_id:
+            return question
+    return None
+
+
+def find_questions(status: Dict[str, Any], delivery_status: Any) -> List[Dict[str, Any]]:
+    """Questions with this delivery_status, in document order."""
+    return [
+        question for question in _items(status, 'client_questions')
+        if isinstance(question, dict) and question.get('delivery_status') == delivery_status
+    ]
+
+
+def find_answers(status: Dict[str, Any], question_id: Any) -> List[Dict[str, Any]]:
+    """Answers recorded for a question, oldest first."""
+    return [
+        answer for answer in _items(status, 'client_answers')
+        if isinstance(answer, dict) and answer.get('question_id') == question_id
+    ]
+
+
+def count_open(status: Dict[str, Any]) -> int:
+    """Questions still pending or delivered."""
+    return sum(
+        1 for question in _items(status, 'client_questions')
+        if isinstance(question, dict) and question.get('delivery_status') in OPEN_STATUSES
+    )
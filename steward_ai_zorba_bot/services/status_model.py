@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""Compact typed model of the status document.
+
+Questions, answers, ACK requests and changesets are `__slots__` records: the keys the
+workflow knows about are attributes, anything else is kept in `extra`, and to_dict()
+gives back the original keys in their original order. The root keeps the large
+sections (client_questions, client_answers, artifacts) as unparsed text until first
+accessed; for status.json as the orchestrator renders it (indent=2) the top-level
+values are located with one regex pass, so untouched sections are never decoded, and
+dumps() writes them back verbatim.
+
+    model = StatusModel.loads(path.read_text())
+    model.current_phase                 # decoded at load
+    model.client_questions[0].id        # client_questions decoded here, once
+    path.write_text(model.dumps())      # same bytes as orchestrator.render_status_json
+"""
+
+import json
+import re
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
+# Key tuples shared between records with the same keys in the same order
+_KEY_ORDERS: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+
+def _key_order(keys: Tuple[str, ...]) -> Tuple[str, ...]:
+    return _KEY_ORDERS.setdefault(keys, keys)
+
+
+class _Record:
+    """A JSON object with typed slots for FIELDS; other keys go to `extra`."""
+
+    __slots__ = ('_keys', 'extra')
+    FIELDS: Tuple[str, ...] = ()
+    # Fields with a handful of distinct values, stored as one shared string each
+    INTERNED: Tuple[str, ...] = ()
+
+    def __init__(self, **fields: Any) -> None:
+        self._keys: Tuple[str, ...] = ()
+        self.extra: Optional[Dict[str, Any]] = None
+        for name in self.FIELDS:
+            setattr(self, name, fields.pop(name, None))
+        if fields:
+            self.extra = fields
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> '_Record':
+        record = cls.__new__(cls)
+        record._keys = _key_order(tuple(data))
+        for name in cls.FIELDS:
+            setattr(record, name, data.get(name))
+        for name in cls.INTERNED:
+            value = getattr(record, name)
+            if type(value) is str:
+                setattr(record, name, sys.intern(value))
+        extra = {k: v for k, v in data.items() if k not in cls._FIELD_SET}
+        record.extra = extra or None
+        return record
+
+    def to_dict(self) -> Dict[str, Any]:
+        out: Dict[str, Any] = {}
+        extra = self.extra or {}
+        for key in self._keys:
+            if key in self._FIELD_SET:
+                out[key] = getattr(self, key)
+            elif key in extra:
+                out[key] = extra[key]
+        # Set since loading
+        for name in self.FIELDS:
+            if name not in out and getattr(self, name) is not None:
+                out[name] = getattr(self, name)
+        for key, value in extra.items():
+            out.setdefault(key, value)
+        return out
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._FIELD_SET = frozenset(cls.FIELDS)
+
+    def __eq__(self, other: Any) -> bool:
+        return type(other) is type(self) and self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self.to_dict()!r})'
+
+
+class Question(_Record):
+    __slots__ = FIELDS = ('id', 'question', 'text', 'context', 'from_agent', 'delivery_status', 'delivered_at')
+    INTERNED = ('context', 'from_agent', 'delivery_status')
+
+
+class Answer(_Record):
+    __slots__ = FIELDS = ('question_id', 'answer', 'source', 'answered_at')
+    INTERNED = ('source',)
+
+
+class AckRequest(_Record):
+    __slots__ = FIELDS = ('id', 'type', 'status')
+    INTERNED = ('type', 'status')
+
+
+class Changeset(_Record):
+    __slots__ = FIELDS = ('id', 'title', 'status', 'branch', 'pr')
+    INTERNED = ('status',)
+
+
+class Changesets(_Record):
+    """The `changesets` section: the active changeset, the queue and the merge policy."""
+
+    __slots__ = FIELDS = ('active', 'queue', 'policy')
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Changesets':
+        record = super().from_dict(data)
+        record.active = _typed(Changeset, record.active)
+        if isinstance(record.queue, list):
+            record.queue = _typed_list(Changeset, record.queue)
+        return record
+
+    def to_dict(self) -> Dict[str, Any]:
+        out = super().to_dict()
+        if isinstance(out.get('active'), _Record):
+            out['active'] = out['active'].to_dict()
+        if isinstance(out.get('queue'), list):
+            out['queue'] = _plain(out['queue'])
+        return out
+
+
+def _typed(cls: type, value: Any) -> Any:
+    return cls.from_dict(value) if isinstance(value, dict) else value
+
+
+def _typed_list(cls: type, value: Any) -> Any:
+    if not isinstance(value, list):
+        return value
+    return [cls.from_dict(item) if isinstance(item, dict) else item for item in value]
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, _Record):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [item.to_dict() if isinstance(item, _Record) else item for item in value]
+    return value
+
+
+# Top-level sections with a record type: key -> (converter, decoded lazily)
+_SECTIONS = {
+    'client_questions': (lambda v: _typed_list(Question, v), True),
+    'client_answers': (lambda v: _typed_list(Answer, v), True),
+    'artifacts': (lambda v: v, True),
+    'ack_requests': (lambda v: _typed_list(AckRequest, v), False),
+    'changesets': (lambda v: _typed(Changesets, v), False),
+}
+
+# A top-level key line in orchestrator-rendered (indent=2) JSON. Strings cannot hold raw
+# newlines, so this only matches at nesting depth 1.
+_TOP_LEVEL_KEY = re.compile(r'\n  ("(?:[^"\\\n]|\\.)*"): ')
+
+
+def _split_top_level(text: str) -> Optional[List[Tuple[str, str]]]:
+    """(key, value text) pairs of indent=2 JSON, or None if `text` is laid out otherwise."""
+    if not text.startswith('{\n  "'):
+        return None
+    matches = list(_TOP_LEVEL_KEY.finditer(text))
+    tail = text.rstrip()
+    if not matches or not tail.endswith('\n}'):
+        return None
+    pairs = []
+    for n, match in enumerate(matches):
+        end = matches[n + 1].start() if n + 1 < len(matches) else len(tail) - 2
+        value = text[match.end():end]
+        if n + 1 < len(matches):
+            if not value.endswith(','):
+                return None
+            value = value[:-1]
+        if not value or value[0] in ' \n' or value[-1] in ' \n':
+            return None
+        pairs.append((json.loads(match.group(1)), value))
+    return pairs
+
+
+class StatusModel:
+    """The status document: typed sections, other top-level keys as plain JSON values.
+
+    Attribute access works for every top-level key (`model.gates`); unknown keys and
+    their order survive to_dict()/dumps(). Sections not yet accessed stay in `_raw` as
+    source text (or the plain value, for documents built from a dict).
+    """
+
+    __slots__ = ('_values', '_raw')
+
+    def __init__(self) -> None:
+        # key -> decoded value (typed for sections), in document order together with _raw
+        self._values: Dict[str, Any] = {}
+        # key -> value not decoded / converted yet (str: JSON text)
+        self._raw: Dict[str, Any] = {}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'StatusModel':
+        model = cls()
+        for key, value in data.items():
+            model._put(key, value)
+        return model
+
+    @classmethod
+    def loads(cls, text: str) -> 'StatusModel':
+        pairs = _split_top_level(text)
+        if pairs is None:
+            return cls.from_dict(json.loads(text))
+        model = cls()
+        for key, value_text in pairs:
+            section = _SECTIONS.get(key)
+            if section is not None and section[1]:
+                model._values[key] = None  # placeholder keeps the key order
+                model._raw[key] = value_text
+            else:
+                model._put(key, json.loads(value_text))
+        return model
+
+    def _put(self, key: str, value: Any) -> None:
+        section = _SECTIONS.get(key)
+        if section is None:
+            self._values[key] = value
+        elif section[1]:
+            self._values[key] = None
+            self._raw[key] = value
+        else:
+            self._values[key] = section[0](value)
+
+    def __getattr__(self, key: str) -> Any:
+        if key.startswith('_') or key not in self._values:
+            raise AttributeError(key)
+        return self[key]
+
+    def __setattr__(self, key: str, value: Any) -> None:
+        if key in StatusModel.__slots__:
+            object.__setattr__(self, key, value)
+        else:
+            self[key] = value
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._raw:
+            raw = self._raw.pop(key)
+            self._values[key] = _SECTIONS[key][0](json.loads(raw) if isinstance(raw, str) else raw)
+        return self._values[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._raw.pop(key, None)
+        self._values[key] = value
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._values
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self[key] if key in self._values else default
+
+    def keys(self) -> List[str]:
+        return list(self._values)
+
+    def is_loaded(self, key: str) -> bool:
+        """False while a lazy section has not been accessed."""
+        return key in self._values and key not in self._raw
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain JSON document (nested plain values are shared, not copied)."""
+        out = {}
+        for key, value in self._values.items():
+            if key in self._raw:
+                raw = self._raw[key]
+                out[key] = json.loads(raw) if isinstance(raw, str) else raw
+            else:
+                out[key] = _plain(value)
+        return out
+
+    def dumps(self) -> str:
+        """status.json text, identical to orchestrator.render_status_json(self.to_dict())."""
+        if not self._values:
+            return '{}\n'
+        parts = []
+        for key, value in self._values.items():
+            raw = self._raw.get(key)
+            if isinstance(raw, str):
+                text = raw  # untouched section: already rendered at this depth
+            else:
+                text = json.dumps(raw if key in self._raw else _plain(value), indent=2).replace('\n', '\n  ')
+            parts.append(f'  {json.dumps(key)}: {text}')
+        return '{\n' + ',\n'.join(parts) + '\n}\n'
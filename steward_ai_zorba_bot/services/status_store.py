@@ -0,0 +1,634 @@
+#!/usr/bin/env python3
+"""Pluggable storage for workflow state (status.json by default, SQLite optionally).
+
+The JSON backend is status.json itself, written with the orchestrator's versioned
+compare-and-swap protocol. The SQLite backend keeps `client_questions`, `client_answers`
+and `ack_requests` as indexed rows, so question lookups and delivery/answer updates touch
+one row instead of re-parsing and rewriting the whole document. Agents still read
+status.json; render it from the database with:
+
+    python -m services.status_store export --db status.db --output ../status.json
+    python -m services.status_store import --db status.db --status-file ../status.json
+"""
+
+import argparse
+import contextlib
+import json
+import sqlite3
+import sys
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+# orchestrator.py (stdlib only) owns the status.json write protocol; appended so it
+# never shadows the bot's own packages. The imports below need it, hence the noqa.
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+import orchestrator  # noqa: E402
+from services.status_index import StatusIndex, count_open, find_answers, find_question  # noqa: E402
+from services.status_model import StatusModel  # noqa: E402
+
+Mutator = Callable[[Dict[str, Any]], Optional[bool]]
+
+VERSION_KEY = orchestrator.STATUS_VERSION_KEY
+StatusConflict = orchestrator.StatusConflict
+
+
+def clone_json(value: Any) -> Any:
+    """Copy a parsed JSON value (dicts, lists, scalars) - several times faster than deepcopy."""
+    t = type(value)
+    if t is dict:
+        return {k: clone_json(v) for k, v in value.items()}
+    if t is list:
+        return [clone_json(v) for v in value]
+    return value
+
+
+def apply_delivered(status: Dict[str, Any], question_id: str, delivered_at: str,
+                    index: Optional[StatusIndex] = None) -> bool:
+    """Mark a question delivered in `status`; False if there is no such question.
+
+    Pass the document's StatusIndex if it has one; otherwise the questions are scanned.
+    """
+    if index is not None:
+        question = index.set_delivery_status(question_id, 'delivered')
+    else:
+        question = find_question(status, question_id)
+        if question is not None:
+            question['delivery_status'] = 'delivered'
+    if question is None:
+        return False
+    question['delivered_at'] = delivered_at
+    return True
+
+
+def apply_answer(status: Dict[str, Any], question_id: str, answer: Dict[str, Any],
+                 index: Optional[StatusIndex] = None) -> None:
+    """Record `answer` in `status` (see StatusStore.record_answer)."""
+    if index is not None:
+        index.set_delivery_status(question_id, 'answered')
+        index.add_answer(answer)
+        open_count = index.open_count
+    else:
+        question = find_question(status, question_id)
+        if question is not None:
+            question['delivery_status'] = 'answered'
+        answers = status.setdefault('client_answers', [])
+        if isinstance(answers, list):
+            answers.append(answer)
+        open_count = count_open(status)
+    # All questions answered: clear the flag
+    if not open_count:
+        status['client_action_required'] = False
+
+
+class StatusStore(ABC):
+    """Workflow state as the bot sees it; every write bumps the document's `version`."""
+
+    @abstractmethod
+    def read(self) -> Dict[str, Any]:
+        """The whole document, as status.json would contain it."""
+
+    @abstractmethod
+    def write(self, status: Dict[str, Any]) -> None:
+        """Replace the whole document (last writer wins)."""
+
+    @abstractmethod
+    def update(self, mutate: Mutator) -> Dict[str, Any]:
+        """Atomic read-modify-write; mutate may run more than once and return False to skip."""
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.read().get(key, default)
+
+    def read_model(self) -> StatusModel:
+        """The document as a compact StatusModel (the caller's own)."""
+        return StatusModel.from_dict(self.read())
+
+    def snapshot(self) -> Dict[str, Any]:
+        """The document for read-only use: may be shared, and the same object while unchanged."""
+        return self.read()
+
+    def watch_paths(self) -> List[Path]:
+        """Files (in one directory) that change whenever the document does; [] if unknown."""
+        return []
+
+    def get_questions(self, delivery_status: Optional[str] = None) -> List[Dict[str, Any]]:
+        questions = self.read().get('client_questions', [])
+        if delivery_status is None:
+            return list(questions)
+        return [q for q in questions if q.get('delivery_status') == delivery_status]
+
+    def get_question(self, question_id: str) -> Optional[Dict[str, Any]]:
+        """The (first) question with this id, or None."""
+        return find_question(self.read(), question_id)
+
+    def get_answers(self, question_id: str) -> List[Dict[str, Any]]:
+        """Answers recorded for a question, oldest first."""
+        return find_answers(self.read(), question_id)
+
+    def mark_question_delivered(self, question_id: str, delivered_at: str) -> bool:
+        """Mark a question delivered; False if there is no such question."""
+        found = []
+
+        def mark(status: Dict[str, Any]) -> bool:
+            found[:] = [apply_delivered(status, question_id, delivered_at)]
+            return found[0]
+
+        self.update(mark)
+        return found[0]
+
+    def record_answer(self, question_id: str, answer: Dict[str, Any]) -> None:
+        """Append an answer, mark its question answered and clear client_action_required
+        once nothing is pending or delivered any more."""
+        self.update(lambda status: apply_answer(status, question_id, answer))
+
+    def apply_patches(self, patches: List[List[Dict[str, Any]]]) -> Dict[str, Any]:
+        """Apply JSON-patch op lists (RFC 6902) in order as one atomic update.
+
+        Raises StatusConflict if a patch no longer applies to the current document.
+        """
+        def apply(status: Dict[str, Any]) -> None:
+            for ops in patches:
+                try:
+                    orchestrator.apply_json_patch(status, ops)
+                except ValueError as exc:
+                    raise StatusConflict(f"patch does not apply: {exc}") from exc
+
+        return self.update(apply)
+
+    def export_json(self, path: Path) -> None:
+        """Render the document to `path` byte-for-byte as the orchestrator would write it."""
+        orchestrator.write_status_json(path, self.read())
+
+
+@dataclass
+class ParseCacheStats:
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'invalidations': self.invalidations,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
+
+
+# Process-wide parse cache: status file -> [signature it was parsed at, document, StatusIndex
+# or None until first needed]. read() and the get*() lookups return copies of the parts asked
+# for; snapshot() shares the cached document itself, for read-only use.
+_PARSE_CACHE: Dict[str, list] = {}
+PARSE_CACHE_STATS = ParseCacheStats()
+
+
+class JsonStatusStore(StatusStore):
+    """status.json itself; writes are versioned compare-and-swap (see orchestrator).
+
+    Reads are served from the process-wide parse cache while the file's signature
+    (inode, mtime_ns, size, journal size) is unchanged, so polling an unchanged file costs
+    two stat() calls and a copy of the requested part instead of a read and a parse.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._key = os.path.abspath(path)
+
+    def _cached(self) -> list:
+        signature = orchestrator.status_signature(self.path)
+        cached = _PARSE_CACHE.get(self._key)
+        if cached is not None and signature is not None and cached[0] == signature:
+            PARSE_CACHE_STATS.hits += 1
+            return cached
+        PARSE_CACHE_STATS.misses += 1
+        status, version = orchestrator.read_status_versioned(self.path)
+        # Key on what was actually parsed: the file may have changed since the stat above.
+        cached = _PARSE_CACHE[self._key] = [version.signature, status, None]
+        return cached
+
+    def _document(self) -> Dict[str, Any]:
+        return self._cached()[1]
+
+    def _index(self) -> StatusIndex:
+        """Index over the cached document, built once per parse."""
+        cached = self._cached()
+        if cached[2] is None:
+            cached[2] = StatusIndex(cached[1])
+        return cached[2]
+
+    def invalidate(self) -> None:
+        """Forget the cached parse (done after every write through this module)."""
+        if _PARSE_CACHE.pop(self._key, None) is not None:
+            PARSE_CACHE_STATS.invalidations += 1
+
+    def read(self) -> Dict[str, Any]:
+        return clone_json(self._document())
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return clone_json(self._document().get(key, default))
+
+    def snapshot(self) -> Dict[str, Any]:
+        return self._document()
+
+    def watch_paths(self) -> List[Path]:
+        return [self.path, orchestrator.status_journal_path(self.path)]
+
+    def read_model(self) -> StatusModel:
+        # Straight from the text, so large sections stay undecoded until used; with a
+        # journal the file alone is not the current document.
+        if orchestrator.status_journal_path(self.path).exists():
+            return super().read_model()
+        return StatusModel.loads(self.path.read_text(encoding='utf-8'))
+
+    def get_questions(self, delivery_status: Optional[str] = None) -> List[Dict[str, Any]]:
+        if delivery_status is None:
+            return clone_json(self._document().get('client_questions', []))
+        return [clone_json(q) for q in self._index().questions(delivery_status)]
+
+    def get_question(self, question_id: str) -> Optional[Dict[str, Any]]:
+        return clone_json(self._index().question(question_id))
+
+    def get_answers(self, question_id: str) -> List[Dict[str, Any]]:
+        return clone_json(self._index().answers(question_id))
+
+    def write(self, status: Dict[str, Any]) -> None:
+        try:
+            orchestrator.overwrite_status(self.path, status)
+        finally:
+            # A rewrite can reuse the inode within one mtime tick; never trust the old parse.
+            self.invalidate()
+
+    def update(self, mutate: Mutator) -> Dict[str, Any]:
+        try:
+            return orchestrator.update_status(self.path, mutate)
+        finally:
+            self.invalidate()
+
+    def export_json(self, path: Path) -> None:
+        if Path(path).resolve() != self.path.resolve():
+            super().export_json(path)
+
+
+# Top-level keys stored one item per row, with the item fields that get their own column.
+ROW_TABLES: Dict[str, tuple] = {
+    'client_questions': ('id', 'delivery_status'),
+    'client_answers': ('question_id',),
+    'ack_requests': ('id',),
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS document (key TEXT PRIMARY KEY, position INTEGER NOT NULL, value TEXT);
+CREATE TABLE IF NOT EXISTS client_questions (
+    position INTEGER PRIMARY KEY, id TEXT, delivery_status TEXT, data TEXT NOT NULL);
+CREATE INDEX IF NOT EXISTS client_questions_id ON client_questions (id);
+CREATE INDEX IF NOT EXISTS client_questions_delivery ON client_questions (delivery_status, position);
+CREATE TABLE IF NOT EXISTS client_answers (position INTEGER PRIMARY KEY, question_id TEXT, data TEXT NOT NULL);
+CREATE INDEX IF NOT EXISTS client_answers_question ON client_answers (question_id);
+CREATE TABLE IF NOT EXISTS ack_requests (position INTEGER PRIMARY KEY, id TEXT, data TEXT NOT NULL);
+CREATE INDEX IF NOT EXISTS ack_requests_id ON ack_requests (id);
+"""
+
+
+def _version_of(value: Any) -> int:
+    return value if isinstance(value, int) and not isinstance(value, bool) else 0
+
+
+def _column_value(item: Any, field: str) -> Any:
+    value = item.get(field) if isinstance(item, dict) else None
+    return value if isinstance(value, (str, int, float)) or value is None else json.dumps(value)
+
+
+class SqliteStatusStore(StatusStore):
+    """Workflow state in SQLite.
+
+    Scalar and object keys live in `document` (JSON text, with their position so key order
+    survives export). The three row tables hold one JSON item per row plus indexed columns;
+    their `document` row keeps only the position, with value NULL.
+    """
+
+    def __init__(self, db_path: Path) -> None:
+        self.db_path = db_path
+        self._local = threading.local()
+        self._connect().executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            # Autocommit mode: transactions are explicit (BEGIN IMMEDIATE for writers).
+            conn = sqlite3.connect(str(self.db_path), timeout=30, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            self._local.conn = conn
+        return conn
+
+    @contextlib.contextmanager
+    def _transaction(self, write: bool = True) -> Iterator[sqlite3.Connection]:
+        conn = self._connect()
+        conn.execute('BEGIN IMMEDIATE' if write else 'BEGIN')
+        try:
+            yield conn
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+        conn.execute('COMMIT')
+
+    def close(self) -> None:
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    # -- whole-document access --------------------------------------------------------
+
+    def _read(self, conn: sqlite3.Connection) -> Dict[str, Any]:
+        status: Dict[str, Any] = {}
+        for key, value in conn.execute('SELECT key, value FROM document ORDER BY position'):
+            if value is None and key in ROW_TABLES:
+                status[key] = [json.loads(data) for (data,) in
+                               conn.execute(f'SELECT data FROM {key} ORDER BY position')]
+            else:
+                status[key] = json.loads(value)
+        return status
+
+    def _replace(self, conn: sqlite3.Connection, status: Dict[str, Any]) -> None:
+        conn.execute('DELETE FROM document')
+        for table in ROW_TABLES:
+            conn.execute(f'DELETE FROM {table}')
+        for position, (key, value) in enumerate(status.items()):
+            if key in ROW_TABLES and isinstance(value, list):
+                conn.execute('INSERT INTO document VALUES (?, ?, NULL)', (key, position))
+                fields = ROW_TABLES[key]
+                conn.executemany(
+                    f'INSERT INTO {key} (position, {", ".join(fields)}, data) '
+                    f'VALUES (?, {", ".join("?" * len(fields))}, ?)',
+                    [(n, *(_column_value(item, f) for f in fields), json.dumps(item))
+                     for n, item in enumerate(value)],
+                )
+            else:
+                conn.execute('INSERT INTO document VALUES (?, ?, ?)', (key, position, json.dumps(value)))
+
+    def _version(self, conn: sqlite3.Connection) -> int:
+        row = conn.execute('SELECT value FROM document WHERE key = ?', (VERSION_KEY,)).fetchone()
+        return _version_of(json.loads(row[0])) if row and row[0] is not None else 0
+
+    def _bump_version(self, conn: sqlite3.Connection) -> int:
+        version = self._version(conn) + 1
+        updated = conn.execute('UPDATE document SET value = ? WHERE key = ?', (json.dumps(version), VERSION_KEY))
+        if not updated.rowcount:
+            conn.execute(
+                'INSERT INTO document VALUES (?, (SELECT COALESCE(MAX(position), -1) + 1 FROM document), ?)',
+                (VERSION_KEY, json.dumps(version)),
+            )
+        return version
+
+    def read(self) -> Dict[str, Any]:
+        with self._transaction(write=False) as conn:
+            return self._read(conn)
+
+    def load_document(self, status: Dict[str, Any]) -> None:
+        """Replace the database content with `status` as-is (import; version kept)."""
+        with self._transaction() as conn:
+            self._replace(conn, status)
+
+    def write(self, status: Dict[str, Any]) -> None:
+        with self._transaction() as conn:
+            status[VERSION_KEY] = max(self._version(conn), _version_of(status.get(VERSION_KEY))) + 1
+            self._replace(conn, status)
+
+    def update(self, mutate: Mutator) -> Dict[str, Any]:
+        with self._transaction() as conn:
+            status = self._read(conn)
+            if mutate(status) is False:
+                return status
+            status[VERSION_KEY] = self._version(conn) + 1
+            self._replace(conn, status)
+        return status
+
+    # -- row-level operations ---------------------------------------------------------
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._transaction(write=False) as conn:
+            row = conn.execute('SELECT value FROM document WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                return default
+            if row[0] is None and key in ROW_TABLES:
+                return [json.loads(data) for (data,) in conn.execute(f'SELECT data FROM {key} ORDER BY position')]
+            return json.loads(row[0])
+
+    def get_questions(self, delivery_status: Optional[str] = None) -> List[Dict[str, Any]]:
+        if delivery_status is None:
+            return self.get('client_questions', [])
+        rows = self._connect().execute(
+            'SELECT data FROM client_questions WHERE delivery_status = ? ORDER BY position', (delivery_status,)
+        )
+        return [json.loads(data) for (data,) in rows]
+
+    def watch_paths(self) -> List[Path]:
+        # In WAL mode commits land in the -wal file
+        return [self.db_path, self.db_path.with_name(self.db_path.name + '-wal')]
+
+    def get_question(self, question_id: str) -> Optional[Dict[str, Any]]:
+        row = self._connect().execute(
+            'SELECT data FROM client_questions WHERE id = ? ORDER BY position LIMIT 1', (question_id,)
+        ).fetchone()
+        return None if row is None else json.loads(row[0])
+
+    def get_answers(self, question_id: str) -> List[Dict[str, Any]]:
+        rows = self._connect().execute(
+            'SELECT data FROM client_answers WHERE question_id = ? ORDER BY position', (question_id,)
+        )
+        return [json.loads(data) for (data,) in rows]
+
+    def _set_question(self, conn: sqlite3.Connection, question_id: str, **fields: Any) -> bool:
+        row = conn.execute(
+            'SELECT position, data FROM client_questions WHERE id = ? ORDER BY position LIMIT 1', (question_id,)
+        ).fetchone()
+        if row is None:
+            return False
+        question = json.loads(row[1])
+        question.update(fields)
+        conn.execute(
+            'UPDATE client_questions SET delivery_status = ?, data = ? WHERE position = ?',
+            (_column_value(question, 'delivery_status'), json.dumps(question), row[0]),
+        )
+        return True
+
+    def mark_question_delivered(self, question_id: str, delivered_at: str) -> bool:
+        with self._transaction() as conn:
+            if not self._set_question(conn, question_id, delivery_status='delivered', delivered_at=delivered_at):
+                return False
+            self._bump_version(conn)
+        return True
+
+    def record_answer(self, question_id: str, answer: Dict[str, Any]) -> None:
+        with self._transaction() as conn:
+            self._set_question(conn, question_id, delivery_status='answered')
+
+            answers = conn.execute('SELECT value FROM document WHERE key = ?', ('client_answers',)).fetchone()
+            if answers is None:
+                conn.execute(
+                    'INSERT INTO document VALUES (?, (SELECT COALESCE(MAX(position), -1) + 1 FROM document), NULL)',
+                    ('client_answers',),
+                )
+            elif answers[0] is not None:
+                # Not stored as rows (it was not a list); fall back to a whole-document update.
+                status = self._read(conn)
+                apply_answer(status, question_id, answer)
+                status[VERSION_KEY] = self._version(conn) + 1
+                self._replace(conn, status)
+                return
+            conn.execute(
+                'INSERT INTO client_answers (position, question_id, data) '
+                'VALUES ((SELECT COALESCE(MAX(position), -1) + 1 FROM client_answers), ?, ?)',
+                (_column_value(answer, 'question_id'), json.dumps(answer)),
+            )
+
+            open_questions = conn.execute(
+                "SELECT EXISTS (SELECT 1 FROM client_questions WHERE delivery_status IN ('pending', 'delivered'))"
+            ).fetchone()[0]
+            if not open_questions:
+                updated = conn.execute(
+                    'UPDATE document SET value = ? WHERE key = ?', ('false', 'client_action_required')
+                )
+                if not updated.rowcount:
+                    conn.execute(
+                        'INSERT INTO document VALUES (?, (SELECT COALESCE(MAX(position), -1) + 1 FROM document), ?)',
+                        ('client_action_required', 'false'),
+                    )
+            self._bump_version(conn)
+
+
+def transaction_patch(before: Dict[str, Any], after: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """JSON-patch ops turning `before` into `after`, ready to replay on a newer document.
+
+    `version` is left to the store. List positions are guarded with a "test" on the
+    element's `id`, so an op aimed at Q-3 fails (StatusConflict) rather than landing on
+    another question when a concurrent writer reordered the list.
+    """
+    ops = [op for op in orchestrator.diff_json(before, after) if op['path'].split('/')[1:2] != [VERSION_KEY]]
+    guards: Dict[str, Dict[str, Any]] = {}
+    for op in ops:
+        node, pointer = before, ''
+        for token in op['path'].split('/')[1:]:
+            if isinstance(node, list):
+                if token == '-' or not token.isdigit() or int(token) >= len(node):
+                    break
+                node = node[int(token)]
+                pointer += '/' + token
+                if isinstance(node, dict) and 'id' in node and pointer not in guards:
+                    guards[pointer] = {'op': 'test', 'path': pointer + '/id', 'value': node['id']}
+            elif isinstance(node, dict):
+                key = token.replace('~1', '/').replace('~0', '~')
+                if key not in node:
+                    break
+                node = node[key]
+                pointer += '/' + token
+            else:
+                break
+    return list(guards.values()) + ops if ops else []
+
+
+class GroupCommitter:
+    """Coalesces transactions that commit within `window` seconds into one store update.
+
+    The first committer waits out the window, then applies every patch collected so far
+    in one atomic write; the others block until that write is done. If the combined
+    update fails, each patch is retried on its own so one conflicting transaction does
+    not take down the rest. Threads only: an asyncio caller should commit from an
+    executor.
+    """
+
+    def __init__(self, store: StatusStore, *, window: float = 0.005) -> None:
+        self.store = store
+        self.window = window
+        self.commits = 0
+        self._lock = threading.Lock()
+        self._batch: Optional[Dict[str, Any]] = None
+
+    def commit(self, ops: List[Dict[str, Any]]) -> None:
+        with self._lock:
+            batch, leader = self._batch, self._batch is None
+            if leader:
+                batch = self._batch = {'patches': [], 'errors': {}, 'done': threading.Event()}
+            slot = len(batch['patches'])
+            batch['patches'].append(ops)
+        if leader:
+            time.sleep(self.window)
+            with self._lock:
+                self._batch = None
+            self._flush(batch)
+        else:
+            batch['done'].wait()
+        error = batch['errors'].get(slot)
+        if error is not None:
+            raise error
+
+    def _flush(self, batch: Dict[str, Any]) -> None:
+        patches = batch['patches']
+        try:
+            try:
+                self.store.apply_patches(patches)
+                self.commits += 1
+            except Exception as exc:
+                if len(patches) == 1:
+                    batch['errors'][0] = exc
+                    return
+                for slot, ops in enumerate(patches):
+                    try:
+                        self.store.apply_patches([ops])
+                        self.commits += 1
+                    except Exception as slot_exc:
+                        batch['errors'][slot] = slot_exc
+        finally:
+            batch['done'].set()
+
+
+def open_store(spec: str, status_file: Path) -> StatusStore:
+    """Build a store from a STATUS_STORE value: "json" (default), "sqlite" (status.db next
+    to status.json) or "sqlite:<path>"."""
+    backend, _, location = spec.strip().partition(':')
+    backend = backend.lower() or 'json'
+    if backend == 'json':
+        return JsonStatusStore(Path(location) if location else status_file)
+    if backend == 'sqlite':
+        return SqliteStatusStore(Path(location) if location else status_file.with_suffix('.db'))
+    raise ValueError(f"STATUS_STORE: unknown backend '{backend}' (expected json or sqlite[:path])")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    default_status = PROJECT_ROOT / 'status.json'
+    parser = argparse.ArgumentParser(prog='python -m services.status_store')
+    parser.add_argument('action', choices=['import', 'export'],
+                        help='import: status.json -> database, export: database -> status.json')
+    parser.add_argument('--db', default=str(default_status.with_suffix('.db')))
+    parser.add_argument('--status-file', default=str(default_status), help='import source')
+    parser.add_argument('--output', default=None, help='export target (default: --status-file)')
+    args = parser.parse_args(argv)
+
+    store = SqliteStatusStore(Path(args.db))
+    try:
+        if args.action == 'import':
+            status = orchestrator.read_status_versioned(Path(args.status_file))[0]
+            store.load_document(status)
+            print(f"Imported {args.status_file} into {args.db}")
+        else:
+            output = Path(args.output or args.status_file)
+            store.export_json(output)
+            print(f"Exported {args.db} to {output}")
+    except (OSError, ValueError, sqlite3.Error) as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 1
+    finally:
+        store.close()
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""Persistent cache of GPT answer suggestions, so a question asked again costs no API call.
+
+Agents ask the same clarification questions across cycles and projects. Entries are
+keyed by a SHA-256 of the normalized question (case-folded, whitespace collapsed), the
+normalized context, num_suggestions and the model, and stored in SQLite
+(suggestion_cache.db in the bot directory by default). An entry expires `ttl` seconds
+after it was generated; beyond `max_entries` the least recently used ones are evicted.
+
+A lookup is a plain read. The last-used times of hits, and the expired entries found,
+are kept in memory and written in batches (with the next put(), every TOUCH_BATCH
+lookups, or on close()), so a lookup never waits for the database's write lock.
+
+    python -m services.suggestion_cache stats
+    python -m services.suggestion_cache clear
+"""
+
+import argparse
+import contextlib
+import hashlib
+import json
+import sqlite3
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+DEFAULT_PATH = Path(__file__).parent.parent / 'suggestion_cache.db'
+DEFAULT_TTL = 30 * 24 * 3600.0
+DEFAULT_MAX_ENTRIES = 2000
+TOUCH_BATCH = 64
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS suggestions (
+    key TEXT PRIMARY KEY,
+    suggestions TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    used_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS suggestions_used_at ON suggestions (used_at);
+'''
+
+
+def normalize(text: str) -> str:
+    """Case- and whitespace-insensitive form of a question or context"""
+    return ' '.join(text.casefold().split())
+
+
+def cache_key(question: str, context: str, num_suggestions: int, model: str) -> str:
+    payload = json.dumps([normalize(question), normalize(context), num_suggestions, model])
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class SuggestionCache:
+    """Suggestions by prompt in SQLite, LRU-bounded, with a time to live"""
+
+    def __init__(self, db_path: Path = DEFAULT_PATH, max_entries: int = DEFAULT_MAX_ENTRIES,
+                 ttl: float = DEFAULT_TTL, clock: Callable[[], float] = time.time) -> None:
+        """Open (or create) the cache
+
+        Raises:
+            ValueError: If max_entries or ttl is not positive
+            sqlite3.Error: If the database cannot be opened
+        """
+        if max_entries < 1 or ttl <= 0:
+            raise ValueError(f"need max_entries >= 1 and ttl > 0, got {max_entries}, {ttl}")
+        self.db_path = Path(db_path)
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        self._local = threading.local()
+        self._touch_lock = threading.Lock()
+        # Not yet written: key -> last hit, and key -> created_at of an expired entry seen
+        self._touched: Dict[str, float] = {}
+        self._stale: Dict[str, float] = {}
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evicted = 0
+        self._connect().executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.db_path), timeout=30, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')  # losing the last entries on power loss is fine
+            self._local.conn = conn
+        return conn
+
+    @contextlib.contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        conn = self._connect()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            yield conn
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+        conn.execute('COMMIT')
+
+    def close(self) -> None:
+        """Write pending last-used times and close this thread's connection"""
+        self.flush()
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def _defer(self, pending: Dict[str, float], key: str, value: float) -> None:
+        with self._touch_lock:
+            pending[key] = value
+            batch_full = len(self._touched) + len(self._stale) >= TOUCH_BATCH
+        if batch_full:
+            self.flush()
+
+    def _take_pending(self) -> Tuple[Dict[str, float], Dict[str, float]]:
+        with self._touch_lock:
+            pending = self._touched, self._stale
+            self._touched, self._stale = {}, {}
+        return pending
+
+    @staticmethod
+    def _write_pending(conn: sqlite3.Connection, touched: Dict[str, float], stale: Dict[str, float]) -> None:
+        conn.executemany('UPDATE suggestions SET used_at = MAX(used_at, ?) WHERE key = ?',
+                         [(used_at, key) for key, used_at in touched.items()])
+        # Only the entry found expired: it may have been regenerated since.
+        conn.executemany('DELETE FROM suggestions WHERE key = ? AND created_at = ?', stale.items())
+
+    def flush(self) -> None:
+        """Write the last-used times and expiries found since the last flush"""
+        touched, stale = self._take_pending()
+        if touched or stale:
+            with self._transaction() as conn:
+                self._write_pending(conn, touched, stale)
+
+    def get(self, question: str, context: str, num_suggestions: int, model: str) -> Optional[List[str]]:
+        """Cached suggestions for the prompt, or None (missing or expired)"""
+        key = cache_key(question, context, num_suggestions, model)
+        now = self._clock()
+        row = self._connect().execute(
+            'SELECT suggestions, created_at FROM suggestions WHERE key = ?', (key,)
+        ).fetchone()
+        if row is not None and now - row[1] >= self.ttl:
+            self.expired += 1
+            self._defer(self._stale, key, row[1])
+            row = None
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._defer(self._touched, key, now)
+        return json.loads(row[0])
+
+    def put(self, question: str, context: str, num_suggestions: int, model: str,
+            suggestions: List[str]) -> None:
+        """Store suggestions for the prompt, evicting the least recently used beyond max_entries"""
+        key = cache_key(question, context, num_suggestions, model)
+        now = self._clock()
+        touched, stale = self._take_pending()
+        with self._transaction() as conn:
+            self._write_pending(conn, touched, stale)  # first, so eviction sees recent hits
+            conn.execute(
+                'INSERT OR REPLACE INTO suggestions (key, suggestions, created_at, used_at) VALUES (?, ?, ?, ?)',
+                (key, json.dumps(suggestions, ensure_ascii=False), now, now),
+            )
+            excess = conn.execute('SELECT COUNT(*) FROM suggestions').fetchone()[0] - self.max_entries
+            if excess > 0:
+                conn.execute(
+                    'DELETE FROM suggestions WHERE key IN '
+                    '(SELECT key FROM suggestions ORDER BY used_at LIMIT ?)', (excess,)
+                )
+                self.evicted += excess
+
+    def clear(self) -> int:
+        """Drop every entry; returns how many there were"""
+        self._take_pending()
+        with self._transaction() as conn:
+            return conn.execute('DELETE FROM suggestions').rowcount
+
+    def __len__(self) -> int:
+        return self._connect().execute('SELECT COUNT(*) FROM suggestions').fetchone()[0]
+
+    def stats(self) -> Dict[str, Any]:
+        """hits, misses, hit_rate (this process), expired, evicted, entries (on disk)"""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'expired': self.expired,
+            'evicted': self.evicted,
+            'entries': len(self),
+        }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m services.suggestion_cache')
+    parser.add_argument('--db', default=str(DEFAULT_PATH))
+    sub = parser.add_subparsers(dest='action', required=True)
+    sub.add_parser('stats', help='Print the number of cached prompts')
+    sub.add_parser('clear', help='Drop every cached suggestion')
+    args = parser.parse_args(argv)
+
+    try:
+        cache = SuggestionCache(Path(args.db))
+        if args.action == 'stats':
+            print(f"{len(cache)} cached prompt(s) in {cache.db_path}")
+        else:
+            print(f"Cleared {cache.clear()} cached prompt(s) from {cache.db_path}")
+    except (OSError, sqlite3.Error) as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Unit Tests for Telegram Channel Modules"""
 
+import asyncio
 import unittest
 import sys
 from pathlib import Path
@@ -8,6 +9,8 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from apps.telegram import reverse_message, Tracker, Log
+from apps.telegram.poll_scheduler import AdaptivePollScheduler
+from apps.telegram.suggestion_prefetch import SuggestionPrefetcher
 
 
 class TestMessageProcessor(unittest.TestCase):
@@ -65,5 +68,112 @@ class TestLog(unittest.TestCase):
         self.assertIn('exchange', Log.ICONS)
 
 
+class TestAdaptivePollScheduler(unittest.TestCase):
+    """Test adaptive poll intervals"""
+    
+    def setUp(self):
+        self.scheduler = AdaptivePollScheduler(min_interval=0.5, max_interval=4, jitter=0.2, rand=lambda: 0.5)
+    
+    def test_backs_off_to_ceiling(self):
+        delays = [self.scheduler.record(active=False) for _ in range(5)]
+        self.assertEqual(delays, [1, 2, 4, 4, 4])
+    
+    def test_activity_resets(self):
+        self.scheduler.record(active=False)
+        self.scheduler.record(active=False)
+        self.assertEqual(self.scheduler.record(active=True), 0.5)
+        self.scheduler.record(active=False)
+        self.scheduler.reset()
+        self.assertEqual(self.scheduler.interval, 0.5)
+    
+    def test_jitter_bounds(self):
+        low = AdaptivePollScheduler(min_interval=1, max_interval=4, jitter=0.2, rand=lambda: 0.0)
+        high = AdaptivePollScheduler(min_interval=1, max_interval=4, jitter=0.2, rand=lambda: 1.0)
+        self.assertAlmostEqual(low.next_delay(), 0.8)
+        self.assertAlmostEqual(high.next_delay(), 1.2)
+        high.interval = 4
+        self.assertEqual(high.next_delay(), 4)  # never above the ceiling
+    
+    def test_metrics(self):
+        self.scheduler.record(active=True)
+        self.scheduler.record(active=False)
+        self.scheduler.record(active=False)
+        self.scheduler.record(active=False)
+        metrics = self.scheduler.metrics()
+        self.assertEqual(metrics['polls'], 4)
+        self.assertEqual(metrics['wasted_polls'], 3)
+        self.assertEqual(metrics['wasted_ratio'], 0.75)
+        self.assertEqual(metrics['interval'], 4)
+    
+    def test_invalid_settings(self):
+        with self.assertRaises(ValueError):
+            AdaptivePollScheduler(min_interval=5, max_interval=1)
+        with self.assertRaises(ValueError):
+            AdaptivePollScheduler(jitter=1.5)
+
+
+
+class TestSuggestionPrefetcher(unittest.TestCase):
+    """Test background suggestion prefetch"""
+    
+    def setUp(self):
+        self.calls = []
+        self.running = [0, 0]  # current, peak
+    
+    async def suggest(self, text, context):
+        self.calls.append(text)
+        self.running[0] += 1
+        self.running[1] = max(self.running)
+        await asyncio.sleep(0.01)
+        self.running[0] -= 1
+        if text == 'boom':
+            raise RuntimeError('API down')
+        return [f'{text}!']
+    
+    def test_prefetched_then_reused(self):
+        async def scenario():
+            prefetcher = SuggestionPrefetcher(self.suggest, workers=2)
+            questions = [{'id': f'Q-{n}', 'question': f'q{n}'} for n in range(4)]
+            for question in questions:
+                self.assertTrue(prefetcher.submit(question))
+            self.assertFalse(prefetcher.submit(questions[0]))  # already queued
+            first = await prefetcher.get(questions[0])  # joins the running call
+            await asyncio.sleep(0.05)
+            rest = [await prefetcher.get(q) for q in questions[1:]]
+            prefetcher.close()
+            return prefetcher, first, rest
+        
+        prefetcher, first, rest = asyncio.run(scenario())
+        self.assertEqual(first, ['q0!'])
+        self.assertEqual(rest, [['q1!'], ['q2!'], ['q3!']])
+        self.assertEqual(sorted(self.calls), ['q0', 'q1', 'q2', 'q3'])
+        self.assertEqual(self.running[1], 2)  # never more than `workers` at once
+        self.assertEqual(prefetcher.stats()['joined'], 1)
+        self.assertEqual(prefetcher.stats()['hits'], 3)
+    
+    def test_bounded_queue_and_fallback(self):
+        async def scenario():
+            prefetcher = SuggestionPrefetcher(self.suggest, workers=1, max_queue=1)
+            self.assertTrue(prefetcher.submit({'id': 'Q-1', 'question': 'a'}))
+            self.assertFalse(prefetcher.submit({'id': 'Q-2', 'question': 'b'}))  # queue full
+            self.assertEqual(await prefetcher.get({'id': 'Q-2', 'question': 'b'}), ['b!'])
+            # Edited question text: the prefetched answer is stale
+            self.assertEqual(await prefetcher.get({'id': 'Q-1', 'question': 'c'}), ['c!'])
+            prefetcher.submit({'id': 'Q-3', 'question': 'boom'})
+            with self.assertRaises(RuntimeError):
+                await prefetcher.get({'id': 'Q-3', 'question': 'boom'})
+            prefetcher.discard('Q-3')
+            prefetcher.close()
+            return prefetcher.stats()
+        
+        stats = asyncio.run(scenario())
+        self.assertEqual(stats['dropped'], 1)
+        self.assertEqual(stats['misses'], 2)
+    
+    def test_invalid_settings(self):
+        with self.assertRaises(ValueError):
+            SuggestionPrefetcher(self.suggest, workers=0)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,9 +1,17 @@
 #!/usr/bin/env python3
 """Unit tests for orchestrator workflow helpers."""
 
-import unittest
+import contextlib
+import io
+import itertools
+import json
+import shutil
 import sys
+import tempfile
+import threading
+import unittest
 from pathlib import Path
+from unittest import mock
 
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
@@ -99,6 +107,40 @@ class TestOrchestratorTransitions(unittest.TestCase):
         self.assertIsNone(patch)
 
 
+class TestTransitionTable(unittest.TestCase):
+    def test_table_matches_reference_rules_over_state_space(self):
+        actors = sorted({a for pair in orchestrator.PHASE_ACTORS.values() for a in pair if a})
+        extra = ["weird", "", None]
+        space = itertools.product(
+            orchestrator.PHASES + ["bogus", "", None],
+            actors + ["nobody", None],
+            sorted(orchestrator.ACTOR_STATUSES) + extra,
+            sorted(orchestrator.REVIEW_STATUSES) + extra,
+            sorted(orchestrator.PHASE_STATUSES) + extra,
+        )
+        checked = 0
+        for phase, actor, actor_status, review_status, phase_status in space:
+            status = _base_status(
+                current_phase=phase,
+                current_actor=actor,
+                actor_status=actor_status,
+                review_status=review_status,
+                phase_status=phase_status,
+            )
+            expected = orchestrator._transition_rules(status)
+            actual = orchestrator.compute_next_transition(status)
+            self.assertEqual(
+                expected, None if actual is None else dict(actual), (phase, actor, actor_status, review_status, phase_status)
+            )
+            checked += 1
+        self.assertGreater(checked, 50000)
+
+    def test_patches_are_read_only(self):
+        patch = orchestrator.compute_next_transition(_base_status(current_actor="nobody"))
+        with self.assertRaises(TypeError):
+            patch["current_actor"] = "x"
+
+
 class TestOrchestratorReconcile(unittest.TestCase):
     def test_reconcile_sets_comms_gate(self):
         status = _base_status(comms={"state": "ready"}, gates={"COMMS_READY": "pending"})
@@ -117,5 +159,621 @@ class TestOrchestratorReconcile(unittest.TestCase):
         self.assertEqual(status["gates"]["REQ_CLIENT_ACK"], "pass")
 
 
+class TestOrchestratorDaemon(unittest.TestCase):
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.status_path = self.tmp / "status.json"
+        self.history_path = self.tmp / "status_history.csv"
+        status = _base_status(
+            current_phase="requirements",
+            current_actor="system_analyst",
+            actor_status="completed",
+        )
+        self.status_path.write_text(json.dumps(status), encoding="utf-8")
+
+        self.server = orchestrator.OrchestratorDaemon(
+            orchestrator._default_socket_path(self.status_path), self.status_path.resolve()
+        )
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(self.tmp)
+
+    def _run(self, *argv):
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            rc = orchestrator.main(["--status-file", str(self.status_path), *argv])
+        return rc, out.getvalue()
+
+    def test_step_is_served_from_memory(self):
+        rc, out = self._run("step", "--apply", "--history-file", str(self.history_path))
+        self.assertEqual(rc, 0)
+        self.assertIn("system_analyst_reviewer", out)
+        self.assertEqual(json.loads(self.status_path.read_text())["current_actor"], "system_analyst_reviewer")
+        self.assertEqual(len(self.history_path.read_text().splitlines()), 2)
+
+        rc, out = self._run("next")
+        self.assertIn("current_actor=system_analyst_reviewer", out)
+        self.assertEqual(self.server.state.reloads, 1)
+
+    def test_external_edit_is_picked_up(self):
+        self._run("next")
+        status = json.loads(self.status_path.read_text())
+        status["current_actor"] = "someone_else"
+        orchestrator._atomic_write_json(self.status_path, status)
+
+        rc, out = self._run("next")
+        self.assertIn("current_actor=someone_else", out)
+        self.assertEqual(self.server.state.reloads, 2)
+
+    def test_dry_run_does_not_touch_cached_state(self):
+        self._run("step")
+        rc, out = self._run("next")
+        self.assertIn("current_actor=system_analyst\n", out)
+
+    def test_falls_back_when_daemon_serves_another_file(self):
+        other = self.tmp / "other.json"
+        other.write_text(json.dumps(_base_status()), encoding="utf-8")
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            rc = orchestrator.main(
+                ["--status-file", str(other), "--socket", str(self.server.server_address), "next"]
+            )
+        self.assertEqual(rc, 0)
+        self.assertIn("current_phase=bootstrap_comms", out.getvalue())
+
+
+class TestStatusCas(unittest.TestCase):
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.status_path = self.tmp / "status.json"
+        self.status_path.write_text(json.dumps(_base_status(actor_status="completed")), encoding="utf-8")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def _version(self):
+        return json.loads(self.status_path.read_text()).get("version")
+
+    def test_update_bumps_version(self):
+        orchestrator.update_status(self.status_path, lambda s: s.update(problem={"text": "a"}))
+        orchestrator.update_status(self.status_path, lambda s: s.update(problem={"text": "b"}))
+        self.assertEqual(self._version(), 2)
+        self.assertEqual(json.loads(self.status_path.read_text())["problem"], {"text": "b"})
+
+    def test_returning_false_skips_write(self):
+        orchestrator.update_status(self.status_path, lambda s: False)
+        self.assertIsNone(self._version())
+
+    def test_stale_write_is_rejected(self):
+        status, version = orchestrator.read_status_versioned(self.status_path)
+        orchestrator.update_status(self.status_path, lambda s: s.update(cycle=5))
+        status["cycle"] = 1
+        with self.assertRaises(orchestrator.StatusConflict):
+            orchestrator.cas_write_status(self.status_path, status, version)
+        self.assertEqual(json.loads(self.status_path.read_text())["cycle"], 5)
+
+    def test_concurrent_updates_are_not_lost(self):
+        def increment(status):
+            status["cycle"] += 1
+
+        def writer():
+            for _ in range(25):
+                orchestrator.update_status(self.status_path, increment, retries=100)
+
+        threads = [threading.Thread(target=writer) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        status = json.loads(self.status_path.read_text())
+        self.assertEqual(status["cycle"], 200)
+        self.assertEqual(status["version"], 200)
+
+    def test_step_retries_after_concurrent_edit(self):
+        real_advance = orchestrator.advance_status
+        calls = []
+
+        def advance_after_edit(status, **kwargs):
+            if not calls:
+                orchestrator.update_status(self.status_path, lambda s: s.update(problem={"text": "edited"}))
+            calls.append(1)
+            return real_advance(status, **kwargs)
+
+        with mock.patch.object(orchestrator, "advance_status", advance_after_edit), \
+                contextlib.redirect_stdout(io.StringIO()):
+            rc = orchestrator.main([
+                "--status-file", str(self.status_path), "--no-daemon",
+                "step", "--apply", "--history-file", str(self.tmp / "status_history.csv"),
+            ])
+        self.assertEqual(rc, 0)
+        self.assertEqual(len(calls), 2)
+        status = json.loads(self.status_path.read_text())
+        self.assertEqual(status["problem"], {"text": "edited"})
+        self.assertEqual(status["current_actor"], "devops_reviewer")
+        self.assertEqual(status["version"], 2)
+
+    def test_validate_rejects_bad_version(self):
+        issues = orchestrator.validate_status(_base_status(version=True))
+        self.assertIn("version must be a non-negative int", [i.message for i in issues])
+
+
+class TestStatusJournal(unittest.TestCase):
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.status_path = self.tmp / "status.json"
+        self.journal_path = orchestrator.status_journal_path(self.status_path)
+        orchestrator._atomic_write_json(self.status_path, _base_status(actor_status="completed"))
+        orchestrator.enable_status_journal(self.status_path)
+        self.snapshot = self.status_path.read_bytes()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def _read(self):
+        return orchestrator.read_status_versioned(self.status_path)[0]
+
+    def test_diff_and_apply_round_trip(self):
+        before = {"a": 1, "a/b~c": [1, 2, 3], "nested": {"x": [{"id": 1}], "gone": True}, "same": {"k": []}}
+        after = {"a": 2, "a/b~c": [1, 5], "nested": {"x": [{"id": 1, "ok": 1}, {"id": 2}]}, "same": {"k": []}, "new": None}
+        ops = orchestrator.diff_json(before, after)
+        self.assertNotIn("/same", json.dumps(ops))
+        self.assertEqual(orchestrator.apply_json_patch(json.loads(json.dumps(before)), ops), after)
+        self.assertEqual(orchestrator.diff_json(after, after), [])
+
+    def test_apply_supports_move_copy_and_test(self):
+        doc = {"a": {"b": 1}, "l": [1]}
+        ops = [
+            {"op": "copy", "from": "/a/b", "path": "/l/-"},
+            {"op": "move", "from": "/a", "path": "/c"},
+            {"op": "test", "path": "/l", "value": [1, 1]},
+        ]
+        self.assertEqual(orchestrator.apply_json_patch(doc, ops), {"l": [1, 1], "c": {"b": 1}})
+        with self.assertRaises(ValueError):
+            orchestrator.apply_json_patch(doc, [{"op": "test", "path": "/l", "value": []}])
+
+    def test_writes_append_patches_instead_of_rewriting(self):
+        orchestrator.update_status(self.status_path, lambda s: s["client_questions"].append({"id": "Q-1"}))
+        orchestrator.update_status(self.status_path, lambda s: s["client_questions"][0].update(delivery_status="delivered"))
+
+        self.assertEqual(self.status_path.read_bytes(), self.snapshot)
+        entries = [json.loads(line) for line in self.journal_path.read_text().splitlines()]
+        self.assertEqual([e["v"] for e in entries], [1, 2])
+        self.assertEqual(
+            entries[1]["ops"], [{"op": "add", "path": "/client_questions/0/delivery_status", "value": "delivered"}]
+        )
+        status = self._read()
+        self.assertEqual(status["client_questions"], [{"id": "Q-1", "delivery_status": "delivered"}])
+        self.assertEqual(status["version"], 2)
+
+    def test_compaction_past_threshold(self):
+        with mock.patch.object(orchestrator, "STATUS_JOURNAL_COMPACT_BYTES", 200):
+            for n in range(5):
+                orchestrator.update_status(self.status_path, lambda s: s["problem"].update(text="x" * 50 + str(n)))
+        self.assertLess(self.journal_path.stat().st_size, 200)
+        snapshot = json.loads(self.status_path.read_text())
+        self.assertGreaterEqual(snapshot["version"], 3)
+        self.assertEqual(self._read()["problem"]["text"], "x" * 50 + "4")
+        self.assertEqual(self._read()["version"], 5)
+
+    def test_entries_already_in_snapshot_are_skipped(self):
+        orchestrator.update_status(self.status_path, lambda s: s.update(cycle=s["cycle"] + 1))
+        stale_journal = self.journal_path.read_bytes()
+        orchestrator.compact_status_journal(self.status_path)
+        self.journal_path.write_bytes(stale_journal)  # as if compaction died before truncating
+        self.assertEqual(self._read()["cycle"], 1)
+
+    def test_torn_append_is_ignored_and_repaired(self):
+        orchestrator.update_status(self.status_path, lambda s: s.update(cycle=1))
+        with self.journal_path.open("ab") as f:
+            f.write(b'{"v":2,"ops":[{"op":"repl')
+        self.assertEqual(self._read()["cycle"], 1)
+        orchestrator.update_status(self.status_path, lambda s: s.update(cycle=7))
+        self.assertEqual(self._read()["cycle"], 7)
+        self.assertEqual(len(self.journal_path.read_text().splitlines()), 2)
+
+    def test_hand_edited_snapshot_rejects_the_journal(self):
+        orchestrator.update_status(self.status_path, lambda s: s["client_questions"].append({"id": "Q-1"}))
+        self.assertIn("base", json.loads(self.journal_path.read_text()))
+        edited = _base_status(actor_status="completed")
+        del edited["client_questions"]  # the journal's op no longer applies
+        self.status_path.write_text(json.dumps(edited), encoding="utf-8")
+
+        with contextlib.redirect_stderr(io.StringIO()) as err:
+            self.assertNotIn("client_questions", self._read())
+        self.assertIn("journal was moved", err.getvalue())
+        rejected = self.journal_path.with_name(self.journal_path.name + ".rejected")
+        self.assertEqual(json.loads(rejected.read_text())["v"], 1)
+        self.assertEqual(self.journal_path.read_bytes(), b"")
+
+        # An edit the ops would still apply to is caught by the recorded base.
+        orchestrator.update_status(self.status_path, lambda s: s.update(cycle=5))
+        edited["problem"] = {"text": "edited"}
+        self.status_path.write_text(json.dumps(edited), encoding="utf-8")
+        with contextlib.redirect_stderr(io.StringIO()):
+            self.assertEqual(orchestrator.compact_status_journal(self.status_path), (0, 0))
+        self.assertEqual(self._read()["problem"], {"text": "edited"})
+        self.assertEqual(self._read()["cycle"], edited["cycle"])
+        orchestrator.update_status(self.status_path, lambda s: s.update(cycle=6))
+        self.assertEqual(self._read()["cycle"], 6)
+
+    def test_step_cli_appends_transition_patch(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            rc = orchestrator.main([
+                "--status-file", str(self.status_path), "--no-daemon",
+                "step", "--apply", "--history-file", str(self.tmp / "status_history.csv"),
+            ])
+        self.assertEqual(rc, 0)
+        ops = json.loads(self.journal_path.read_text())["ops"]
+        self.assertEqual({op["path"] for op in ops}, {"/current_actor", "/actor_status", "/review_status", "/phase_status"})
+        with contextlib.redirect_stdout(io.StringIO()):
+            orchestrator.main(["--status-file", str(self.status_path), "journal", "disable"])
+        self.assertFalse(self.journal_path.exists())
+        self.assertEqual(json.loads(self.status_path.read_text())["current_actor"], "devops_reviewer")
+
+
+class TestBulkValidate(unittest.TestCase):
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        self.paths = []
+        for n in range(6):
+            path = self.root / f"p{n}" / "status.json"
+            path.parent.mkdir()
+            path.write_text(json.dumps(_base_status(gates={"COMMS_READY": "approved"})), encoding="utf-8")
+            self.paths.append(str(path))
+        self.cache = self.root / "validate-cache.json"
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def _outcomes(self, **kwargs):
+        results = orchestrator.validate_files(self.paths, cache_path=self.cache, **kwargs)
+        return [r.outcome for r in results]
+
+    def test_compiled_validator_matches_messages(self):
+        status = _base_status(cycle="x", version=-1, current_phase="nope")
+        del status["gates"]
+        messages = [i.message for i in orchestrator.StatusValidator().validate(status)]
+        self.assertEqual(messages[:3], ["Missing required key: gates", "cycle must be an int", "version must be a non-negative int"])
+        self.assertTrue(messages[3].startswith("current_phase 'nope' is not a canonical phase."))
+
+    def test_changed_since_skips_unchanged_files(self):
+        self.assertEqual(self._outcomes(), ["valid"] * 6)
+        Path(self.paths[2]).write_text("{", encoding="utf-8")
+        self.assertEqual(self._outcomes(), ["unchanged", "unchanged", "invalid", "unchanged", "unchanged", "unchanged"])
+        # Invalid files are never cached.
+        self.assertEqual(self._outcomes()[2], "invalid")
+
+    def test_cache_is_ignored_when_rules_change(self):
+        self._outcomes()
+        data = json.loads(self.cache.read_text())
+        data["validator"] = "stale"
+        self.cache.write_text(json.dumps(data))
+        self.assertEqual(self._outcomes(), ["valid"] * 6)
+
+    def test_strict_revalidates_files_cached_with_warnings(self):
+        orchestrator._atomic_write_json(Path(self.paths[0]), _base_status())  # COMMS_READY warning
+        self._outcomes()
+        self.assertEqual(self._outcomes(strict=True)[:2], ["invalid", "unchanged"])
+
+    def test_glob_cli_uses_process_pool(self):
+        out = io.StringIO()
+        with mock.patch.object(orchestrator, "_VALIDATE_POOL_MIN_FILES", 1), contextlib.redirect_stdout(out):
+            rc = orchestrator.main([
+                "validate", "--glob", str(self.root / "*" / "status.json"), "--workers", "2",
+                "--changed-since", str(self.cache),
+            ])
+        self.assertEqual(rc, 0)
+        self.assertEqual(out.getvalue(), "Summary: 6 workflow(s) - 6 valid\n")
+        self.assertEqual(len(json.loads(self.cache.read_text())["files"]), 6)
+
+
+class TestHistoryAppend(unittest.TestCase):
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.history_path = self.tmp / "status_history.csv"
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_header_written_once(self):
+        for _ in range(3):
+            orchestrator.append_history(self.history_path, from_status=_base_status(), to_status=_base_status())
+        lines = self.history_path.read_text(encoding="utf-8").splitlines()
+        self.assertEqual(lines[0], ",".join(orchestrator.HISTORY_HEADER))
+        self.assertEqual(len(lines), 4)
+        self.assertEqual(sum(1 for line in lines if line.startswith("timestamp,")), 1)
+
+    def test_writer_groups_rows_into_one_flush(self):
+        with orchestrator.HistoryWriter(self.history_path, max_rows=10, max_delay=60, fsync=False) as writer:
+            for _ in range(25):
+                writer.append(from_status=_base_status(), to_status=_base_status())
+            self.assertEqual(writer.flushes, 2)
+        self.assertEqual(writer.flushes, 3)
+        self.assertEqual(len(self.history_path.read_text(encoding="utf-8").splitlines()), 26)
+
+
+class TestHistoryQuery(unittest.TestCase):
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.history_path = self.tmp / "status_history.csv"
+        rows = []
+        for n in range(2500):
+            phase = orchestrator.PHASES[n % 11]
+            next_phase = orchestrator.PHASES[n % 11 + 1]
+            if n in (900, 1800):  # restarts begin cycles 1 and 2
+                phase, next_phase = "security", "bootstrap_comms"
+            ts = f"2026-01-01T{n // 3600:02d}:{n // 60 % 60:02d}:{n % 60:02d}Z"
+            rows.append([ts, phase, "completed", "someone", next_phase, "other", "in_progress"])
+        orchestrator.append_history_rows(self.history_path, rows)
+        orchestrator.update_history_index(self.history_path, every=100)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def _both(self, **filters):
+        indexed = list(orchestrator.query_history(self.history_path, **filters))
+        scanned = list(orchestrator.query_history(self.history_path, use_index=False, **filters))
+        self.assertEqual(indexed, scanned)
+        return indexed
+
+    def test_indexed_queries_match_full_scan(self):
+        since = orchestrator._parse_history_timestamp("2026-01-01T00:20:00Z")
+        until = orchestrator._parse_history_timestamp("2026-01-01T00:25:00Z")
+        self.assertEqual(len(self._both(since=since, until=until)), 301)
+        self.assertEqual(len(self._both(cycle=0)), 900)
+        self.assertEqual(len(self._both(cycle=1)), 900)
+        self.assertEqual(len(self._both(cycle=2, phase="backend")), 126)
+        self.assertTrue(all("devops" in (r[1], r[4]) for r in self._both(phase="devops", since=since)))
+
+    def test_index_follows_appends(self):
+        entries = orchestrator.load_history_index(self.history_path)
+        self.assertEqual(len(entries), 25)
+        self.assertEqual(entries[9].cycle, 0)
+        self.assertEqual(entries[10].cycle, 1)
+
+        for _ in range(100):
+            orchestrator.append_history(self.history_path, from_status=_base_status(), to_status=_base_status())
+        entries = orchestrator.load_history_index(self.history_path)
+        self.assertEqual(len(entries), 26)
+        with self.history_path.open("rb") as f:
+            f.seek(entries[-1].offset)
+            self.assertTrue(f.readline().endswith(b"bootstrap_comms,devops,in_progress\n"))
+
+
+    def test_rows_sharing_a_timestamp_across_a_checkpoint(self):
+        shared = "2026-01-02T00:00:00Z"
+        rows = [[shared if n >= 50 else "2026-01-01T23:59:00Z", "backend", "completed", "someone",
+                 "backend", "other", "in_progress"] for n in range(250)]
+        rows[200][0] = "not a timestamp"
+        path = self.tmp / "shared.csv"
+        orchestrator.append_history_rows(path, rows)
+        orchestrator.update_history_index(path, every=100)
+        epochs = [e.epoch for e in orchestrator.load_history_index(path)]
+        self.assertEqual(epochs, sorted(epochs))
+        self.assertEqual(len(epochs), 2)  # no checkpoint at the unreadable row 200
+
+        indexed = list(orchestrator.query_history(path, since=orchestrator._parse_history_timestamp(shared)))
+        self.assertEqual(indexed, list(orchestrator.query_history(path, since=epochs[1], use_index=False)))
+        self.assertEqual(len(indexed), 199)
+
+
+    def test_since_before_the_first_checkpoint_starts_at_the_top(self):
+        rows = [[f"2026-01-01T00:00:{n:02d}Z", "backend", "completed", "someone", "backend", "other", "in_progress"]
+                for n in range(30)]
+        rows[0][0] = "not a timestamp"
+        path = self.tmp / "first.csv"
+        orchestrator.append_history_rows(path, rows)
+        orchestrator.update_history_index(path, every=10)
+        self.assertEqual(orchestrator.load_history_index(path)[0].row, 10)  # no checkpoint at row 0
+
+        since = orchestrator._parse_history_timestamp(rows[1][0])
+        indexed = list(orchestrator.query_history(path, since=since))
+        self.assertEqual(indexed, list(orchestrator.query_history(path, since=since, use_index=False)))
+        self.assertEqual(len(indexed), 29)
+
+
+class TestHistoryStats(unittest.TestCase):
+    def test_phase_durations_owner_reviewer_time_and_loops(self):
+        def row(ts, from_phase, from_actor, to_phase, to_actor):
+            return [f"2026-01-01T00:{ts // 60:02d}:{ts % 60:02d}Z", from_phase, "", from_actor, to_phase, to_actor, ""]
+
+        rows = [
+            row(0, "bootstrap_comms", "devops_reviewer", "requirements", "system_analyst"),
+            row(100, "requirements", "system_analyst", "requirements", "system_analyst_reviewer"),
+            row(150, "requirements", "system_analyst_reviewer", "requirements", "system_analyst"),  # changes requested
+            row(180, "requirements", "system_analyst", "requirements", "system_analyst_reviewer"),
+            row(200, "requirements", "system_analyst_reviewer", "architecture", "architect"),
+            row(260, "architecture", "architect", "architecture", "architect_reviewer"),
+        ]
+        stats = orchestrator.compute_history_stats(rows)
+        req = stats["requirements"].to_dict()
+        self.assertEqual(req["visits"], 1)
+        self.assertEqual(req["total_seconds"], 200)
+        self.assertEqual(req["owner_seconds"], 130)
+        self.assertEqual(req["reviewer_seconds"], 70)
+        self.assertEqual(req["review_loops"], 1)
+        # architecture is still open: time is charged but no visit is recorded yet
+        self.assertEqual(stats["architecture"].durations.count, 0)
+        self.assertEqual(stats["architecture"].owner_seconds, 60)
+
+    def test_histogram_quantiles_within_bucket_error(self):
+        hist = orchestrator.StreamingHistogram()
+        for value in range(1, 10001):
+            hist.add(float(value))
+        for q in orchestrator.STATS_QUANTILES:
+            self.assertAlmostEqual(hist.quantile(q), q * 10000, delta=q * 10000 * 0.03)
+        self.assertLess(len(hist.buckets), 200)
+
+
+class TestBinaryHistory(unittest.TestCase):
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.history_path = self.tmp / "status_history.csv"
+        self.bin_path = orchestrator.binary_history_path(self.history_path)
+        orchestrator.append_history_rows(
+            self.history_path,
+            [
+                ["2026-02-05T00:40:25+01:00", "bootstrap_comms", "completed", "devops", "requirements", "system_analyst", "not_started"],
+                ["2026-02-05T22:33:00Z", "workflow", "restarted", "orchestrator", "bootstrap_comms", "devops", "in_progress"],
+                ["2026-02-06T00:20:00.250000", "done", "completed", "orchestrator", "CUSTOM_STOP", "orchestrator", "stopped"],
+            ],
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def _export(self):
+        out = io.StringIO()
+        orchestrator.history_binary_to_csv(self.bin_path, out)
+        return out.getvalue()
+
+    def test_round_trip_is_exact(self):
+        written, skipped = orchestrator.history_csv_to_binary(self.history_path, self.bin_path)
+        self.assertEqual((written, skipped), (3, 0))
+        self.assertEqual(self._export(), self.history_path.read_text(encoding="utf-8"))
+        self.assertEqual(self.bin_path.stat().st_size, 16 + 3 * 16)
+
+    def test_appends_are_mirrored_once_enabled(self):
+        orchestrator.history_csv_to_binary(self.history_path, self.bin_path)
+        orchestrator.append_history(
+            self.history_path,
+            from_status=_base_status(),
+            to_status=_base_status(current_phase="brand_new_phase"),
+        )
+        self.assertEqual(self._export(), self.history_path.read_text(encoding="utf-8"))
+        self.assertIn("brand_new_phase", orchestrator.read_binary_vocab(self.bin_path))
+
+    def test_failed_mirror_is_rebuilt_on_next_read(self):
+        orchestrator.history_csv_to_binary(self.history_path, self.bin_path)
+        vocab_path = self.bin_path.with_name(self.bin_path.name + ".vocab")
+        vocab = vocab_path.read_text(encoding="utf-8")
+        vocab_path.unlink()
+        with contextlib.redirect_stderr(io.StringIO()) as err:
+            orchestrator.append_history(self.history_path, from_status=_base_status(), to_status=_base_status())
+            vocab_path.write_text(vocab, encoding="utf-8")
+            orchestrator.append_history(self.history_path, from_status=_base_status(), to_status=_base_status())
+            self.assertEqual(self.bin_path.stat().st_size, 16 + 3 * 16)  # not appended while stale
+            self.assertEqual(self._export(), self.history_path.read_text(encoding="utf-8"))
+        self.assertIn("failed to mirror history", err.getvalue())
+        self.assertFalse(self.bin_path.with_name(self.bin_path.name + ".stale").exists())
+
+    def test_codes_are_interned_from_phases(self):
+        orchestrator.history_csv_to_binary(self.history_path, self.bin_path)
+        vocab = orchestrator.read_binary_vocab(self.bin_path)
+        record = next(orchestrator.iter_binary_history_records(self.bin_path))
+        self.assertEqual(vocab[record[2]], "bootstrap_comms")
+        self.assertEqual(record[2], orchestrator.PHASES.index("bootstrap_comms") + 1)
+
+
+class TestStepUntilBlocked(unittest.TestCase):
+    CHAIN = {"a": "b", "b": "c", "c": "d"}
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.status_path = self.tmp / "status.json"
+        self.history_path = self.tmp / "status_history.csv"
+        self.status_path.write_text(json.dumps(_base_status(current_actor="a")), encoding="utf-8")
+        # The real rules always land in a waiting state; chain a few transitions instead.
+        patcher = mock.patch.object(orchestrator, "compute_next_transition", side_effect=self._chained_transition)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _chained_transition(self, status):
+        next_actor = self.CHAIN.get(status.get("current_actor"))
+        return {"current_actor": next_actor} if next_actor else None
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def _step(self, *extra):
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out), mock.patch.object(
+            orchestrator, "_atomic_write_json", wraps=orchestrator._atomic_write_json
+        ) as write:
+            rc = orchestrator.main(
+                [
+                    "--status-file",
+                    str(self.status_path),
+                    "--no-daemon",
+                    "step",
+                    "--apply",
+                    "--history-file",
+                    str(self.history_path),
+                    *extra,
+                ]
+            )
+        return rc, out.getvalue(), write.call_count
+
+    def test_applies_all_transitions_with_one_write(self):
+        rc, out, writes = self._step("--until-blocked")
+        self.assertEqual((rc, writes), (0, 1))
+        self.assertEqual(json.loads(self.status_path.read_text())["current_actor"], "d")
+        rows = self.history_path.read_text(encoding="utf-8").splitlines()[1:]
+        self.assertEqual([r.split(",")[3] for r in rows], ["a", "b", "c"])
+        self.assertEqual(len({r.split(",")[0] for r in rows}), 1)
+
+    def test_max_steps_caps_the_chain(self):
+        rc, out, writes = self._step("--until-blocked", "--max-steps", "2")
+        self.assertEqual(json.loads(self.status_path.read_text())["current_actor"], "c")
+        self.assertIn("Stopped after --max-steps=2", out)
+
+    def test_max_steps_below_one_is_rejected(self):
+        for value in ("0", "-1"):
+            with contextlib.redirect_stderr(io.StringIO()) as err, self.assertRaises(SystemExit):
+                self._step("--until-blocked", "--max-steps", value)
+            self.assertIn("must be at least 1", err.getvalue())
+        self.assertEqual(json.loads(self.status_path.read_text())["current_actor"], "a")
+        with self.assertRaises(ValueError):
+            orchestrator.advance_status(_base_status(), max_steps=0)
+
+    def test_default_is_single_step(self):
+        self._step()
+        self.assertEqual(json.loads(self.status_path.read_text())["current_actor"], "b")
+
+
+class TestOrchestratorBatch(unittest.TestCase):
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        for name, status in {
+            "ready": _base_status(actor_status="completed"),
+            "waiting": _base_status(actor_status="in_progress"),
+            "done": _base_status(current_phase="done", current_actor="orchestrator", phase_status="completed"),
+        }.items():
+            (self.root / name).mkdir()
+            (self.root / name / "status.json").write_text(json.dumps(status), encoding="utf-8")
+        (self.root / "broken" / "nested").mkdir(parents=True)
+        (self.root / "broken" / "nested" / "status.json").write_text("{", encoding="utf-8")
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def test_step_all_reports_and_applies(self):
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            rc = orchestrator.main(["step", "--all", str(self.root), "--apply"])
+        report = out.getvalue()
+
+        self.assertEqual(rc, 1)  # one invalid workflow
+        self.assertIn("advanced (1):\n  ready/status.json: bootstrap_comms:devops -> bootstrap_comms:devops_reviewer", report)
+        self.assertIn("blocked (1):\n  waiting/status.json", report)
+        self.assertIn("done (1):", report)
+        self.assertIn("invalid (1):\n  broken/nested/status.json: failed to load", report)
+
+        ready = json.loads((self.root / "ready" / "status.json").read_text())
+        self.assertEqual(ready["current_actor"], "devops_reviewer")
+        self.assertTrue((self.root / "ready" / "status_history.csv").exists())
+        self.assertFalse((self.root / "waiting" / "status_history.csv").exists())
+
+    def test_step_all_dry_run_writes_nothing(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            orchestrator.main(["step", "--all", str(self.root)])
+        ready = json.loads((self.root / "ready" / "status.json").read_text())
+        self.assertEqual(ready["current_actor"], "devops")
+
+
 if __name__ == "__main__":
     unittest.main()
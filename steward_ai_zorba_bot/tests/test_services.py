@@ -61,3 +61,797 @@ def test_question_poller_import():
     assert hasattr(QuestionPoller, 'format_question_message')
     assert hasattr(QuestionPoller, 'poll_once')
     assert hasattr(QuestionPoller, 'process_answer')
+
+
+def _store_document():
+    return {
+        "problem": {"text": "demo"},
+        "current_phase": "requirements",
+        "client_action_required": True,
+        "client_questions": [
+            {"id": "Q-1", "question": "Colour?", "delivery_status": "pending"},
+            {"id": "Q-2", "question": "Name?", "delivery_status": "delivered"},
+        ],
+        "client_answers": [],
+        "ack_requests": [{"id": "ACK-1", "status": "pending"}],
+        "timestamps": {"updated_at": "2026-01-01T00:00:00Z"},
+    }
+
+
+async def _fixed_suggestions(text, context):
+    return ["a", "b", "c"]
+
+
+def _stores(tmp_path):
+    from services.status_store import JsonStatusStore, SqliteStatusStore
+
+    json_store = JsonStatusStore(tmp_path / "status.json")
+    json_store.path.write_text(json.dumps(_store_document()))
+    sqlite_store = SqliteStatusStore(tmp_path / "status.db")
+    sqlite_store.load_document(_store_document())
+    return json_store, sqlite_store
+
+
+def test_sqlite_store_export_is_byte_compatible(tmp_path):
+    """SQLite backend renders the same status.json bytes as the JSON backend"""
+    import orchestrator
+
+    _json_store, sqlite_store = _stores(tmp_path)
+    sqlite_store.export_json(tmp_path / "exported.json")
+    assert (tmp_path / "exported.json").read_text() == orchestrator.render_status_json(_store_document())
+
+
+def test_store_backends_agree_on_updates(tmp_path):
+    """Row-level SQLite updates produce the same document as status.json updates"""
+    import orchestrator
+
+    stores = _stores(tmp_path)
+    for store in stores:
+        assert [q["id"] for q in store.get_questions("pending")] == ["Q-1"]
+        assert store.mark_question_delivered("Q-1", "2026-01-02T00:00:00Z")
+        assert not store.mark_question_delivered("Q-404", "2026-01-02T00:00:00Z")
+        for qid in ("Q-1", "Q-2"):
+            store.record_answer(qid, {"question_id": qid, "answer": "blue", "source": "test"})
+        assert store.get("client_action_required") is False
+        assert store.get_questions("delivered") == []
+
+    json_doc, sqlite_doc = (store.read() for store in stores)
+    assert sqlite_doc["version"] == 3
+    assert orchestrator.render_status_json(sqlite_doc) == orchestrator.render_status_json(json_doc)
+
+
+def test_sqlite_store_question_lookup_uses_index(tmp_path):
+    """Pending-question lookups hit the delivery_status index instead of scanning"""
+    _json_store, sqlite_store = _stores(tmp_path)
+    plan = sqlite_store._connect().execute(
+        "EXPLAIN QUERY PLAN SELECT data FROM client_questions WHERE delivery_status = ? ORDER BY position",
+        ("pending",),
+    ).fetchall()
+    assert any("client_questions_delivery" in row[-1] for row in plan)
+
+
+def test_json_store_parse_cache(tmp_path):
+    """Unchanged status.json is served from the parse cache; callers get private copies"""
+    from services.status_store import JsonStatusStore, PARSE_CACHE_STATS
+
+    json_store, _sqlite_store = _stores(tmp_path)
+    hits, misses = PARSE_CACHE_STATS.hits, PARSE_CACHE_STATS.misses
+
+    pending = json_store.get_questions("pending")
+    pending[0]["_suggestions"] = ["mutated by caller"]
+    json_store.read()["client_questions"].clear()
+    assert json_store.get_questions("pending") == [
+        {"id": "Q-1", "question": "Colour?", "delivery_status": "pending"}
+    ]
+    assert PARSE_CACHE_STATS.misses - misses == 1
+    assert PARSE_CACHE_STATS.hits - hits == 2
+
+    # Own writes invalidate; other stores on the same file share the cache.
+    json_store.mark_question_delivered("Q-1", "2026-01-02T00:00:00Z")
+    assert JsonStatusStore(json_store.path).get_questions("pending") == []
+    assert PARSE_CACHE_STATS.misses - misses == 2  # the read after the write re-parses
+
+    # External writes change the signature.
+    status = json.loads(json_store.path.read_text())
+    status["current_phase"] = "architecture"
+    json_store.path.write_text(json.dumps(status, indent=4))
+    assert json_store.get("current_phase") == "architecture"
+
+
+def test_status_tx_commits_helpers_in_one_write(tmp_path):
+    """Helpers called inside status_tx() share its document and its single write"""
+    from services import status_handler
+
+    json_store, _sqlite_store = _stores(tmp_path)
+    status_handler.set_store(json_store)
+    try:
+        with status_handler.status_tx() as status:
+            status_handler.mark_question_delivered("Q-1")
+            assert status_handler.get_pending_questions() == []
+            status_handler.write_answer("Q-1", "blue")
+            status_handler.write_answer("Q-2", "Zorba")
+            assert json_store.read().get("version") is None  # nothing written yet
+        assert status["client_action_required"] is False
+
+        doc = json_store.read()
+        assert doc["version"] == 1
+        assert [a["question_id"] for a in doc["client_answers"]] == ["Q-1", "Q-2"]
+        assert status_handler.is_client_action_required() is False
+
+        # Unchanged documents and failed blocks write nothing.
+        with status_handler.status_tx():
+            pass
+        try:
+            with status_handler.status_tx() as status:
+                status["current_phase"] = "discarded"
+                raise RuntimeError("abort")
+        except RuntimeError:
+            pass
+        assert json_store.read()["version"] == 1
+        assert status_handler.get_current_phase() == "requirements"
+    finally:
+        status_handler.set_store(None)
+
+
+def test_helpers_use_store_row_operations_outside_tx(tmp_path):
+    """Outside status_tx() the helpers go straight to the store, not through update()"""
+    from services import status_handler
+
+    _json_store, sqlite_store = _stores(tmp_path)
+
+    def no_update(mutate):
+        raise AssertionError("update() called outside a transaction")
+
+    sqlite_store.update = no_update
+    status_handler.set_store(sqlite_store)
+    try:
+        status_handler.mark_question_delivered("Q-1")
+        assert sqlite_store.get_question("Q-1")["delivery_status"] == "delivered"
+        status_handler.write_answer("Q-1", "blue")
+        status_handler.write_answer("Q-2", "Zorba")
+        doc = sqlite_store.read()
+        assert [q["delivery_status"] for q in doc["client_questions"]] == ["answered", "answered"]
+        assert [a["question_id"] for a in doc["client_answers"]] == ["Q-1", "Q-2"]
+        assert doc["client_action_required"] is False
+    finally:
+        status_handler.set_store(None)
+
+
+def test_status_tx_replays_onto_concurrent_writes(tmp_path):
+    """A transaction is replayed onto newer documents unless its questions moved"""
+    import pytest
+    from services import status_handler
+    from services.status_store import StatusConflict
+
+    json_store, _sqlite_store = _stores(tmp_path)
+    status_handler.set_store(json_store)
+    try:
+        with status_handler.status_tx() as status:
+            status["client_questions"][1]["delivery_status"] = "answered"
+            json_store.update(lambda other: other.update(current_phase="architecture"))
+        doc = json_store.read()
+        assert doc["current_phase"] == "architecture"
+        assert doc["client_questions"][1]["delivery_status"] == "answered"
+
+        with pytest.raises(StatusConflict):
+            with status_handler.status_tx() as status:
+                status["client_questions"][0]["delivery_status"] = "delivered"
+                json_store.update(lambda other: other["client_questions"].insert(0, {"id": "Q-0"}))
+        assert json_store.get_questions("delivered") == []
+    finally:
+        status_handler.set_store(None)
+
+
+def test_status_tx_group_commit(tmp_path):
+    """Concurrent group-commit transactions are coalesced into fewer writes"""
+    import threading
+    from services import status_handler
+    from services.status_store import GroupCommitter
+
+    json_store, _sqlite_store = _stores(tmp_path)
+    status_handler.set_store(json_store)
+    status_handler._committer = GroupCommitter(json_store, window=0.05)
+    barrier = threading.Barrier(8)
+
+    def worker(n):
+        barrier.wait()
+        with status_handler.status_tx(group_commit=True) as status:
+            status.setdefault("timestamps", {})[f"worker_{n}"] = n
+
+    try:
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        doc = json_store.read()
+        assert all(doc["timestamps"][f"worker_{n}"] == n for n in range(8))
+        assert doc["version"] == status_handler._committer.commits < 8
+    finally:
+        status_handler.set_store(None)
+
+
+def test_status_index_tracks_mutations():
+    """StatusIndex lookups and open counters stay in step with the document"""
+    from services.status_index import StatusIndex
+    from services.status_store import apply_answer, apply_delivered
+
+    status = _store_document()
+    index = StatusIndex(status)
+    assert index.question("Q-2")["question"] == "Name?"
+    assert index.ids("pending") == ["Q-1"] and index.open_count == 2
+
+    assert apply_delivered(status, "Q-1", "2026-01-02T00:00:00Z", index)
+    assert not apply_delivered(status, "Q-404", "2026-01-02T00:00:00Z", index)
+    assert index.ids("delivered") == ["Q-1", "Q-2"] and index.count("pending") == 0
+
+    # Direct edits that grow or reorder the list are picked up.
+    status["client_questions"].insert(0, {"id": "Q-0", "delivery_status": "pending"})
+    assert index.question("Q-2") is status["client_questions"][2]
+    assert index.open_count == 3
+
+    for qid in ("Q-0", "Q-1", "Q-2"):
+        apply_answer(status, qid, {"question_id": qid, "answer": "ok"}, index)
+        assert status["client_action_required"] is (qid != "Q-2")
+    assert index.answers("Q-1") == [{"question_id": "Q-1", "answer": "ok"}]
+    assert index.count("answered") == 3 and index.open_count == 0
+    assert [a["question_id"] for a in status["client_answers"]] == ["Q-0", "Q-1", "Q-2"]
+
+
+def test_apply_helpers_scan_without_an_index(tmp_path, monkeypatch):
+    """Without an index the apply_* helpers scan and agree with the indexed path; a
+    transaction builds its StatusIndex only once it does a second lookup"""
+    from services import status_handler
+    from services.status_index import StatusIndex
+    from services.status_store import apply_answer, apply_delivered
+
+    scanned, indexed = _store_document(), _store_document()
+    index = StatusIndex(indexed)
+    for status, idx in ((scanned, None), (indexed, index)):
+        assert apply_delivered(status, "Q-1", "2026-01-02T00:00:00Z", idx)
+        assert not apply_delivered(status, "Q-404", "2026-01-02T00:00:00Z", idx)
+        apply_answer(status, "Q-1", {"question_id": "Q-1", "answer": "blue"}, idx)
+        assert status["client_action_required"] is True
+        apply_answer(status, "Q-2", {"question_id": "Q-2", "answer": "Zorba"}, idx)
+    assert scanned == indexed and scanned["client_action_required"] is False
+
+    json_store, _sqlite_store = _stores(tmp_path)
+    built = []
+
+    class CountingIndex(StatusIndex):
+        def rebuild(self):
+            built.append(1)
+            super().rebuild()
+
+    monkeypatch.setattr(status_handler, "StatusIndex", CountingIndex)
+    status_handler.set_store(json_store)
+    try:
+        with status_handler.status_tx():
+            status_handler.mark_question_delivered("Q-1")
+        assert built == []
+        with status_handler.status_tx():
+            status_handler.write_answer("Q-1", "blue")
+            assert status_handler.get_question("Q-1")["delivery_status"] == "answered"
+            assert [a["answer"] for a in status_handler.get_answers("Q-1")] == ["blue"]
+        assert built == [1]
+    finally:
+        status_handler.set_store(None)
+
+
+def test_archive_answered_questions(tmp_path):
+    """Answered questions move to the archive and stay reachable by id"""
+    from services import status_handler
+    from services.status_archive import StatusArchive
+
+    json_store, _sqlite_store = _stores(tmp_path)
+    status_handler.set_store(json_store)
+    try:
+        for n, compress in enumerate((False, True)):
+            status_handler.set_archive(StatusArchive(tmp_path / f"archive{n}", compress=compress))
+            json_store.path.write_text(json.dumps(_store_document()))
+            status_handler.write_answer("Q-2", "Zorba")
+            json_store.update(lambda s: s["client_answers"].append({"question_id": "Q-1", "answer": "early"}))
+
+            assert status_handler.archive_answered_questions(compress) == 1
+            assert status_handler.archive_answered_questions(compress) == 0
+            doc = json_store.read()
+            assert [q["id"] for q in doc["client_questions"]] == ["Q-1"]
+            assert [a["question_id"] for a in doc["client_answers"]] == ["Q-1"]
+
+            assert status_handler.get_question("Q-2")["delivery_status"] == "answered"
+            assert [a["answer"] for a in status_handler.get_answers("Q-2")] == ["Zorba"]
+            assert status_handler.get_question("Q-1")["delivery_status"] == "pending"
+            assert status_handler.get_question("Q-404") is None
+
+            # Another process sees the archive; a torn batch is never indexed.
+            other = StatusArchive(tmp_path / f"archive{n}")
+            segment = next(p for p in other.directory.iterdir() if p.name.startswith("segment-"))
+            assert segment.name.endswith(".gz") is compress
+            with open(segment, "ab") as f:
+                f.write(b'{"question": {"id": "Q-9"')
+            other.append([{"question": {"id": "Q-3"}, "answers": []}])
+            assert other.question("Q-3") == {"id": "Q-3"}
+            assert "Q-9" not in other and other.answers("Q-2")[0]["answer"] == "Zorba"
+    finally:
+        status_handler.set_store(None)
+        status_handler.set_archive(None)
+
+
+def test_status_model_round_trip():
+    """StatusModel decodes big sections lazily and preserves unknown keys and order"""
+    import orchestrator
+    from services.status_model import Changesets, Question, StatusModel
+
+    status = _store_document()
+    status["client_questions"][0]["_suggestions"] = ["red", "blue"]
+    status["changesets"] = {"active": {"id": "CS-1", "owner": "backend"}, "queue": [], "policy": {}}
+    status["custom"] = {"kept": True}
+    text = orchestrator.render_status_json(status)
+
+    model = StatusModel.loads(text)
+    assert model.current_phase == "requirements" and isinstance(model.changesets, Changesets)
+    assert model.changesets.active.id == "CS-1" and model.changesets.active.extra == {"owner": "backend"}
+    assert not model.is_loaded("client_questions")
+    assert model.dumps() == text
+
+    question = model.client_questions[0]
+    assert isinstance(question, Question) and question.extra == {"_suggestions": ["red", "blue"]}
+    question.delivery_status = "delivered"
+    question.delivered_at = "2026-01-02T00:00:00Z"
+    model.client_questions.append(Question(id="Q-3", question="Size?", delivery_status="pending"))
+    model.current_phase = "architecture"
+
+    status["client_questions"][0].update(delivery_status="delivered", delivered_at="2026-01-02T00:00:00Z")
+    status["client_questions"].append({"id": "Q-3", "question": "Size?", "delivery_status": "pending"})
+    status["current_phase"] = "architecture"
+    assert model.to_dict() == status
+    assert list(model.to_dict()) == list(status)
+    assert model.dumps() == orchestrator.render_status_json(status)
+
+    # Any other layout falls back to a full parse.
+    assert StatusModel.loads(json.dumps(status)).dumps() == orchestrator.render_status_json(status)
+
+
+def test_status_diff_and_subscriptions():
+    """Id-matched structural diff; subscribers only hear about matching paths"""
+    from services.status_diff import ADDED, CHANGED, REMOVED, StatusWatcher, diff_status
+
+    before = _store_document()
+    before["gates"] = {"COMMS_READY": "pending", "REQ_CLIENT_ACK": "pending"}
+    after = json.loads(json.dumps(before))
+    after["client_questions"].insert(0, {"id": "Q-0", "question": "Budget?", "delivery_status": "pending"})
+    after["client_questions"][2]["delivery_status"] = "answered"
+    after["gates"]["COMMS_READY"] = "pass"
+    after["current_phase"] = "architecture"
+
+    assert [(c.key, c.kind) for c in diff_status(before, after)] == [
+        ("current_phase", CHANGED),
+        ("client_questions[Q-2].delivery_status", CHANGED),
+        ("client_questions[Q-0]", ADDED),
+        ("gates.COMMS_READY", CHANGED),
+    ]
+    assert diff_status(before, before) == []
+
+    documents = [before, before, after]
+    watcher = StatusWatcher(lambda: documents.pop(0))
+    delivery, gates = [], []
+    watcher.subscribe("client_questions[*].delivery_status", lambda c: delivery.append((c.item_id, c.kind, c.new)))
+    unsubscribe = watcher.subscribe("gates.*", lambda c: gates.append((c.key, c.new)))
+
+    watcher.poll()  # first poll: everything is new
+    assert delivery == [("Q-1", ADDED, "pending"), ("Q-2", ADDED, "delivered")]
+    assert watcher.poll() == [] and len(delivery) == 2  # same object: nothing to diff
+    del delivery[:], gates[:]
+    unsubscribe()
+    watcher.poll()
+    assert delivery == [("Q-2", CHANGED, "answered"), ("Q-0", ADDED, "pending")]
+    assert gates == []
+
+    del delivery[:]
+    assert watcher.publish(diff_status(after, {"client_questions": []})) == 3
+    assert delivery == [("Q-0", REMOVED, None), ("Q-1", REMOVED, None), ("Q-2", REMOVED, None)]
+
+
+def test_question_poller_follows_changes(tmp_path, monkeypatch):
+    """The poller delivers every pending question it learns about from status changes"""
+    import asyncio
+    from apps.telegram import question_poller
+    from services import status_handler
+
+    json_store, _sqlite_store = _stores(tmp_path)
+    status_handler.set_store(json_store)
+    monkeypatch.setattr(question_poller, "get_suggestions_async", _fixed_suggestions)
+    sent = []
+
+    async def send(user_id, text):
+        sent.append((user_id, text))
+        return 100 + len(sent)
+
+    try:
+        poller = question_poller.QuestionPoller(send, [42])
+        assert asyncio.run(poller.poll_once()) is True
+        assert poller.open_questions() == ["Q-2", "Q-1"] and "Colour?" in sent[0][1]
+        assert asyncio.run(poller.poll_once()) is False
+
+        json_store.update(lambda s: s["client_questions"].append(
+            {"id": "Q-3", "question": "Size?", "delivery_status": "pending"}))
+        assert asyncio.run(poller.poll_once()) is True
+        assert poller.open_questions() == ["Q-2", "Q-1", "Q-3"]
+        assert [q["id"] for q in json_store.get_questions("delivered")] == ["Q-1", "Q-2", "Q-3"]
+    finally:
+        status_handler.set_store(None)
+
+
+def test_question_poller_without_unique_ids(tmp_path, monkeypatch):
+    """Questions with no id, or a shared one, are still delivered (once each)"""
+    import asyncio
+    from apps.telegram import question_poller
+    from services import status_handler
+
+    monkeypatch.setattr(question_poller, "get_suggestions_async", _fixed_suggestions)
+    cases = ({"question": "Budget?", "delivery_status": "pending"},  # no id
+             {"id": "Q-1", "question": "Colour again?", "delivery_status": "pending"})  # Q-1 twice
+    for n, extra in enumerate(cases):
+        (tmp_path / str(n)).mkdir()
+        json_store, _sqlite_store = _stores(tmp_path / str(n))
+        json_store.update(lambda s, extra=extra: s["client_questions"].append(extra))
+        status_handler.set_store(json_store)
+        sent = []
+
+        async def send(user_id, text):
+            sent.append(text)
+            return len(sent)
+
+        try:
+            poller = question_poller.QuestionPoller(send, [42])
+            assert asyncio.run(poller.poll_once()) is True
+            assert sorted(text.split("\n\n")[1] for text in sent) == sorted(["Colour?", extra["question"]])
+            assert asyncio.run(poller.poll_once()) is False  # not sent again
+
+            json_store.update(lambda s: s["client_questions"].append(
+                {"id": "Q-3", "question": "Size?", "delivery_status": "pending"}))
+            assert asyncio.run(poller.poll_once()) is True
+            assert len(sent) == 3 and "Size?" in sent[-1]
+        finally:
+            status_handler.set_store(None)
+
+
+def test_status_diff_partial_ids():
+    """Items with a unique id are matched by id even when others have none or share one"""
+    from services.status_diff import ADDED, CHANGED, diff_status
+
+    before = {"client_questions": [
+        {"id": "Q-1", "delivery_status": "pending"},
+        {"question": "no id", "delivery_status": "pending"},
+        {"id": "Q-2", "delivery_status": "pending"},
+        {"id": "Q-2", "delivery_status": "pending"},
+    ]}
+    after = {"client_questions": [
+        {"id": "Q-0", "delivery_status": "pending"},
+        {"id": "Q-1", "delivery_status": "delivered"},
+        {"question": "no id", "delivery_status": "delivered"},
+        {"id": "Q-2", "delivery_status": "pending"},
+        {"id": "Q-2", "delivery_status": "delivered"},
+    ]}
+    assert [(c.key, c.kind, c.item_id) for c in diff_status(before, after)] == [
+        ("client_questions[Q-1].delivery_status", CHANGED, "Q-1"),
+        ("client_questions[Q-0]", ADDED, "Q-0"),
+        ("client_questions[2].delivery_status", CHANGED, None),
+        ("client_questions[4].delivery_status", CHANGED, None),
+    ]
+
+
+def test_question_poller_routes_answers(tmp_path, monkeypatch):
+    """Answers go to the question replied to, then a #Q-id prefix, then the only open one"""
+    import asyncio
+    from apps.telegram import question_poller
+    from services import status_handler
+
+    json_store, _sqlite_store = _stores(tmp_path)
+    status_handler.set_store(json_store)
+    monkeypatch.setattr(question_poller, "get_suggestions_async", _fixed_suggestions)
+    message_ids = iter(range(500, 600))
+
+    async def send(user_id, text):
+        return next(message_ids)
+
+    try:
+        json_store.update(lambda s: s["client_questions"].append(
+            {"id": "Q-3", "question": "Size?", "delivery_status": "pending"}))
+        poller = question_poller.QuestionPoller(send, [42, 43])
+        asyncio.run(poller.poll_once())
+        # Q-1 went out as messages 500 (user 42) and 501 (user 43), Q-3 as 502 and 503
+        assert poller.open_questions() == ["Q-2", "Q-1", "Q-3"]
+
+        assert poller.process_answer("blue") is None  # ambiguous
+        assert poller.process_answer("large", user_id=43, reply_to_id=503) == "Q-3"
+        assert poller.process_answer("large", user_id=42, reply_to_id=503) is None  # 503 is not in 42's chat
+        assert poller.process_answer("#Q-1: blue", user_id=42) == "Q-1"
+        assert poller.process_answer("#Q-1 red", user_id=43, reply_to_id=501) is None  # already answered
+        assert poller.process_answer("whenever") == "Q-2"
+        assert poller.open_questions() == []
+
+        answers = {a["question_id"]: a["answer"] for a in json_store.get("client_answers", [])}
+        assert answers["Q-1"] == "blue" and answers["Q-3"] == "large" and answers["Q-2"] == "whenever"
+    finally:
+        status_handler.set_store(None)
+
+
+def test_question_poller_fan_out(tmp_path, monkeypatch):
+    """Sends run concurrently with retries; one unreachable user does not block delivery"""
+    import asyncio
+    from apps.telegram import question_poller
+    from services import status_handler
+
+    json_store, _sqlite_store = _stores(tmp_path)
+    status_handler.set_store(json_store)
+    monkeypatch.setattr(question_poller, "get_suggestions_async", _fixed_suggestions)
+    calls = {}
+    in_flight = [0, 0]  # current, peak
+
+    async def send(user_id, text):
+        calls[user_id] = calls.get(user_id, 0) + 1
+        in_flight[0] += 1
+        in_flight[1] = max(in_flight)
+        await asyncio.sleep(0.01)
+        in_flight[0] -= 1
+        if user_id == 1:
+            raise RuntimeError("chat not found")
+        if user_id == 2 and calls[user_id] == 1:
+            return None  # transient failure
+        return user_id * 100 + calls[user_id]
+
+    try:
+        poller = question_poller.QuestionPoller(send, [1, 2, 3, 4])
+        poller.max_concurrent_sends = 2
+        poller.retry_delay = 0
+        poller.delivery_quorum = 3
+        assert asyncio.run(poller.poll_once()) is True
+        assert in_flight[1] == 2
+        assert calls == {1: 3, 2: 2, 3: 1, 4: 1}
+        results = {r.user_id: r for r in poller.last_delivery}
+        assert not results[1].ok and results[1].error == "chat not found"
+        assert results[2].ok and results[2].attempts == 2
+        stats = poller.metrics()["recipients"]
+        assert stats[1]["failed"] == 1 and stats[2]["retries"] == 1 and stats[3]["sent"] == 1
+        assert json_store.get_question("Q-1")["delivery_status"] == "delivered"
+
+        # Below quorum: stays pending, and the retry only goes to users not reached yet
+        json_store.update(lambda s: s["client_questions"].append(
+            {"id": "Q-3", "question": "Size?", "delivery_status": "pending"}))
+        poller.delivery_quorum = 4
+        calls.clear()
+        assert asyncio.run(poller.poll_once()) is False
+        assert json_store.get_question("Q-3")["delivery_status"] == "pending"
+        calls.clear()
+        asyncio.run(poller.poll_once())
+        assert calls == {1: 3}
+    finally:
+        status_handler.set_store(None)
+
+
+def test_question_poller_prefetches_suggestions(tmp_path, monkeypatch):
+    """Suggestions for a burst of questions are generated in parallel while the loop runs"""
+    import asyncio
+    import time
+    from apps.telegram import question_poller
+    from services import status_handler
+
+    json_store, _sqlite_store = _stores(tmp_path)
+    json_store.update(lambda s: s["client_questions"].extend(
+        {"id": f"Q-{n}", "question": f"Burst {n}?", "delivery_status": "pending"} for n in range(3, 6)))
+    status_handler.set_store(json_store)
+
+    async def slow_suggestions(text, context):
+        await asyncio.sleep(0.1)  # a GPT round trip
+        return [text, "b", "c"]
+
+    monkeypatch.setattr(question_poller, "get_suggestions_async", slow_suggestions)
+    sent = []
+
+    async def send(user_id, text):
+        sent.append(text)
+        return len(sent)
+
+    async def poll(poller):
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticker = asyncio.create_task(tick())
+        await poller.poll_once()
+        ticker.cancel()
+        return ticks
+
+    try:
+        poller = question_poller.QuestionPoller(send, [42])
+        poller.prefetcher.workers = 4
+        started = time.perf_counter()
+        ticks = asyncio.run(poll(poller))
+        elapsed = time.perf_counter() - started
+        assert len(sent) == 4 and "Burst 5?" in sent[-1]
+        assert elapsed < 0.3  # 4 x 0.1 s in series otherwise
+        assert ticks >= 5  # the loop kept running during the GPT calls
+        prefetch = poller.metrics()["prefetch"]
+        assert prefetch["hits"] + prefetch["joined"] == 4 and prefetch["misses"] == 0
+    finally:
+        status_handler.set_store(None)
+
+
+def _completion_server(delay, content):
+    """Local stand-in for the OpenAI API: answers every chat completion with `content`
+    after `delay` seconds; returns the server and a list that counts requests"""
+    import threading
+    import time
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    requests = []
+
+    class Completions(BaseHTTPRequestHandler):
+        def do_POST(self):
+            requests.append(json.loads(self.rfile.read(int(self.headers["Content-Length"]))))
+            time.sleep(delay)
+            body = json.dumps({
+                "id": "cmpl-1", "object": "chat.completion", "created": 0, "model": "gpt-4o",
+                "choices": [{"index": 0, "finish_reason": "stop",
+                             "message": {"role": "assistant", "content": content}}],
+            }).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Completions)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, requests
+
+
+def _use_completion_server(monkeypatch, server, cache=None):
+    from services import openai_client
+
+    monkeypatch.setenv("AI_API_KEY", "test-key")
+    monkeypatch.setenv("OPENAI_BASE_URL", f"http://127.0.0.1:{server.server_address[1]}/v1")
+    monkeypatch.setattr(openai_client, "_async_client", None)
+    monkeypatch.setattr(openai_client, "_suggestion_cache", cache)
+    monkeypatch.setattr(openai_client, "_suggestion_cache_loaded", True)
+
+
+def test_async_openai_keeps_loop_responsive(monkeypatch):
+    """A slow completion blocks the event loop through the sync client, not the async one"""
+    import asyncio
+    from services import openai_client
+
+    server, _requests = _completion_server(0.3, "1. Red\n2. Blue\n3. Green")
+    _use_completion_server(monkeypatch, server)
+
+    async def ticks_during(call):
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticker = asyncio.create_task(tick())
+        await asyncio.sleep(0)
+        result = await call()
+        ticker.cancel()
+        return result, ticks
+
+    async def blocking():
+        return openai_client.get_suggestions("Colour?")
+
+    try:
+        result, ticks = asyncio.run(ticks_during(lambda: openai_client.get_suggestions_async("Colour?")))
+        assert result == ["Red", "Blue", "Green"]
+        assert ticks >= 10  # ~30 in 0.3 s
+        result, ticks = asyncio.run(ticks_during(blocking))
+        assert result == ["Red", "Blue", "Green"]
+        assert ticks <= 1
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_suggestion_cache_lru_and_ttl(tmp_path):
+    """Entries match on the normalized prompt, expire after the TTL and are evicted LRU"""
+    from services.suggestion_cache import SuggestionCache
+
+    now = [1000.0]
+    cache = SuggestionCache(tmp_path / "cache.db", max_entries=2, ttl=60, clock=lambda: now[0])
+    cache.put("Which  colour?", "UI", 3, "gpt-4o", ["red", "blue", "green"])
+    assert cache.get("which colour?", " ui ", 3, "gpt-4o") == ["red", "blue", "green"]
+    assert cache.get("Which colour?", "UI", 2, "gpt-4o") is None
+    assert cache.get("Which colour?", "UI", 3, "gpt-4o-mini") is None
+    assert cache.get("Which colour?", "API", 3, "gpt-4o") is None
+
+    now[0] += 10
+    cache.put("Name?", "", 3, "gpt-4o", ["a"])
+    now[0] += 10
+    cache.get("Which colour?", "UI", 3, "gpt-4o")  # now more recently used than Name?
+    cache.put("Size?", "", 3, "gpt-4o", ["b"])
+    assert cache.get("Name?", "", 3, "gpt-4o") is None  # evicted
+    assert cache.get("Size?", "", 3, "gpt-4o") == ["b"]
+
+    now[0] += 45  # Which colour? was generated 65 s ago
+    assert cache.get("Which colour?", "UI", 3, "gpt-4o") is None
+    cache.close()
+
+    reopened = SuggestionCache(tmp_path / "cache.db", clock=lambda: now[0])
+    assert reopened.get("Size?", "", 3, "gpt-4o") == ["b"]  # persisted
+    assert reopened.stats() == {"hits": 1, "misses": 0, "hit_rate": 1.0, "expired": 0,
+                                "evicted": 0, "entries": 1}
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["expired"], stats["evicted"]) == (3, 5, 1, 1)
+
+
+def test_suggestion_cache_hits_do_not_write(tmp_path):
+    """A lookup succeeds while another connection holds the write lock; its last-used
+    time is written with the next put() or flush()"""
+    import sqlite3
+    from services.suggestion_cache import SuggestionCache
+
+    now = [1000.0]
+    cache = SuggestionCache(tmp_path / "cache.db", max_entries=2, clock=lambda: now[0])
+    cache.put("Name?", "", 3, "gpt-4o", ["a"])
+    writer = sqlite3.connect(str(tmp_path / "cache.db"), isolation_level=None)
+    writer.execute("BEGIN IMMEDIATE")
+    now[0] += 10
+    assert cache.get("Name?", "", 3, "gpt-4o") == ["a"]
+    writer.execute("ROLLBACK")
+    used_at = "SELECT used_at FROM suggestions"
+    assert writer.execute(used_at).fetchone()[0] == 1000.0
+    cache.flush()
+    assert writer.execute(used_at).fetchone()[0] == 1010.0
+    writer.close()
+    cache.close()
+
+
+def test_suggestions_served_from_cache(tmp_path, monkeypatch):
+    """A repeated question is answered from the cache without an API call"""
+    import asyncio
+    from services import openai_client
+    from services.suggestion_cache import SuggestionCache
+
+    server, requests = _completion_server(0, "1. Red\n2. Blue\n3. Green")
+    _use_completion_server(monkeypatch, server, SuggestionCache(tmp_path / "cache.db"))
+    try:
+        assert asyncio.run(openai_client.get_suggestions_async("Which colour?", "UI")) == ["Red", "Blue", "Green"]
+        assert asyncio.run(openai_client.get_suggestions_async("which   colour? ", "UI")) == ["Red", "Blue", "Green"]
+        assert openai_client.get_suggestions("Which colour?", "UI") == ["Red", "Blue", "Green"]
+        assert len(requests) == 1
+        assert openai_client.suggestion_cache_stats()["hit_rate"] == 2 / 3
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_file_watcher_wakes_on_replace(tmp_path):
+    """Both watcher backends notice status.json being atomically replaced"""
+    import asyncio
+    import threading
+    import orchestrator
+    from services.file_watcher import FileWatcher
+
+    path = tmp_path / "status.json"
+    orchestrator._atomic_write_json(path, {"n": 0})
+    for use_inotify in (True, False):
+        with FileWatcher([path, orchestrator.status_journal_path(path)], use_inotify=use_inotify) as watcher:
+            assert not watcher.wait(0.05)
+            (tmp_path / "unrelated.txt").write_text("x")
+            assert not watcher.changed()
+
+            timer = threading.Timer(0.05, orchestrator.update_status, (path, lambda s: s.update(n=1)))
+            timer.start()
+            assert asyncio.run(watcher.wait_async(5)) is True
+            timer.join()
+            assert not watcher.changed()